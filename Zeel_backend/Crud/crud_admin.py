@@ -11,7 +11,6 @@ def create_user(db: Session, username: str, password: str):
     new_user = User(username=username, password=hash_password(password), role="user")
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     return new_user
 
 
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+from Models.archive import ItemArchive, TransactionArchive
+from Models.items import Item, ItemTrackStatus
+from Models.transaction import Transaction
+from Schemas.archive import ArchivedItemResponse, ArchivedTransactionResponse
+from Services.tagged_cache import invalidate_tags
+from Utils.serialization import response_columns
+
+# ---------- ARCHIVE ----------
+
+
+def _cutoff(days: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def _move_batch(db: Session, source, archive, condition, batch_size: int) -> int:
+    """
+    Copy up to batch_size rows matching condition into the archive table and
+    delete them from source, in one transaction. Returns the rows moved.
+    """
+    ids = db.scalars(
+        select(source.id).where(condition).order_by(source.id).limit(batch_size)
+    ).all()
+    if not ids:
+        return 0
+
+    columns = list(source.__table__.columns)
+    db.execute(
+        insert(archive).from_select(
+            [column.name for column in columns],
+            select(*columns).where(source.id.in_(ids)),
+        )
+    )
+    db.execute(delete(source).where(source.id.in_(ids)))
+    db.commit()
+    return len(ids)
+
+
+def _archive(db: Session, source, archive, condition, batch_size: int) -> int:
+    # Short batches keep locks and the hot table's WAL churn small
+    moved = 0
+    while True:
+        count = _move_batch(db, source, archive, condition, batch_size)
+        moved += count
+        if count < batch_size:
+            return moved
+
+
+def archive_outward_items(db: Session, older_than_days: int, batch_size: int) -> int:
+    """Move OUTWARD items last updated over older_than_days ago."""
+    last_change = func.coalesce(Item.updated_at, Item.created_at)
+    condition = (Item.track == ItemTrackStatus.OUTWARD) & (
+        last_change < _cutoff(older_than_days)
+    )
+    moved = _archive(db, Item, ItemArchive, condition, batch_size)
+    if moved:
+        # Set-based delete: drop every cached item and rack (with its items)
+        invalidate_tags("item:*", "rack:*")
+    return moved
+
+
+def archive_transactions(db: Session, older_than_days: int, batch_size: int) -> int:
+    """Move transactions dated over older_than_days ago."""
+    condition = Transaction.transaction_date < _cutoff(older_than_days)
+    return _archive(db, Transaction, TransactionArchive, condition, batch_size)
+
+
+# ---------- READ ----------
+
+ARCHIVED_ITEM_COLUMNS = response_columns(ItemArchive, ArchivedItemResponse)
+ARCHIVED_TRANSACTION_COLUMNS = response_columns(
+    TransactionArchive, ArchivedTransactionResponse
+)
+
+
+def _page(stmt, archive, limit: int, after_id: Optional[int]):
+    stmt = stmt.order_by(archive.archive_id)
+    if after_id is not None:
+        stmt = stmt.where(archive.archive_id > after_id)
+    return stmt.limit(limit)
+
+
+def get_archived_item_rows(
+    db: Session,
+    limit: int = 100,
+    rfid: Optional[str] = None,
+    sku_id: Optional[int] = None,
+    rack_id: Optional[str] = None,
+    after_id: Optional[int] = None,
+):
+    """Archived items as Core rows of the ArchivedItemResponse columns."""
+    stmt = select(*ARCHIVED_ITEM_COLUMNS)
+    if rfid:
+        stmt = stmt.where(ItemArchive.rfid == rfid)
+    if sku_id:
+        stmt = stmt.where(ItemArchive.sku_id == sku_id)
+    if rack_id:
+        stmt = stmt.where(ItemArchive.rack_id == rack_id)
+    return db.execute(_page(stmt, ItemArchive, limit, after_id)).all()
+
+
+def get_archived_transaction_rows(
+    db: Session,
+    limit: int = 100,
+    storage_bin_rfid: Optional[str] = None,
+    after_id: Optional[int] = None,
+):
+    """Archived transactions as Core rows of ArchivedTransactionResponse."""
+    stmt = select(*ARCHIVED_TRANSACTION_COLUMNS)
+    if storage_bin_rfid:
+        stmt = stmt.where(TransactionArchive.storage_bin_rfid == storage_bin_rfid)
+    return db.execute(_page(stmt, TransactionArchive, limit, after_id)).all()
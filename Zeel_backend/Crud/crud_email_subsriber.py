@@ -1,5 +1,10 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from Models.email_subscriber import EmailSubscriber
+from Schemas.email_subscriber import EmailSubscriberResponse
+from Utils.serialization import response_columns
+
+SUBSCRIBER_ROWS = select(*response_columns(EmailSubscriber, EmailSubscriberResponse))
 
 
 def get_by_email(db: Session, email: str):
@@ -10,14 +15,12 @@ def create_subscriber(db: Session, email: str, is_active: bool):
     subscriber = EmailSubscriber(email=email, is_active=is_active)
     db.add(subscriber)
     db.commit()
-    db.refresh(subscriber)
     return subscriber
 
 
 def update_subscriber_status(db: Session, subscriber, is_active: bool):
     subscriber.is_active = is_active
     db.commit()
-    db.refresh(subscriber)
     return subscriber
 
 
@@ -25,6 +28,11 @@ def get_all_subscribers(db: Session):
     return db.query(EmailSubscriber).all()
 
 
+def get_subscriber_rows(db: Session):
+    """All subscribers as Core rows of the EmailSubscriberResponse columns."""
+    return db.execute(SUBSCRIBER_ROWS).all()
+
+
 def get_active_subscribers(db: Session):
     return db.query(EmailSubscriber).filter(EmailSubscriber.is_active).all()
 
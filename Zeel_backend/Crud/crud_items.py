@@ -1,48 +1,146 @@
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from Models.items import Item, ItemTrackStatus
-from Schemas.items import ItemFilter
+from Schemas.items import ItemFilter, ItemResponse
+from Crud.statements import ITEM_BY_ID, ITEM_BY_RFID
+from Services.tagged_cache import (
+    invalidate_tags,
+    invalidate_tags_async,
+    item_tags,
+    rack_tags,
+)
+from core.constants import EXPORT_BATCH_SIZE
+from Utils.batching import chunked
+from Utils.serialization import response_columns
 
 # ---------- CREATE ----------
 
 
 def get_item_by_rfid(db: Session, rfid: str):
-    return db.query(Item).filter(Item.rfid == rfid).first()
+    return db.scalar(ITEM_BY_RFID, {"rfid": rfid})
+
+
+def get_items_by_rfids(db: Session, rfids: List[str]):
+    return db.query(Item).filter(Item.rfid.in_(rfids)).all()
 
 
 def get_item_by_id(db: Session, item_id: int):
-    return db.query(Item).filter(Item.id == item_id).first()
+    return db.scalar(ITEM_BY_ID, {"item_id": item_id})
 
 
 def create_item(db: Session, item_data: dict):
     item = Item(**item_data)
     db.add(item)
     db.commit()
-    db.refresh(item)
+    invalidate_tags(*item_tags(item.rfid), *rack_tags(item.rack_id))
     return item
 
 
-def bulk_create_items(db: Session, items_data: List[dict]):
-    created_items = []
+def _insert_ignore_stmt(dialect):
+    """INSERT ... ON CONFLICT (rfid) DO NOTHING RETURNING rfid, if supported."""
+    if dialect.name in ("postgresql", "sqlite") and dialect.insert_returning:
+        dialect_insert = (
+            postgresql.insert if dialect.name == "postgresql" else sqlite.insert
+        )
+        return (
+            dialect_insert(Item)
+            .on_conflict_do_nothing(index_elements=[Item.rfid])
+            .returning(Item.rfid)
+        )
+    return None
+
+
+def _insert_ignore_items(db: Session, rows: List[dict]) -> List[str]:
+    """Insert rows, skipping RFIDs that already exist. Returns inserted RFIDs."""
+    stmt = _insert_ignore_stmt(db.get_bind().dialect)
+    if stmt is not None:
+        return list(db.scalars(stmt, rows))
+
+    # Fallback: one set query for existing RFIDs, then a plain multi-row insert
+    rfids = [row["rfid"] for row in rows]
+    existing = set(db.scalars(select(Item.rfid).where(Item.rfid.in_(rfids))))
+    new_rows = [row for row in rows if row["rfid"] not in existing]
+    if new_rows:
+        db.execute(insert(Item), new_rows)
+    return [row["rfid"] for row in new_rows]
+
+
+def _unique_rows(items_data: List[dict]) -> List[dict]:
+    unique_rows = {}
+    for data in items_data:
+        unique_rows.setdefault(data["rfid"], data)
+    return list(unique_rows.values())
+
 
+def _split_created(items_data: List[dict], created: set):
+    """Split requested RFIDs, in order, into created and skipped."""
+    created_rfids, skipped_rfids = [], []
     for data in items_data:
-        if get_item_by_rfid(db, data["rfid"]):
-            continue
-        item = Item(**data)
-        db.add(item)
-        created_items.append(item)
+        if data["rfid"] in created:
+            created.discard(data["rfid"])
+            created_rfids.append(data["rfid"])
+        else:
+            skipped_rfids.append(data["rfid"])
+    return created_rfids, skipped_rfids
 
-    db.commit()
-    for item in created_items:
-        db.refresh(item)
 
-    return created_items
+def _bulk_create_tags(items_data: List[dict], created_rfids: List[str]):
+    rack_ids = {data["rack_id"] for data in items_data}
+    return [*item_tags(*created_rfids), *rack_tags(*rack_ids)]
+
+
+def bulk_create_items(
+    db: Session, items_data: List[dict]
+) -> Tuple[List[str], List[str]]:
+    """
+    Set-based bulk ingest, chunked by MAX_BULK_RFIDS.
+    Returns (created_rfids, skipped_rfids).
+    """
+    created = set()
+    for chunk in chunked(_unique_rows(items_data)):
+        created.update(_insert_ignore_items(db, chunk))
+
+    created_rfids, skipped_rfids = _split_created(items_data, created)
+
+    db.commit()
+    if created_rfids:
+        invalidate_tags(*_bulk_create_tags(items_data, created_rfids))
+    return created_rfids, skipped_rfids
 
 
 # ---------- READ ----------
 
+ITEM_RESPONSE_COLUMNS = response_columns(Item, ItemResponse)
+
+
+def _filtered(stmt, track=None, status=None, sku_id=None, rack_id=None):
+    """The one WHERE clause shared by the list, filter and export reads."""
+    if track:
+        stmt = stmt.where(Item.track == track)
+    if status:
+        stmt = stmt.where(Item.status == status)
+    if sku_id:
+        stmt = stmt.where(Item.sku_id == sku_id)
+    if rack_id:
+        stmt = stmt.where(Item.rack_id == rack_id)
+    return stmt
+
+
+def _items_stmt(skip, limit, track, status, sku_id, rack_id, after_id, columns=(Item,)):
+    stmt = _filtered(select(*columns), track, status, sku_id, rack_id)
+    stmt = stmt.order_by(Item.id)
+
+    # Keyset pagination: seek past the last seen id instead of OFFSET
+    if after_id is not None:
+        return stmt.where(Item.id > after_id).limit(limit)
+
+    return stmt.offset(skip).limit(limit)
+
 
-def get_items(
+def get_item_rows(
     db: Session,
     skip: int = 0,
     limit: int = 100,
@@ -50,34 +148,60 @@ def get_items(
     status: Optional[str] = None,
     sku_id: Optional[int] = None,
     rack_id: Optional[str] = None,
+    after_id: Optional[int] = None,
 ):
-    query = db.query(Item)
+    """get_items as Core rows of the ItemResponse columns, for serialize_rows."""
+    stmt = _items_stmt(
+        skip,
+        limit,
+        track,
+        status,
+        sku_id,
+        rack_id,
+        after_id,
+        columns=ITEM_RESPONSE_COLUMNS,
+    )
+    return db.execute(stmt).all()
+
+
+def _filtered_by(stmt, filters: ItemFilter):
+    return _filtered(
+        stmt, filters.track, filters.status, filters.sku_id, filters.rack_id
+    )
 
-    if track:
-        query = query.filter(Item.track == track)
-    if status:
-        query = query.filter(Item.status == status)
-    if sku_id:
-        query = query.filter(Item.sku_id == sku_id)
-    if rack_id:
-        query = query.filter(Item.rack_id == rack_id)
 
-    return query.offset(skip).limit(limit).all()
+def filter_items(db: Session, filters: ItemFilter):
+    return db.scalars(_filtered_by(select(Item), filters)).all()
+
 
+ITEM_EXPORT_COLUMNS = (
+    Item.id,
+    Item.rfid,
+    Item.sku_id,
+    Item.rack_id,
+    Item.storage_bin_rfid,
+    Item.status,
+    Item.track,
+    Item.created_at,
+    Item.updated_at,
+)
 
-def filter_items(db: Session, filters: ItemFilter):
-    query = db.query(Item)
 
-    if filters.track:
-        query = query.filter(Item.track == filters.track)
-    if filters.status:
-        query = query.filter(Item.status == filters.status)
-    if filters.sku_id:
-        query = query.filter(Item.sku_id == filters.sku_id)
-    if filters.rack_id:
-        query = query.filter(Item.rack_id == filters.rack_id)
+def stream_filtered_items(
+    db: Session, filters: ItemFilter, batch_size: int = EXPORT_BATCH_SIZE
+):
+    """
+    Yield matching items as plain row mappings, fetched through a
+    server-side cursor so memory stays flat regardless of result size.
+    """
+    stmt = _filtered_by(select(*ITEM_EXPORT_COLUMNS), filters)
+    stmt = stmt.order_by(Item.id)
 
-    return query.all()
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    try:
+        yield from result.mappings()
+    finally:
+        result.close()
 
 
 def get_items_by_track(db: Session, track: ItemTrackStatus):
@@ -88,11 +212,12 @@ def get_items_by_track(db: Session, track: ItemTrackStatus):
 
 
 def update_item(db: Session, item: Item, update_data: dict):
+    old_rack_id = item.rack_id
     for field, value in update_data.items():
         setattr(item, field, value)
 
     db.commit()
-    db.refresh(item)
+    invalidate_tags(*item_tags(item.rfid), *rack_tags(old_rack_id, item.rack_id))
     return item
 
 
@@ -103,6 +228,7 @@ def update_item_track(
     rack_id: Optional[str] = None,
     storage_bin_rfid: Optional[str] = None,
 ):
+    old_rack_id = item.rack_id
     item.track = track
 
     if rack_id:
@@ -111,7 +237,7 @@ def update_item_track(
         item.storage_bin_rfid = storage_bin_rfid
 
     db.commit()
-    db.refresh(item)
+    invalidate_tags(*item_tags(item.rfid), *rack_tags(old_rack_id, item.rack_id))
     return item
 
 
@@ -121,3 +247,110 @@ def update_item_track(
 def delete_item(db: Session, item: Item):
     db.delete(item)
     db.commit()
+    invalidate_tags(*item_tags(item.rfid), *rack_tags(item.rack_id))
+
+
+# ---------- ASYNC ----------
+# Same operations on an AsyncSession (get_async_db), for async def routes.
+
+
+async def get_item_by_rfid_async(db: AsyncSession, rfid: str):
+    return await db.scalar(ITEM_BY_RFID, {"rfid": rfid})
+
+
+async def get_item_by_id_async(db: AsyncSession, item_id: int):
+    return await db.get(Item, item_id)
+
+
+async def get_items_by_rfids_async(db: AsyncSession, rfids: List[str]):
+    return (await db.scalars(select(Item).where(Item.rfid.in_(rfids)))).all()
+
+
+async def get_items_async(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    track: Optional[ItemTrackStatus] = None,
+    status: Optional[str] = None,
+    sku_id: Optional[int] = None,
+    rack_id: Optional[str] = None,
+    after_id: Optional[int] = None,
+):
+    stmt = _items_stmt(skip, limit, track, status, sku_id, rack_id, after_id)
+    return (await db.scalars(stmt)).all()
+
+
+async def create_item_async(db: AsyncSession, item_data: dict):
+    item = Item(**item_data)
+    db.add(item)
+    await db.commit()
+    await invalidate_tags_async(*item_tags(item.rfid), *rack_tags(item.rack_id))
+    return item
+
+
+async def _insert_ignore_items_async(db: AsyncSession, rows: List[dict]) -> List[str]:
+    stmt = _insert_ignore_stmt(db.bind.dialect)
+    if stmt is not None:
+        return list(await db.scalars(stmt, rows))
+
+    rfids = [row["rfid"] for row in rows]
+    existing = set(await db.scalars(select(Item.rfid).where(Item.rfid.in_(rfids))))
+    new_rows = [row for row in rows if row["rfid"] not in existing]
+    if new_rows:
+        await db.execute(insert(Item), new_rows)
+    return [row["rfid"] for row in new_rows]
+
+
+async def bulk_create_items_async(
+    db: AsyncSession, items_data: List[dict]
+) -> Tuple[List[str], List[str]]:
+    created = set()
+    for chunk in chunked(_unique_rows(items_data)):
+        created.update(await _insert_ignore_items_async(db, chunk))
+
+    created_rfids, skipped_rfids = _split_created(items_data, created)
+
+    await db.commit()
+    if created_rfids:
+        await invalidate_tags_async(*_bulk_create_tags(items_data, created_rfids))
+    return created_rfids, skipped_rfids
+
+
+async def update_item_async(db: AsyncSession, item: Item, update_data: dict):
+    old_rack_id = item.rack_id
+    for field, value in update_data.items():
+        setattr(item, field, value)
+
+    await db.commit()
+    await invalidate_tags_async(
+        *item_tags(item.rfid), *rack_tags(old_rack_id, item.rack_id)
+    )
+    return item
+
+
+async def update_item_track_async(
+    db: AsyncSession,
+    item: Item,
+    track: ItemTrackStatus,
+    rack_id: Optional[str] = None,
+    storage_bin_rfid: Optional[str] = None,
+):
+    old_rack_id = item.rack_id
+    item.track = track
+
+    if rack_id:
+        item.rack_id = rack_id
+    if storage_bin_rfid:
+        item.storage_bin_rfid = storage_bin_rfid
+
+    await db.commit()
+    await invalidate_tags_async(
+        *item_tags(item.rfid), *rack_tags(old_rack_id, item.rack_id)
+    )
+    return item
+
+
+async def delete_item_async(db: AsyncSession, item: Item):
+    await db.delete(item)
+    await db.commit()
+    await invalidate_tags_async(*item_tags(item.rfid), *rack_tags(item.rack_id))
@@ -1,13 +1,26 @@
+from collections import defaultdict
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from Models.items import Item
 from Models.rack import Rack
 from Models.storage_bin import StorageBin
+from Crud.statements import RACK_BY_RACK_ID
+from Schemas.items import ItemResponse
+from Schemas.rack import RackResponse
+from Schemas.storage_bin import StorageBinResponse
+from Services.tagged_cache import invalidate_tags, rack_tags
+from Utils.serialization import response_columns
+
+RACK_COLUMNS = response_columns(Rack, RackResponse)
+STORAGE_BIN_COLUMNS = response_columns(StorageBin, StorageBinResponse)
+ITEM_COLUMNS = response_columns(Item, ItemResponse)
 
 
 def create_rack(db: Session, rack_id: str, location: str):
     rack = Rack(rack_id=rack_id, location=location)
     db.add(rack)
     db.commit()
-    db.refresh(rack)
+    invalidate_tags(*rack_tags(rack.rack_id))
     return rack
 
 
@@ -15,16 +28,42 @@ def get_all_racks(db: Session):
     return db.query(Rack).all()
 
 
+def _rows_by_rack(db: Session, model, columns, rack_ids) -> dict:
+    grouped = defaultdict(list)
+    if rack_ids:
+        stmt = select(*columns).where(model.rack_id.in_(rack_ids)).order_by(model.id)
+        for row in db.execute(stmt):
+            grouped[row.rack_id].append(row._asdict())
+    return grouped
+
+
+def get_rack_rows(db: Session):
+    """
+    All racks as RackResponse-shaped dicts, built from Core rows: one query
+    for the racks, and one each for their storage bins and items, instead
+    of lazy-loading both relationships per rack.
+    """
+    racks = [row._asdict() for row in db.execute(select(*RACK_COLUMNS))]
+    rack_ids = [rack["rack_id"] for rack in racks if rack["rack_id"]]
+    bins = _rows_by_rack(db, StorageBin, STORAGE_BIN_COLUMNS, rack_ids)
+    items = _rows_by_rack(db, Item, ITEM_COLUMNS, rack_ids)
+    for rack in racks:
+        rack["storage_bins"] = bins.get(rack["rack_id"], [])
+        rack["items"] = items.get(rack["rack_id"], [])
+    return racks
+
+
 def get_rack_by_id(db: Session, rack_id: str):
-    return db.query(Rack).filter(Rack.rack_id == rack_id).first()
+    return db.scalar(RACK_BY_RACK_ID, {"rack_id": rack_id})
 
 
 def update_rack(db: Session, rack: Rack, update_data: dict):
+    old_rack_id = rack.rack_id
     for field, value in update_data.items():
         setattr(rack, field, value)
 
     db.commit()
-    db.refresh(rack)
+    invalidate_tags(*rack_tags(old_rack_id, rack.rack_id))
     return rack
 
 
@@ -37,3 +76,4 @@ def has_bins(db: Session, rack_id: str) -> bool:
 def delete_rack(db: Session, rack: Rack):
     db.delete(rack)
     db.commit()
+    invalidate_tags(*rack_tags(rack.rack_id))
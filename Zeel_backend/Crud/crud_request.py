@@ -1,8 +1,13 @@
 from datetime import timezone
 from zoneinfo import ZoneInfo
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from Models.request import Request
+from Schemas.request import RequestResponse
+from Utils.serialization import response_columns
+
+REQUEST_ROWS = select(*response_columns(Request, RequestResponse))
 
 
 def create_request(db: Session, request_data):
@@ -23,7 +28,6 @@ def create_request(db: Session, request_data):
 
     db.add(new_request)
     db.commit()
-    db.refresh(new_request)
     return new_request
 
 
@@ -31,6 +35,11 @@ def get_all_requests(db: Session):
     return db.query(Request).all()
 
 
+def get_request_rows(db: Session):
+    """All requests as Core rows of the RequestResponse columns."""
+    return db.execute(REQUEST_ROWS).all()
+
+
 def get_request_by_id(db: Session, request_id: int):
     return db.query(Request).filter(Request.id == request_id).first()
 
@@ -1,5 +1,12 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from Models.sku import SKU
+from Crud.statements import SKU_BY_ID
+from Schemas.sku import SKUResponse
+from Services.tagged_cache import invalidate_tags, sku_tags
+from Utils.serialization import response_columns
+
+SKU_ROWS = select(*response_columns(SKU, SKUResponse))
 
 
 def get_sku_by_code(db: Session, sku_code: str):
@@ -7,18 +14,23 @@ def get_sku_by_code(db: Session, sku_code: str):
 
 
 def get_sku_by_id(db: Session, sku_id: int):
-    return db.query(SKU).filter(SKU.id == sku_id).first()
+    return db.scalar(SKU_BY_ID, {"sku_id": sku_id})
 
 
 def get_all_skus(db: Session):
     return db.query(SKU).all()
 
 
+def get_sku_rows(db: Session):
+    """All SKUs as Core rows of the SKUResponse columns."""
+    return db.execute(SKU_ROWS).all()
+
+
 def create_sku(db: Session, sku_data: dict):
     sku = SKU(**sku_data)
     db.add(sku)
     db.commit()
-    db.refresh(sku)
+    invalidate_tags(*sku_tags(sku.id))
     return sku
 
 
@@ -27,7 +39,7 @@ def update_sku(db: Session, sku: SKU, update_data: dict):
         setattr(sku, key, value)
 
     db.commit()
-    db.refresh(sku)
+    invalidate_tags(*sku_tags(sku.id))
     return sku
 
 
@@ -38,3 +50,4 @@ def can_delete_sku(sku: SKU) -> bool:
 def delete_sku(db: Session, sku: SKU):
     db.delete(sku)
     db.commit()
+    invalidate_tags(*sku_tags(sku.id))
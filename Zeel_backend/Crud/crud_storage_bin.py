@@ -1,32 +1,68 @@
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from Models.storage_bin import StorageBin
+from Crud.statements import STORAGE_BIN_BY_RFID
+from Services.tagged_cache import invalidate_tags_async, rack_tags
 
 
 def get_storage_bin_by_rfid(db: Session, rfid: str):
-    return db.query(StorageBin).filter(StorageBin.rfid == rfid).first()
+    return db.scalar(STORAGE_BIN_BY_RFID, {"rfid": rfid})
 
 
-def get_all_storage_bins(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(StorageBin).offset(skip).limit(limit).all()
+def _all_storage_bins_stmt(skip: int, limit: int, after_id: Optional[int]):
+    stmt = select(StorageBin).order_by(StorageBin.id)
 
+    if after_id is not None:
+        return stmt.where(StorageBin.id > after_id).limit(limit)
 
-def create_storage_bin(db: Session, rfid: str, rack_id: int, capacity: int):
+    return stmt.offset(skip).limit(limit)
+
+
+# ---------- ASYNC ----------
+# The storage-bin routes run on an AsyncSession (get_async_db).
+
+
+async def get_storage_bin_by_rfid_async(db: AsyncSession, rfid: str):
+    return await db.scalar(STORAGE_BIN_BY_RFID, {"rfid": rfid})
+
+
+async def get_storage_bins_by_rfids_async(db: AsyncSession, rfids: List[str]):
+    return (
+        await db.scalars(select(StorageBin).where(StorageBin.rfid.in_(rfids)))
+    ).all()
+
+
+async def get_all_storage_bins_async(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+):
+    return (await db.scalars(_all_storage_bins_stmt(skip, limit, after_id))).all()
+
+
+async def create_storage_bin_async(
+    db: AsyncSession, rfid: str, rack_id: int, capacity: int
+):
     new_bin = StorageBin(rfid=rfid, rack_id=rack_id, capacity=capacity)
     db.add(new_bin)
-    db.commit()
-    db.refresh(new_bin)
+    await db.commit()
+    await invalidate_tags_async(*rack_tags(new_bin.rack_id))
     return new_bin
 
 
-def update_storage_bin(db: Session, storage_bin: StorageBin, update_data: dict):
+async def update_storage_bin_async(
+    db: AsyncSession, storage_bin: StorageBin, update_data: dict
+):
+    old_rack_id = storage_bin.rack_id
     for key, value in update_data.items():
         setattr(storage_bin, key, value)
 
-    db.commit()
-    db.refresh(storage_bin)
+    await db.commit()
+    await invalidate_tags_async(*rack_tags(old_rack_id, storage_bin.rack_id))
     return storage_bin
 
 
-def delete_storage_bin(db: Session, storage_bin: StorageBin):
-    db.delete(storage_bin)
-    db.commit()
+async def delete_storage_bin_async(db: AsyncSession, storage_bin: StorageBin):
+    await db.delete(storage_bin)
+    await db.commit()
+    await invalidate_tags_async(*rack_tags(storage_bin.rack_id))
@@ -1,14 +1,25 @@
+from typing import Optional
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from Models.transaction import Transaction, TransactionType
-from Models.storage_bin import StorageBin
 from Models.items import Item, ItemTrackStatus
+from Services.tagged_cache import invalidate_tags, invalidate_tags_async
+from Crud.statements import STORAGE_BIN_EXISTS
+from Utils.batching import chunked
+
+TRACK_MAP = {
+    TransactionType.INWARD: ItemTrackStatus.INWARD,
+    TransactionType.OUTWARD: ItemTrackStatus.OUTWARD,
+    TransactionType.RETURN: ItemTrackStatus.RETURN,
+}
 
 
 # -------------------------------
 # HELPERS
 # -------------------------------
-def storage_bin_exists(db: Session, rfid: str):
-    return db.query(StorageBin).filter(StorageBin.rfid == rfid).first()
+def storage_bin_exists(db: Session, rfid: str) -> bool:
+    return db.scalar(STORAGE_BIN_EXISTS, {"rfid": rfid}) is not None
 
 
 def transaction_exists_for_bin(db: Session, rfid: str):
@@ -26,15 +37,25 @@ def create_transaction(db: Session, transaction_data):
     )
     db.add(new_tx)
     db.commit()
-    db.refresh(new_tx)
     return new_tx
 
 
 # -------------------------------
 # READ
 # -------------------------------
-def get_all_transactions(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Transaction).offset(skip).limit(limit).all()
+def _all_transactions_stmt(skip: int, limit: int, after_id: Optional[int]):
+    stmt = select(Transaction).order_by(Transaction.id)
+
+    if after_id is not None:
+        return stmt.where(Transaction.id > after_id).limit(limit)
+
+    return stmt.offset(skip).limit(limit)
+
+
+def get_all_transactions(
+    db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+):
+    return db.scalars(_all_transactions_stmt(skip, limit, after_id)).all()
 
 
 def get_transactions_by_rfid(db: Session, rfid: str):
@@ -45,6 +66,26 @@ def get_items_by_storage_bin(db: Session, rfid: str):
     return db.query(Item.rfid).filter(Item.storage_bin_rfid == rfid).all()
 
 
+def _item_rfids_stmt(storage_bin_rfids):
+    return (
+        select(Item.storage_bin_rfid, Item.rfid)
+        .where(Item.storage_bin_rfid.in_(storage_bin_rfids))
+        .order_by(Item.id)
+    )
+
+
+def get_item_rfids_by_storage_bins(db: Session, rfids: list[str]):
+    """Map each storage bin RFID to its item RFIDs using one IN query."""
+    item_rfids = {rfid: [] for rfid in rfids}
+    if not item_rfids:
+        return item_rfids
+
+    for storage_bin_rfid, rfid in db.execute(_item_rfids_stmt(item_rfids)):
+        item_rfids[storage_bin_rfid].append(rfid)
+
+    return item_rfids
+
+
 # -------------------------------
 # UPDATE
 # -------------------------------
@@ -54,38 +95,49 @@ def update_transaction(db: Session, transaction: Transaction, transaction_data):
     transaction.reason = transaction_data.reason
 
     db.commit()
-    db.refresh(transaction)
     return transaction
 
 
-def bulk_update_transactions_and_items(
-    db: Session, rfids: list[str], tx_type: TransactionType, reason: str
-):
-    transactions = (
-        db.query(Transaction).filter(Transaction.storage_bin_rfid.in_(rfids)).all()
+def _bulk_update_stmts(chunk, tx_type: TransactionType, reason: str):
+    # Only bins that actually have a transaction get their items moved
+    tx_bins = select(Transaction.storage_bin_rfid).where(
+        Transaction.storage_bin_rfid.in_(chunk)
     )
+    items_stmt = (
+        update(Item)
+        .where(Item.storage_bin_rfid.in_(tx_bins))
+        .values(track=TRACK_MAP[tx_type])
+        .execution_options(synchronize_session=False)
+    )
+    tx_stmt = (
+        update(Transaction)
+        .where(Transaction.storage_bin_rfid.in_(chunk))
+        .values(type=tx_type, reason=reason)
+        .execution_options(synchronize_session=False)
+    )
+    return items_stmt, tx_stmt
 
-    track_map = {
-        TransactionType.INWARD: ItemTrackStatus.INWARD,
-        TransactionType.OUTWARD: ItemTrackStatus.OUTWARD,
-        TransactionType.RETURN: ItemTrackStatus.RETURN,
-    }
-
-    new_track = track_map[tx_type]
-    updated_rfids = set()
-
-    for tx in transactions:
-        tx.type = tx_type
-        tx.reason = reason
-        updated_rfids.add(tx.storage_bin_rfid)
-
-    items = db.query(Item).filter(Item.storage_bin_rfid.in_(updated_rfids)).all()
 
-    for item in items:
-        item.track = new_track
+def bulk_update_transactions_and_items(
+    db: Session, rfids: list[str], tx_type: TransactionType, reason: str
+):
+    """
+    Flip transactions and their bins' items with set-based UPDATEs,
+    chunked by MAX_BULK_RFIDS. Returns (transactions_updated, items_updated).
+    """
+    transactions_updated = 0
+    items_updated = 0
+
+    for chunk in chunked(list(dict.fromkeys(rfids))):
+        items_stmt, tx_stmt = _bulk_update_stmts(chunk, tx_type, reason)
+        items_updated += db.execute(items_stmt).rowcount
+        transactions_updated += db.execute(tx_stmt).rowcount
 
     db.commit()
-    return transactions, items
+    if items_updated:
+        # Items were flipped in SQL without loading them, so drop every entry
+        invalidate_tags("item:*", "rack:*")
+    return transactions_updated, items_updated
 
 
 # -------------------------------
@@ -130,3 +182,57 @@ def return_existing_rfids(db: Session, rfids: list[str]):
 def delete_transaction(db: Session, transaction: Transaction):
     db.delete(transaction)
     db.commit()
+
+
+# -------------------------------
+# ASYNC
+# -------------------------------
+# Same operations on an AsyncSession (get_async_db), for async def routes.
+async def create_transaction_async(db: AsyncSession, transaction_data):
+    new_tx = Transaction(
+        type=transaction_data.type,
+        storage_bin_rfid=transaction_data.storage_bin_rfid,
+        reason=transaction_data.reason,
+    )
+    db.add(new_tx)
+    await db.commit()
+    return new_tx
+
+
+async def get_all_transactions_async(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+):
+    return (await db.scalars(_all_transactions_stmt(skip, limit, after_id))).all()
+
+
+async def get_transactions_by_rfid_async(db: AsyncSession, rfid: str):
+    stmt = select(Transaction).where(Transaction.storage_bin_rfid == rfid)
+    return (await db.scalars(stmt)).all()
+
+
+async def get_item_rfids_by_storage_bins_async(db: AsyncSession, rfids: list[str]):
+    item_rfids = {rfid: [] for rfid in rfids}
+    if not item_rfids:
+        return item_rfids
+
+    for storage_bin_rfid, rfid in await db.execute(_item_rfids_stmt(item_rfids)):
+        item_rfids[storage_bin_rfid].append(rfid)
+
+    return item_rfids
+
+
+async def bulk_update_transactions_and_items_async(
+    db: AsyncSession, rfids: list[str], tx_type: TransactionType, reason: str
+):
+    transactions_updated = 0
+    items_updated = 0
+
+    for chunk in chunked(list(dict.fromkeys(rfids))):
+        items_stmt, tx_stmt = _bulk_update_stmts(chunk, tx_type, reason)
+        items_updated += (await db.execute(items_stmt)).rowcount
+        transactions_updated += (await db.execute(tx_stmt)).rowcount
+
+    await db.commit()
+    if items_updated:
+        await invalidate_tags_async("item:*", "rack:*")
+    return transactions_updated, items_updated
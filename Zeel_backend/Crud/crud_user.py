@@ -1,6 +1,12 @@
 # Crud/user.py
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from Models.user import User
+from Schemas.user import UserResponse
+from Utils.serialization import response_columns
+
+# Only the response columns: the password hash never leaves the database
+USER_ROWS = select(*response_columns(User, UserResponse))
 
 
 def get_user_by_username(db: Session, username: str):
@@ -11,7 +17,6 @@ def create_user(db: Session, username: str, password: str):
     user = User(username=username, password=password)
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
@@ -19,6 +24,11 @@ def get_all_users(db: Session):
     return db.query(User).all()
 
 
+def get_user_rows(db: Session):
+    """All users as Core rows of the UserResponse columns."""
+    return db.execute(USER_ROWS).all()
+
+
 def delete_user(db: Session, username: str):
     user = get_user_by_username(db, username)
     if not user:
@@ -0,0 +1,30 @@
+"""
+Prebuilt statements for the hot single-row lookups.
+
+Each is built once at import, with a named bindparam in place of the
+value, and executed as db.scalar(STATEMENT, {"name": value}). Building a
+select() and generating its cache key are most of the Python cost of a
+small query; a reused statement memoizes its cache key, so each call goes
+straight to the compiled SQL in the engine's statement cache.
+
+benchmarks/bench_lookups.py compares these with db.query().filter().first().
+"""
+
+from sqlalchemy import bindparam, select
+from Models.items import Item
+from Models.rack import Rack
+from Models.sku import SKU
+from Models.storage_bin import StorageBin
+
+ITEM_BY_RFID = select(Item).where(Item.rfid == bindparam("rfid"))
+ITEM_BY_ID = select(Item).where(Item.id == bindparam("item_id"))
+
+STORAGE_BIN_BY_RFID = select(StorageBin).where(StorageBin.rfid == bindparam("rfid"))
+# Existence only: one Core column, no entity to hydrate
+STORAGE_BIN_EXISTS = (
+    select(StorageBin.id).where(StorageBin.rfid == bindparam("rfid")).limit(1)
+)
+
+SKU_BY_ID = select(SKU).where(SKU.id == bindparam("sku_id"))
+
+RACK_BY_RACK_ID = select(Rack).where(Rack.rack_id == bindparam("rack_id"))
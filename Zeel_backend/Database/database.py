@@ -1,6 +1,9 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from core.settings import settings
+from Database.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,32 +11,82 @@ logger = logging.getLogger(__name__)
 # ---------------------------
 # Database Engine
 # ---------------------------
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
 try:
     engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,  # auto-reconnect
-        pool_size=10,
-        max_overflow=20,
+        settings.DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS
     )
 except Exception as e:
     logger.error(f"Failed to create DB engine: {e}")
     raise
 
+# ---------------------------
+# Async Engine
+# ---------------------------
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """Swap a sync DATABASE_URL's driver for its asyncio counterpart."""
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+try:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL),
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **POOL_OPTIONS,
+    )
+except Exception as e:
+    logger.error(f"Failed to create async DB engine: {e}")
+    raise
+
 # ---------------------------
 # Session
 # ---------------------------
+# Objects are not expired on commit, so a write needs no refresh SELECT
+# before it is returned: models set eager_defaults, which reads server
+# generated columns (id, created_at, updated_at) back through
+# INSERT/UPDATE ... RETURNING in the same round trip. An AsyncSession
+# could not lazy-load expired attributes during serialization anyway.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
 
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # ---------------------------
 # Base Model
 # ---------------------------
 Base = declarative_base()
 
 
+def null_on_insert():
+    """
+    Python-side default for columns that start out NULL, such as
+    updated_at. With eager_defaults, a column that has an onupdate but
+    no default is SELECTed back after every INSERT.
+    """
+    return None
+
+
 # ---------------------------
 # Dependency
 # ---------------------------
@@ -43,3 +96,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Async counterpart of get_db, for async def routes."""
+    async with AsyncSessionLocal() as db:
+        yield db
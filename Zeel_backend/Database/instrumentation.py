@@ -0,0 +1,113 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from core.settings import settings
+from Database.slow_query import record_query
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time-Ms"
+REPEATED_QUERIES_HEADER = "X-DB-Repeated-Statements"
+
+_WHITESPACE = re.compile(r"\s+")
+# IN (?, ?, ?) and multi-row VALUES (?, ?), (?, ?) vary with the batch size
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)\s*,?)+\)")
+_VALUES_ROWS = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+
+
+class NPlusOneError(Exception):
+    """Raised in strict mode when a request repeats a statement shape."""
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with whitespace and bind-parameter lists collapsed."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _VALUES_ROWS.sub(r"\1", shape)
+
+
+class QueryStats:
+    """
+    Statements executed within one request (or track_queries block).
+
+    A statement shape executed threshold times is flagged as a likely
+    N+1; in strict mode that raises NPlusOneError from the offending query.
+    """
+
+    def __init__(self, threshold: int, strict: bool, route: Optional[str] = None):
+        self.threshold = threshold
+        self.strict = strict
+        self.route = route
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes = Counter()
+        self.flagged = []
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.total_time * 1000, 3)
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total_time += elapsed
+
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == self.threshold:
+            self.flagged.append(shape)
+            if self.strict:
+                raise NPlusOneError(
+                    f"Statement repeated {self.threshold} times in one request: "
+                    f"{shape}"
+                )
+
+    def repeated(self) -> Dict[str, int]:
+        """Flagged shapes with their final counts."""
+        return {shape: self.shapes[shape] for shape in self.flagged}
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries(
+    threshold: Optional[int] = None,
+    strict: Optional[bool] = None,
+    route: Optional[str] = None,
+):
+    """Collect QueryStats for the statements executed inside the block."""
+    stats = QueryStats(
+        threshold=threshold or settings.N_PLUS_ONE_THRESHOLD,
+        strict=settings.N_PLUS_ONE_STRICT if strict is None else strict,
+        route=route,
+    )
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+# ---------------------------
+# Engine hooks (every engine, including the async engines' sync_engine)
+# ---------------------------
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _current_stats.get()
+    record_query(
+        conn, statement, parameters, elapsed, route=stats.route if stats else None
+    )
+    if stats is not None:
+        stats.record(statement, elapsed)
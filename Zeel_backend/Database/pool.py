@@ -0,0 +1,66 @@
+import threading
+import time
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolWaitStats:
+    """How long checkouts waited for a pooled connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_ms": (
+                    round(self.total_wait / self.checkouts * 1000, 3)
+                    if self.checkouts
+                    else None
+                ),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class _TimedPoolMixin:
+    # _do_get is where QueuePool blocks (up to pool_timeout) for a free
+    # connection, or opens a new one within max_overflow.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(pool) -> dict:
+    status = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),  # negative until pool_size is reached
+    }
+    if hasattr(pool, "wait_stats"):
+        status.update(pool.wait_stats.snapshot())
+    return status
@@ -0,0 +1,237 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from core.settings import settings
+from Database.database import POOL_OPTIONS, SessionLocal
+from Database.pool import TimedQueuePool
+
+logger = logging.getLogger(__name__)
+
+# Set on responses to writes; while present the client reads from the primary
+LAST_WRITE_COOKIE = "last_write"
+# Clients that do not keep cookies (e.g. handheld scanners) send this header,
+# with any value but "0"/"false", on reads that must see their own writes
+READ_PRIMARY_HEADER = "X-Read-Primary"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+# Seconds the replica is behind the primary. 0 when it has replayed all the
+# WAL it received (an idle primary would otherwise look ever more lagged).
+POSTGRES_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+    "THEN 0 ELSE COALESCE(EXTRACT(EPOCH FROM now() - "
+    "pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaRouter:
+    """
+    Read-only sessions on a replica, with a fallback to the primary.
+
+    The replica's lag is checked at most every check_interval seconds.
+    While it is unreachable or more than max_lag seconds behind, or if
+    no replica is configured, the primary is used.
+    """
+
+    def __init__(
+        self,
+        replica_url: Optional[str],
+        max_lag: float,
+        check_interval: float,
+        primary=SessionLocal,
+    ):
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.primary = primary
+        self.engine = None
+        self.SessionLocal = None
+
+        self._lock = threading.Lock()
+        self._checked_at = None
+        self._healthy = False
+        self.lag = None
+
+        if not replica_url:
+            return
+
+        self.engine = create_engine(
+            replica_url, poolclass=TimedQueuePool, **POOL_OPTIONS
+        )
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine
+        )
+
+    @property
+    def configured(self) -> bool:
+        return self.engine is not None
+
+    def _measure_lag(self) -> float:
+        with self.engine.connect() as connection:
+            if connection.dialect.name == "postgresql":
+                return float(connection.execute(POSTGRES_LAG_QUERY).scalar())
+            # Nothing to measure (e.g. a SQLite copy in tests): reachable is fresh
+            connection.execute(text("SELECT 1"))
+            return 0.0
+
+    def check_due(self) -> bool:
+        return self.configured and (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self.check_interval
+        )
+
+    def available(self) -> bool:
+        """Whether reads may go to the replica right now."""
+        if not self.configured:
+            return False
+        if not self.check_due():
+            return self._healthy
+
+        with self._lock:
+            # Another thread may have checked while this one waited
+            if not self.check_due():
+                return self._healthy
+
+            try:
+                self.lag = self._measure_lag()
+                healthy = self.lag <= self.max_lag
+                if not healthy:
+                    logger.warning(
+                        f"Replica {self.lag:.1f}s behind, reading from the primary"
+                    )
+            except Exception as e:
+                logger.warning(f"Replica unavailable, reading from the primary: {e}")
+                self.lag = None
+                healthy = False
+
+            self._healthy = healthy
+            self._checked_at = time.monotonic()
+            return healthy
+
+    def mark_unavailable(self, error: Exception):
+        """Fall back to the primary until the next lag check succeeds."""
+        logger.warning(f"Replica failed, reading from the primary: {error}")
+        with self._lock:
+            self.lag = None
+            self._healthy = False
+            self._checked_at = time.monotonic()
+
+    def session_factory(self, request: Request):
+        if not wants_primary(request) and self.available():
+            return self.SessionLocal
+        return self.primary
+
+    def status(self) -> dict:
+        if not self.configured:
+            return {"status": "not_configured"}
+        return {
+            "status": "ok" if self.available() else "fallback",
+            "lag_seconds": self.lag,
+            "max_lag_seconds": self.max_lag,
+        }
+
+
+def wants_primary(request: Request) -> bool:
+    """
+    Whether the client must read its own writes: it sent READ_PRIMARY_HEADER,
+    or it holds a fresh LAST_WRITE_COOKIE. Clients that drop cookies and do
+    not send the header may read stale data right after a write.
+    """
+    forced = request.headers.get(READ_PRIMARY_HEADER)
+    if forced is not None and forced.lower() not in ("0", "false"):
+        return True
+    return wrote_recently(request)
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether the client made a write within READ_YOUR_WRITES_WINDOW."""
+    written_at = request.cookies.get(LAST_WRITE_COOKIE)
+    if not written_at:
+        return False
+    try:
+        return time.time() - float(written_at) < settings.READ_YOUR_WRITES_WINDOW
+    except ValueError:
+        return False
+
+
+replica_router = ReplicaRouter(
+    settings.DATABASE_REPLICA_URL,
+    max_lag=settings.REPLICA_MAX_LAG,
+    check_interval=settings.REPLICA_CHECK_INTERVAL,
+)
+
+
+# ---------------------------
+# Dependency
+# ---------------------------
+def get_read_db(request: Request):
+    """
+    get_db for read-only GET routes: a replica session when one is
+    configured, fresh enough and the client does not need its own writes
+    (see wants_primary), else the primary.
+
+    The replica connection is checked out up front, so a replica that
+    failed since the last lag check falls back to the primary here. If it
+    fails later, mid-request, that request errors and later ones fall back.
+    """
+    factory = replica_router.session_factory(request)
+    on_replica = factory is not replica_router.primary
+    db = factory()
+    if on_replica:
+        try:
+            db.connection()
+        except OperationalError as e:
+            db.close()
+            replica_router.mark_unavailable(e)
+            on_replica = False
+            db = replica_router.primary()
+
+    try:
+        yield db
+    except OperationalError as e:
+        if on_replica:
+            replica_router.mark_unavailable(e)
+        raise
+    finally:
+        db.close()
+
+
+class WriteTracker:
+    """Whether the statements run inside track_writes() changed any data."""
+
+    def __init__(self):
+        self.wrote = False
+
+
+_current_writes: ContextVar[Optional[WriteTracker]] = ContextVar(
+    "write_tracker", default=None
+)
+
+
+@contextmanager
+def track_writes():
+    """
+    Flag INSERT/UPDATE/DELETE statements executed inside the block. A POST
+    that only reads (lookups, filters, RFID verification) leaves it unset.
+    """
+    tracker = WriteTracker()
+    token = _current_writes.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_writes.reset(token)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tracker = _current_writes.get()
+    if tracker is not None and not tracker.wrote:
+        tracker.wrote = statement.lstrip().upper().startswith(WRITE_STATEMENTS)
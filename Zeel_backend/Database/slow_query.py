@@ -0,0 +1,171 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import greenlet
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from core.settings import settings
+
+# Dedicated logger; setup_logging() sends it to SLOW_QUERY_LOG_FILE if set
+slow_query_logger = logging.getLogger("slow_query")
+
+_CRUD_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Crud", ""
+)
+
+# Execution option marking connections whose statements are not logged
+SKIP_OPTION = "skip_slow_query_log"
+
+EXPLAIN_PREFIXES = {
+    "sqlite": ("EXPLAIN QUERY PLAN ", "EXPLAIN QUERY PLAN "),  # no ANALYZE
+    "postgresql": ("EXPLAIN ", "EXPLAIN (ANALYZE, BUFFERS) "),
+    "mysql": ("EXPLAIN ", "EXPLAIN ANALYZE "),
+}
+
+# One thread: EXPLAINs are rare and must not compete with requests
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+_pending = threading.BoundedSemaphore(settings.SLOW_QUERY_EXPLAIN_QUEUE)
+
+# Separate unpooled engines: EXPLAIN runs outside the request's connection,
+# and async drivers need their own event loop on the background thread
+_explain_engines = {}
+_explain_engines_lock = threading.Lock()
+
+
+def _redact(parameters):
+    """Parameter types only; values may be personal or secret."""
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} rows>"  # executemany
+        return [type(value).__name__ for value in parameters]
+    return None
+
+
+def _crud_frame(frame) -> Optional[str]:
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(_CRUD_DIR):
+            module = os.path.splitext(os.path.basename(filename))[0]
+            return f"{module}.{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+def _caller() -> Optional[str]:
+    """The Crud function that issued the statement, if any."""
+    caller = _crud_frame(sys._getframe(1))
+    if caller is None:
+        # AsyncSession runs the sync execution in a greenlet; the awaiting
+        # Crud coroutine is on the stack of the greenlet that spawned it
+        parent = greenlet.getcurrent().parent
+        if parent is not None:
+            caller = _crud_frame(parent.gr_frame)
+    return caller
+
+
+def _explain_engine(url, is_async: bool):
+    key = url.render_as_string(hide_password=False)
+    with _explain_engines_lock:
+        if key not in _explain_engines:
+            factory = create_async_engine if is_async else create_engine
+            _explain_engines[key] = factory(
+                key,
+                poolclass=NullPool,
+                execution_options={SKIP_OPTION: True},
+            )
+        return _explain_engines[key]
+
+
+def _plan_lines(rows) -> list:
+    # SQLite rows are (id, parent, notused, detail); others one text column
+    return [str(row[-1]) if len(row) > 1 else str(row[0]) for row in rows]
+
+
+def _run_explain(engine, sql: str, parameters) -> list:
+    with engine.connect() as connection:
+        try:
+            return _plan_lines(connection.exec_driver_sql(sql, parameters).fetchall())
+        finally:
+            # Only SELECTs are explained, but EXPLAIN ANALYZE does run them
+            connection.rollback()
+
+
+async def _run_explain_async(engine, sql: str, parameters) -> list:
+    async with engine.connect() as connection:
+        try:
+            result = await connection.exec_driver_sql(sql, parameters)
+            return _plan_lines(result.fetchall())
+        finally:
+            await connection.rollback()
+
+
+def _explain_and_log(entry: dict, url, is_async: bool, statement, parameters):
+    try:
+        prefix = EXPLAIN_PREFIXES[url.get_backend_name()][int(entry["analyze"])]
+        engine = _explain_engine(url, is_async)
+        if is_async:
+            entry["plan"] = asyncio.run(
+                _run_explain_async(engine, prefix + statement, parameters)
+            )
+        else:
+            entry["plan"] = _run_explain(engine, prefix + statement, parameters)
+    except Exception as e:
+        entry["plan_error"] = str(e)
+    finally:
+        _pending.release()
+    slow_query_logger.warning(json.dumps(entry, default=str))
+
+
+def record_query(conn, statement: str, parameters, elapsed: float, route=None):
+    """Log statement if it took over SLOW_QUERY_THRESHOLD_MS."""
+    threshold = settings.SLOW_QUERY_THRESHOLD_MS
+    duration_ms = elapsed * 1000
+    if not threshold or duration_ms < threshold:
+        return
+    if conn.get_execution_options().get(SKIP_OPTION):
+        return
+
+    is_select = statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    entry = {
+        "duration_ms": round(duration_ms, 3),
+        "route": route,
+        "caller": _caller(),
+        "statement": statement,
+        "parameters": _redact(parameters),
+        "analyze": is_select
+        and random.random() < settings.SLOW_QUERY_ANALYZE_SAMPLE_RATE,
+    }
+
+    url = conn.engine.url
+    explainable = (
+        settings.SLOW_QUERY_EXPLAIN
+        and is_select
+        and url.get_backend_name() in EXPLAIN_PREFIXES
+    )
+    if not explainable:
+        slow_query_logger.warning(json.dumps(entry, default=str))
+        return
+
+    if not _pending.acquire(blocking=False):
+        entry["plan_error"] = "EXPLAIN queue full"
+        slow_query_logger.warning(json.dumps(entry, default=str))
+        return
+
+    # Log from the background thread once the plan is in
+    _executor.submit(
+        _explain_and_log,
+        entry,
+        url,
+        conn.dialect.is_async,
+        statement,
+        parameters,
+    )
@@ -1,6 +1,12 @@
 import time
 from fastapi import Request
 import logging
+from Database.instrumentation import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    REPEATED_QUERIES_HEADER,
+    track_queries,
+)
 
 logger = logging.getLogger("api")
 
@@ -24,7 +30,8 @@ class APIMonitor:
         )
 
         try:
-            response = await call_next(request)
+            with track_queries(route=f"{request.method} {request.url.path}") as queries:
+                response = await call_next(request)
         except Exception as e:
             # Log errors
             self.logger.error(f"API Error - {str(e)}")
@@ -34,9 +41,23 @@ class APIMonitor:
 
         # Log response
         self.logger.info(
-            f"API Response - Status: {response.status_code}, Time: {process_time:.4f}s"
+            f"API Response - Status: {response.status_code}, "
+            f"Time: {process_time:.4f}s, "
+            f"Queries: {queries.count}, DB Time: {queries.total_ms}ms"
         )
 
+        repeated = queries.repeated()
+        for shape, count in repeated.items():
+            self.logger.warning(
+                f"Possible N+1 - {request.method} {request.url.path} "
+                f"ran {count}x: {shape}"
+            )
+
+        response.headers[QUERY_COUNT_HEADER] = str(queries.count)
+        response.headers[QUERY_TIME_HEADER] = str(queries.total_ms)
+        if repeated:
+            response.headers[REPEATED_QUERIES_HEADER] = str(len(repeated))
+
         return response
 
 
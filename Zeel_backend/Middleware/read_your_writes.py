@@ -0,0 +1,36 @@
+import time
+from fastapi import Request
+from core.settings import settings
+from Database.replica import LAST_WRITE_COOKIE, SAFE_METHODS, track_writes
+
+
+class ReadYourWrites:
+    """
+    Mark clients that just wrote, so their reads skip the replica (which
+    may not have the write yet) for READ_YOUR_WRITES_WINDOW seconds. Only
+    requests that ran an INSERT/UPDATE/DELETE count as writes. Clients
+    that do not store cookies send READ_PRIMARY_HEADER instead.
+    """
+
+    async def __call__(self, request: Request, call_next):
+        with track_writes() as writes:
+            response = await call_next(request)
+
+        if (
+            writes.wrote
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                LAST_WRITE_COOKIE,
+                str(time.time()),
+                max_age=settings.READ_YOUR_WRITES_WINDOW,
+                httponly=True,
+                samesite="lax",
+            )
+
+        return response
+
+
+# Create instance
+read_your_writes = ReadYourWrites()
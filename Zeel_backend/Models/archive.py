@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy.sql import func
+from Database.database import Base
+from Models.items import ItemTrackStatus
+from Models.transaction import TransactionType
+
+# History moved out of the hot tables by Crud/crud_archive.py. Columns
+# mirror the source tables, minus foreign keys and unique constraints: an
+# archived row outlives its bin or rack, and an RFID may be reused. id is
+# the row's id in the source table; archive_id keys the archive itself.
+
+
+class ItemArchive(Base):
+    __tablename__ = "items_archive"
+
+    archive_id = Column(Integer, primary_key=True)
+    id = Column(Integer, nullable=False, index=True)
+    rfid = Column(String(100), index=True)
+    sku_id = Column(Integer, nullable=False, index=True)
+    rack_id = Column(String(100), index=True)
+    storage_bin_rfid = Column(String(100))
+    status = Column(String(20))
+    track = Column(Enum(ItemTrackStatus))
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class TransactionArchive(Base):
+    __tablename__ = "transactions_archive"
+
+    archive_id = Column(Integer, primary_key=True)
+    id = Column(Integer, nullable=False, index=True)
+    type = Column(Enum(TransactionType), nullable=False)
+    reason = Column(String(255))
+    storage_bin_rfid = Column(String(100), index=True)
+    transaction_date = Column(DateTime(timezone=True), index=True)
+
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
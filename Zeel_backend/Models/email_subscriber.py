@@ -5,6 +5,7 @@ from Database.database import Base
 
 class EmailSubscriber(Base):
     __tablename__ = "email_subscribers"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True)
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from Database.database import Base
+from Database.database import Base, null_on_insert
 from Models.rack import Rack
 from Models.storage_bin import StorageBin
 import enum
@@ -15,6 +15,7 @@ class ItemTrackStatus(enum.Enum):
 
 class Item(Base):
     __tablename__ = "items"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     rfid = Column(String(100), unique=True, index=True)
@@ -22,14 +23,29 @@ class Item(Base):
     sku_id = Column(Integer, ForeignKey("skus.id"), nullable=False)
 
     rack_id = Column(String(100), ForeignKey(Rack.rack_id))
-    storage_bin_rfid = Column(String(100), ForeignKey(StorageBin.rfid))
+    storage_bin_rfid = Column(String(100), ForeignKey(StorageBin.rfid), index=True)
 
-    status = Column(String(20), default="IN_STOCK")  # IN_STOCK / SOLD / DAMAGED
+    # IN_STOCK / SOLD / DAMAGED
+    status = Column(String(20), default="IN_STOCK", index=True)
     track = Column(Enum(ItemTrackStatus), default=ItemTrackStatus.INWARD)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), default=null_on_insert, onupdate=func.now()
+    )
 
     rack = relationship("Rack", back_populates="items")
     storage_bin = relationship("StorageBin", back_populates="items")
     sku = relationship("SKU", back_populates="items")
+
+    # Match the filter shapes used by get_items / filter_items
+    __table_args__ = (
+        Index("ix_items_track_sku_id", "track", "sku_id"),
+        Index("ix_items_rack_id_track", "rack_id", "track"),
+        Index(
+            "ix_items_inward_sku_id",
+            "sku_id",
+            postgresql_where=text("track = 'INWARD'"),
+            sqlite_where=text("track = 'INWARD'"),
+        ),
+    )
@@ -1,17 +1,20 @@
 from sqlalchemy import Column, Integer, String, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from Database.database import Base
+from Database.database import Base, null_on_insert
 
 
 class Rack(Base):
     __tablename__ = "racks"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     rack_id = Column(String(255), unique=True, nullable=True)
     location = Column(String(255))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), default=null_on_insert, onupdate=func.now()
+    )
 
     storage_bins = relationship("StorageBin", back_populates="rack")
     items = relationship("Item", back_populates="rack")
@@ -5,11 +5,12 @@ from Database.database import Base
 
 class Request(Base):
     __tablename__ = "requests"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     req_from = Column(String(255))
     req_to = Column(String(255))
     description = Column(String(500))
     created_date = Column(DateTime(timezone=True), server_default=func.now())
-    request_date = Column(DateTime(timezone=True))
+    request_date = Column(DateTime(timezone=True), index=True)
     is_sent = Column(Boolean, default=False)  # Track if email was sent
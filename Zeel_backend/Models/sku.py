@@ -1,11 +1,12 @@
 from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from Database.database import Base
+from Database.database import Base, null_on_insert
 
 
 class SKU(Base):
     __tablename__ = "skus"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     sku_code = Column(String(50), unique=True, index=True)  # e.g TS-M-BLU
@@ -19,7 +20,9 @@ class SKU(Base):
     is_active = Column(Boolean, default=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), default=null_on_insert, onupdate=func.now()
+    )
 
     # relationship
     items = relationship("Item", back_populates="sku")
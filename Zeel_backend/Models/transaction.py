@@ -15,12 +15,16 @@ class TransactionType(str, enum.Enum):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True)
     type = Column(Enum(TransactionType), nullable=False)
     reason = Column(String(255), default=None)
     storage_bin_rfid = Column(String(100), ForeignKey(StorageBin.rfid))
-    transaction_date = Column(DateTime(timezone=True), server_default=func.now())
+    # Indexed for the archival job's age cutoff
+    transaction_date = Column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
 
     storage_bin = relationship("StorageBin", back_populates="transactions")
 
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from Schemas.items import ItemResponse
+from Schemas.transaction import TransactionType
+
+
+class ArchivedItemResponse(ItemResponse):
+    archive_id: int
+    archived_at: datetime
+
+
+class ArchivedTransactionResponse(BaseModel):
+    archive_id: int
+    id: int
+    type: TransactionType
+    storage_bin_rfid: Optional[str]
+    reason: Optional[str]
+    transaction_date: datetime
+    archived_at: datetime
+
+    class Config:
+        from_attributes = True
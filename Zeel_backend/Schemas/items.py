@@ -20,7 +20,7 @@ class ItemBase(BaseModel):
 
     @validator("track")
     def validate_track(cls, v):
-        if v not in ItemTrackStatus:
+        if v not in [e.value for e in ItemTrackStatus]:
             raise ValueError(
                 f"track must be one of: {', '.join([e.value for e in ItemTrackStatus])}"
             )
@@ -60,6 +60,20 @@ class ItemBulkCreate(BaseModel):
     track: Optional[ItemTrackStatus] = ItemTrackStatus.INWARD
 
 
+class ItemBulkCreateResponse(BaseModel):
+    created_rfids: List[str]  # RFIDs inserted by this upload
+    skipped_rfids: List[str]  # RFIDs that already existed (or were repeated)
+
+
+class ItemLookupRequest(BaseModel):
+    rfids: List[str]
+
+
+class ItemLookupResponse(BaseModel):
+    found: List[ItemResponse]  # in request order, duplicates removed
+    missing_rfids: List[str]
+
+
 class ItemTrackUpdate(BaseModel):
     track: ItemTrackStatus
     rack_id: Optional[str] = None
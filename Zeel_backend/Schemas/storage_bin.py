@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class StorageBinBase(BaseModel):
@@ -30,3 +30,12 @@ class StorageBinResponse(StorageBinBase):
 
     class Config:
         orm_mode = True
+
+
+class StorageBinLookupRequest(BaseModel):
+    rfids: List[str]
+
+
+class StorageBinLookupResponse(BaseModel):
+    found: List[StorageBinResponse]  # in request order, duplicates removed
+    missing_rfids: List[str]
@@ -0,0 +1,70 @@
+from typing import List
+from core.cache import call_redis, redis_client
+from core.cache_metrics import cache_metrics
+
+INSPECT_SAMPLE_SIZE = 20
+SCAN_BATCH_SIZE = 500
+
+
+def _scan(key_patterns: List[str]):
+    # SCAN, not KEYS: never blocks Redis however large the namespace is
+    for pattern in key_patterns:
+        yield from redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE)
+
+
+def _inspect_keys(key_patterns: List[str]):
+    count = 0
+    sample = []
+    for key in _scan(key_patterns):
+        count += 1
+        if len(sample) < INSPECT_SAMPLE_SIZE:
+            sample.append(key)
+
+    pipe = redis_client.pipeline(transaction=False)
+    for key in sample:
+        pipe.ttl(key)
+        pipe.strlen(key)
+    results = pipe.execute()
+
+    return count, [
+        {"key": key, "ttl": results[2 * i], "bytes": results[2 * i + 1]}
+        for i, key in enumerate(sample)
+    ]
+
+
+def _delete_keys(key_patterns: List[str]) -> int:
+    deleted = 0
+    batch = []
+    for key in _scan(key_patterns):
+        batch.append(key)
+        if len(batch) >= SCAN_BATCH_SIZE:
+            deleted += redis_client.unlink(*batch)
+            batch = []
+    if batch:
+        deleted += redis_client.unlink(*batch)
+    return deleted
+
+
+def inspect_namespace(namespace: str) -> dict:
+    """
+    Key count, a sample of keys with TTL and size, and this worker's
+    metrics for a registered namespace. Raises CacheUnavailable.
+    """
+    key_patterns = cache_metrics.namespace(namespace)["key_patterns"]
+    count, sample = call_redis(_inspect_keys, key_patterns)
+    return {
+        "namespace": namespace,
+        "key_patterns": key_patterns,
+        "keys": count,
+        "sample": sample,
+        "metrics": cache_metrics.snapshot(namespace),
+    }
+
+
+def flush_namespace(namespace: str) -> int:
+    """Delete every key of a registered namespace. Raises CacheUnavailable."""
+    registered = cache_metrics.namespace(namespace)
+    deleted = call_redis(_delete_keys, registered["key_patterns"])
+    if registered["on_flush"]:
+        registered["on_flush"]()
+    return deleted
@@ -0,0 +1,109 @@
+import logging
+from typing import Iterable
+from core.cache import (
+    CacheUnavailable,
+    async_redis_client,
+    call_redis,
+    call_redis_async,
+    redis_client,
+)
+from core.cache_metrics import cache_metrics
+
+logger = logging.getLogger(__name__)
+
+# Short on purpose: a tombstone that outlives a failed invalidation only
+# hides a newly created RFID for this long.
+NEGATIVE_CACHE_TTL = 30  # seconds
+
+STORAGE_BIN_NAMESPACE = "storage_bin"
+ITEM_NAMESPACE = "item"
+
+
+def _tombstone_key(namespace: str, rfid: str) -> str:
+    return f"missing:{namespace}:{rfid}"
+
+
+def _metrics_namespace(namespace: str) -> str:
+    return f"missing:{namespace}"
+
+
+def _count_lookup(namespace: str, found: bool) -> bool:
+    if found:
+        cache_metrics.hit(_metrics_namespace(namespace))
+    else:
+        cache_metrics.miss(_metrics_namespace(namespace))
+    return found
+
+
+for _namespace in (STORAGE_BIN_NAMESPACE, ITEM_NAMESPACE):
+    cache_metrics.register(
+        _metrics_namespace(_namespace), [_tombstone_key(_namespace, "*")]
+    )
+
+
+def is_known_missing(namespace: str, rfid: str) -> bool:
+    """True if this RFID was recently looked up and not found."""
+    try:
+        with cache_metrics.timed(_metrics_namespace(namespace)):
+            found = call_redis(redis_client.exists, _tombstone_key(namespace, rfid))
+    except CacheUnavailable:
+        return False
+    return _count_lookup(namespace, bool(found))
+
+
+def mark_missing(namespace: str, rfid: str):
+    try:
+        call_redis(
+            redis_client.setex, _tombstone_key(namespace, rfid), NEGATIVE_CACHE_TTL, 1
+        )
+    except CacheUnavailable:
+        pass
+
+
+def clear_missing(namespace: str, rfids: Iterable[str]):
+    """Drop tombstones for RFIDs that now exist. Call after every create."""
+    keys = [_tombstone_key(namespace, rfid) for rfid in rfids]
+    if not keys:
+        return
+
+    try:
+        call_redis(redis_client.delete, *keys)
+    except CacheUnavailable:
+        logger.warning(f"Could not clear {len(keys)} {namespace} tombstones")
+
+
+# ----------------------------
+# Async variants
+# ----------------------------
+async def is_known_missing_async(namespace: str, rfid: str) -> bool:
+    try:
+        with cache_metrics.timed(_metrics_namespace(namespace)):
+            found = await call_redis_async(
+                async_redis_client.exists, _tombstone_key(namespace, rfid)
+            )
+    except CacheUnavailable:
+        return False
+    return _count_lookup(namespace, bool(found))
+
+
+async def mark_missing_async(namespace: str, rfid: str):
+    try:
+        await call_redis_async(
+            async_redis_client.setex,
+            _tombstone_key(namespace, rfid),
+            NEGATIVE_CACHE_TTL,
+            1,
+        )
+    except CacheUnavailable:
+        pass
+
+
+async def clear_missing_async(namespace: str, rfids: Iterable[str]):
+    keys = [_tombstone_key(namespace, rfid) for rfid in rfids]
+    if not keys:
+        return
+
+    try:
+        await call_redis_async(async_redis_client.delete, *keys)
+    except CacheUnavailable:
+        logger.warning(f"Could not clear {len(keys)} {namespace} tombstones")
@@ -1,26 +1,534 @@
+import asyncio
+import inspect
 import json
-from fastapi.encoders import jsonable_encoder
-from core.cache import redis_client  # adjust import
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from functools import partial
+from typing import Callable, Dict, List, Optional
+import redis
+from fastapi import Response
+from starlette.concurrency import run_in_threadpool
+from core.cache import (
+    CacheUnavailable,
+    async_redis_client,
+    cache_breaker,
+    call_redis,
+    call_redis_async,
+    redis_client,
+)
+from core.cache_metrics import cache_metrics
+from core.local_cache import LocalTTLCache
+from core.settings import settings
+from Utils.serialization import serialize_response
+
+logger = logging.getLogger(__name__)
 
 CACHE_TTL = 300  # 5 minutes
 
+# Single bins live under storage_bin:{rfid}, list pages under
+# storage_bins:v{generation}:...; these are also the metrics namespaces.
+STORAGE_BIN_KEY_PREFIX = "storage_bin:"
+STORAGE_BIN_LIST_KEY_PREFIX = "storage_bins:v"
+STORAGE_BIN_NAMESPACE = "storage_bin"
+STORAGE_BIN_LIST_NAMESPACE = "storage_bin_list"
+
+# Bumped on every bin write; list keys embed it, so stale pages are never
+# read again and simply age out through CACHE_TTL.
+STORAGE_BIN_LIST_GENERATION_KEY = "storage_bins:generation"
+
+# Peers drop their local copy of a key when it is published here
+INVALIDATION_CHANNEL = "storage_bins:invalidate"
+WORKER_ID = uuid.uuid4().hex
+
+# Single-flight: one recompute per key across tasks and workers
+RECOMPUTE_LOCK_TTL_MS = 5000
+RECOMPUTE_LOCK_POLL = 0.05  # seconds
+EARLY_REFRESH_BETA = 1.0  # >1 refreshes earlier, <1 later
+
+local_cache = LocalTTLCache(settings.LOCAL_CACHE_MAX_SIZE, settings.LOCAL_CACHE_TTL)
+_listener = None
+
+# Striped in-process locks; collisions only serialize a few extra misses
+_key_locks = [asyncio.Lock() for _ in range(64)]
+
+RELEASE_LOCK_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+_release_lock_script = async_redis_client.register_script(RELEASE_LOCK_SCRIPT)
+
+
+# ----------------------------
+# Circuit breaker
+# ----------------------------
+# Invalidations that could not reach Redis, replayed once it recovers
+_pending_lock = threading.Lock()
+_pending_keys = set()
+_pending_generation_bump = False
+
+
+@cache_breaker.on_open
+def _on_breaker_open():
+    logger.warning("Redis circuit open: storage bin cache bypassed")
+    # Peers' invalidations cannot reach us while Redis is down
+    local_cache.clear()
+
+
+@cache_breaker.on_close
+def _on_breaker_close():
+    logger.info("Redis circuit closed: replaying queued invalidations")
+    _replay_invalidations()
+    try:
+        start_storage_bin_cache_listener()
+    except redis.RedisError as e:
+        logger.warning(f"Storage bin cache listener not started: {e}")
+
+
+def _queue_invalidation(key: str = None, bump_generation: bool = False):
+    global _pending_generation_bump
+
+    with _pending_lock:
+        if bump_generation:
+            _pending_generation_bump = True
+        if key is None:
+            return
+        if len(_pending_keys) >= settings.CACHE_PENDING_INVALIDATIONS_MAX:
+            # Dropped keys still expire through CACHE_TTL
+            logger.warning(f"Invalidation queue full, dropping cache key {key}")
+            return
+        _pending_keys.add(key)
+
+
+def _replay_invalidations():
+    global _pending_generation_bump
+
+    with _pending_lock:
+        keys = list(_pending_keys)
+        bump_generation = _pending_generation_bump
+        _pending_keys.clear()
+        _pending_generation_bump = False
+
+    if not keys and not bump_generation:
+        return
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        if keys:
+            pipe.delete(*keys)
+        for key in keys:
+            pipe.publish(INVALIDATION_CHANNEL, f"{WORKER_ID}:{key}")
+        if bump_generation:
+            pipe.incr(STORAGE_BIN_LIST_GENERATION_KEY)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Replaying cache invalidations failed: {e}")
+        for key in keys:
+            _queue_invalidation(key)
+        _queue_invalidation(bump_generation=bump_generation)
+        cache_breaker.record_failure()
+
+
+# ----------------------------
+# Cache entries
+# ----------------------------
+# Entries hold the final HTTP response body, serialized once through the
+# response model, so a hit is served as-is without validation or
+# re-encoding. In Redis an entry is one metadata line followed by the
+# body: {"expires_at", "delta", "headers"}\n<body>. delta is how long the
+# value took to compute, used for probabilistic early refresh.
+def _decode_entry(data: str):
+    meta, _, body = data.partition("\n")
+    return {**json.loads(meta), "body": body.encode()}
+
+
+def _encode_entry(data, response_type, delta: float, headers_for):
+    """Return (entry, Redis payload) for a freshly loaded value."""
+    meta = {
+        "expires_at": time.time() + CACHE_TTL,
+        "delta": delta,
+        "headers": headers_for(data) if headers_for else {},
+    }
+    body = serialize_response(data, response_type)
+    return {**meta, "body": body}, json.dumps(meta) + "\n" + body.decode()
+
+
+def _bin_key(rfid: str) -> str:
+    return STORAGE_BIN_KEY_PREFIX + rfid
+
+
+def _namespace(key: str) -> str:
+    if key.startswith(STORAGE_BIN_LIST_KEY_PREFIX):
+        return STORAGE_BIN_LIST_NAMESPACE
+    return STORAGE_BIN_NAMESPACE
+
+
+def _local_entry(key: str):
+    entry = local_cache.get(key)
+    if entry is not None:
+        cache_metrics.hit(_namespace(key), local=True)
+    return entry
+
+
+def _remote_entry(key: str, data, count_miss: bool = True):
+    """Decode a value read from Redis, keep it locally and count the lookup."""
+    if not data:
+        if count_miss:
+            cache_metrics.miss(_namespace(key))
+        return None
+    cache_metrics.hit(_namespace(key))
+    entry = _decode_entry(data)
+    local_cache.set(key, entry)
+    return entry
+
+
+def _should_refresh_early(entry) -> bool:
+    # XFetch: refresh before expiry with rising probability as it nears
+    jitter = entry["delta"] * EARLY_REFRESH_BETA * -math.log(1.0 - random.random())
+    return time.time() + jitter >= entry["expires_at"]
+
+
+def _to_response(entry) -> Response:
+    return Response(
+        content=entry["body"], media_type="application/json", headers=entry["headers"]
+    )
+
+
+# Storage bin routes are async def, so reads and writes go through
+# async_redis_client. Loaders may be coroutine functions; plain functions
+# (sync ORM calls) are run in the threadpool.
+async def _call_loader(loader):
+    if inspect.iscoroutinefunction(loader):
+        return await loader()
+    return await run_in_threadpool(loader)
+
+
+async def _read_entry_async(key: str, count_miss: bool = True):
+    entry = _local_entry(key)
+    if entry is not None:
+        return entry
+
+    with cache_metrics.timed(_namespace(key)):
+        data = await call_redis_async(async_redis_client.get, key)
+    return _remote_entry(key, data, count_miss)
+
+
+async def _write_entry_async(
+    key: str, data, response_type, delta: float = 0.0, headers_for=None
+):
+    entry, payload = _encode_entry(data, response_type, delta, headers_for)
+
+    # Best effort: a failed write only costs a future miss
+    try:
+        with cache_metrics.timed(_namespace(key)):
+            await call_redis_async(async_redis_client.setex, key, CACHE_TTL, payload)
+        cache_metrics.write(_namespace(key), len(payload))
+        local_cache.set(key, entry)
+        await _publish_invalidation_async(key)
+    except CacheUnavailable:
+        pass
+    return entry
+
+
+async def set_storage_bin_cache_async(rfid: str, data, response_type):
+    await _write_entry_async(_bin_key(rfid), data, response_type)
 
-def get_storage_bin_cache(key: str):
-    data = redis_client.get(key)
-    if data:
-        return json.loads(data)
+
+async def delete_storage_bin_cache_async(rfid: str):
+    key = _bin_key(rfid)
+    local_cache.delete(key)
+    try:
+        await call_redis_async(async_redis_client.delete, key)
+        await _publish_invalidation_async(key)
+    except CacheUnavailable:
+        _queue_invalidation(key)
+
+
+# ----------------------------
+# Single-flight loading
+# ----------------------------
+async def _acquire_recompute_lock_async(key: str):
+    token = uuid.uuid4().hex
+    if await call_redis_async(
+        async_redis_client.set, f"lock:{key}", token, nx=True, px=RECOMPUTE_LOCK_TTL_MS
+    ):
+        return token
     return None
 
 
-def set_storage_bin_cache(key: str, data):
-    serialized_data = json.dumps(jsonable_encoder(data))
-    redis_client.setex(key, CACHE_TTL, serialized_data)
+async def _release_recompute_lock_async(key: str, token: str):
+    try:
+        await call_redis_async(_release_lock_script, keys=[f"lock:{key}"], args=[token])
+    except CacheUnavailable:
+        pass  # the lock expires on its own
+
+
+async def _load_and_store_async(
+    key: str, loader, token: str, response_type, headers_for
+):
+    try:
+        started = time.perf_counter()
+        data = await _call_loader(loader)
+        if data is None:
+            return None
+        delta = time.perf_counter() - started
+        return await _write_entry_async(key, data, response_type, delta, headers_for)
+    finally:
+        if token:
+            await _release_recompute_lock_async(key, token)
+
+
+async def _claim_async(key: str):
+    """
+    Re-check the cache, else try for the recompute lock: (entry, None) if
+    the key was refilled, else (None, token or None). The stripe lock is
+    held only for this step, never while waiting, so a slow loader does
+    not block other keys on the same stripe.
+    """
+    async with _key_locks[hash(key) % len(_key_locks)]:
+        # The miss was already counted by the caller
+        entry = await _read_entry_async(key, count_miss=False)
+        if entry is not None:
+            return entry, None
+        return None, await _acquire_recompute_lock_async(key)
+
+
+async def _get_or_load_async(key: str, loader, response_type, headers_for):
+    entry = await _read_entry_async(key)
+    if entry is not None:
+        if _should_refresh_early(entry):
+            token = await _acquire_recompute_lock_async(key)
+            if token:
+                fresh = await _load_and_store_async(
+                    key, loader, token, response_type, headers_for
+                )
+                return fresh if fresh is not None else entry
+        return entry
+
+    deadline = time.monotonic() + RECOMPUTE_LOCK_TTL_MS / 1000
+    entry, token = await _claim_async(key)
+    while entry is None and token is None and time.monotonic() < deadline:
+        await asyncio.sleep(RECOMPUTE_LOCK_POLL)
+        entry, token = await _claim_async(key)
+    if entry is not None:
+        return entry
+
+    # Lock holder died or timed out: load without the lock
+    return await _load_and_store_async(key, loader, token, response_type, headers_for)
+
+
+async def get_or_load_storage_bin_cache_async(
+    rfid: str,
+    loader: Callable,
+    response_type,
+    headers_for: Optional[Callable[[object], dict]] = None,
+) -> Optional[Response]:
+    """
+    Return the cached response for the bin, calling loader() on a miss and
+    serializing its result through response_type. Only one caller per key
+    recomputes: a short Redis lock (SET NX PX) serializes tasks and
+    workers, while the rest poll for the refilled entry without holding
+    the event loop. A loader result of None is not cached and returns None.
+
+    While Redis is unavailable (circuit open) this reads straight from
+    loader(), i.e. the database.
+    """
+    return await _get_or_load_response_async(
+        _bin_key(rfid), loader, response_type, headers_for
+    )
+
+
+async def _get_or_load_response_async(key: str, loader, response_type, headers_for):
+    try:
+        if cache_breaker.allow_request():
+            entry = await _get_or_load_async(key, loader, response_type, headers_for)
+            return _to_response(entry) if entry is not None else None
+    except CacheUnavailable:
+        pass  # raised only before loader() ran, so this never loads twice
+
+    return await _load_uncached_async(loader, response_type, headers_for)
+
+
+async def _load_uncached_async(
+    loader, response_type, headers_for
+) -> Optional[Response]:
+    data = await _call_loader(loader)
+    if data is None:
+        return None
+    headers = headers_for(data) if headers_for else {}
+    return _to_response(
+        {"body": serialize_response(data, response_type), "headers": headers}
+    )
+
+
+async def get_or_load_storage_bin_list_cache_async(
+    parts: tuple, loader: Callable, response_type, headers_for=None
+) -> Response:
+    try:
+        generation = await call_redis_async(
+            async_redis_client.get, STORAGE_BIN_LIST_GENERATION_KEY
+        )
+    except CacheUnavailable:
+        return await _load_uncached_async(loader, response_type, headers_for)
+
+    key = STORAGE_BIN_LIST_KEY_PREFIX + ":".join(map(str, [generation or 0, *parts]))
+    return await _get_or_load_response_async(key, loader, response_type, headers_for)
+
+
+async def delete_storage_bin_list_cache_async():
+    try:
+        await call_redis_async(async_redis_client.incr, STORAGE_BIN_LIST_GENERATION_KEY)
+    except CacheUnavailable:
+        _queue_invalidation(bump_generation=True)
+
+
+async def get_or_load_many_storage_bin_cache_async(
+    rfids: List[str], loader: Callable, response_type
+) -> Dict[str, bytes]:
+    """
+    Return {rfid: body} for every bin that exists. Cached entries are read
+    with one MGET; only the misses are passed to loader(missing_rfids),
+    which returns {rfid: bin} for those it found, and the loaded entries
+    are written back in one pipeline.
+    """
+    bodies = {}
+    missing = []
+    for rfid in rfids:
+        entry = _local_entry(_bin_key(rfid))
+        if entry is not None:
+            bodies[rfid] = entry["body"]
+        else:
+            missing.append(rfid)
+    if not missing:
+        return bodies
+
+    try:
+        with cache_metrics.timed(STORAGE_BIN_NAMESPACE):
+            values = await call_redis_async(
+                async_redis_client.mget, [_bin_key(rfid) for rfid in missing]
+            )
+    except CacheUnavailable:
+        loaded = await _call_loader(partial(loader, missing))
+        for rfid, data in loaded.items():
+            bodies[rfid] = serialize_response(data, response_type)
+        return bodies
+
+    still_missing = []
+    for rfid, value in zip(missing, values):
+        entry = _remote_entry(_bin_key(rfid), value)
+        if entry is not None:
+            bodies[rfid] = entry["body"]
+        else:
+            still_missing.append(rfid)
+    if not still_missing:
+        return bodies
+
+    loaded = await _call_loader(partial(loader, still_missing))
+    entries = {}
+    pipe = async_redis_client.pipeline(transaction=False)
+    for rfid, data in loaded.items():
+        key = _bin_key(rfid)
+        entry, payload = _encode_entry(data, response_type, 0.0, None)
+        entries[key] = entry
+        bodies[rfid] = entry["body"]
+        pipe.setex(key, CACHE_TTL, payload)
+        pipe.publish(INVALIDATION_CHANNEL, f"{WORKER_ID}:{key}")
+        cache_metrics.write(STORAGE_BIN_NAMESPACE, len(payload))
+
+    # Best effort, as in _write_entry_async
+    try:
+        if entries:
+            with cache_metrics.timed(STORAGE_BIN_NAMESPACE):
+                await call_redis_async(pipe.execute)
+            for key, entry in entries.items():
+                local_cache.set(key, entry)
+    except CacheUnavailable:
+        pass
+    return bodies
+
+
+# ----------------------------
+# Cross-worker invalidation
+# ----------------------------
+def _publish_invalidation(key: str):
+    call_redis(redis_client.publish, INVALIDATION_CHANNEL, f"{WORKER_ID}:{key}")
+
+
+async def _publish_invalidation_async(key: str):
+    await call_redis_async(
+        async_redis_client.publish, INVALIDATION_CHANNEL, f"{WORKER_ID}:{key}"
+    )
+
+
+def _handle_invalidation(message):
+    sender, _, key = message["data"].partition(":")
+    if sender == WORKER_ID:
+        return
+    if key == "*":
+        local_cache.clear()
+    else:
+        local_cache.delete(key)
+
+
+def _clear_local_caches():
+    # After a namespace flush: drop local copies here and on every peer
+    local_cache.clear()
+    try:
+        _publish_invalidation("*")
+    except CacheUnavailable:
+        pass
+
+
+def _bump_list_generation():
+    # Sync: runs from the admin flush endpoint, outside the event loop
+    try:
+        call_redis(redis_client.incr, STORAGE_BIN_LIST_GENERATION_KEY)
+    except CacheUnavailable:
+        _queue_invalidation(bump_generation=True)
+
+
+def _flush_storage_bin_lists():
+    _bump_list_generation()
+    _clear_local_caches()
+
+
+cache_metrics.register(
+    STORAGE_BIN_NAMESPACE,
+    [STORAGE_BIN_KEY_PREFIX + "*"],
+    on_flush=_clear_local_caches,
+)
+cache_metrics.register(
+    STORAGE_BIN_LIST_NAMESPACE,
+    [STORAGE_BIN_LIST_KEY_PREFIX + "*"],
+    on_flush=_flush_storage_bin_lists,
+)
+
+
+def _handle_listener_error(error, pubsub, thread):
+    # Messages may have been missed while disconnected
+    logger.warning(f"Storage bin cache listener error: {error}")
+    local_cache.clear()
+
 
+def start_storage_bin_cache_listener():
+    global _listener
+    if _listener is not None:
+        return
 
-def delete_storage_bin_cache(key: str):
-    redis_client.delete(key)
+    pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(**{INVALIDATION_CHANNEL: _handle_invalidation})
+    _listener = pubsub.run_in_thread(
+        sleep_time=1.0, daemon=True, exception_handler=_handle_listener_error
+    )
 
 
-def delete_storage_bin_list_cache():
-    for key in redis_client.scan_iter("storage_bins:*"):
-        redis_client.delete(key)
+def stop_storage_bin_cache_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
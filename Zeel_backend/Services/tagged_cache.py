@@ -0,0 +1,295 @@
+import inspect
+import json
+import logging
+import threading
+from enum import Enum
+from functools import wraps
+from typing import Callable, Dict, Iterable, List
+from fastapi import Response
+from core.cache import (
+    CacheUnavailable,
+    async_redis_client,
+    cache_breaker,
+    call_redis,
+    call_redis_async,
+    redis_client,
+)
+from core.cache_metrics import cache_metrics
+from core.settings import settings
+from Utils.serialization import serialize_response
+
+logger = logging.getLogger(__name__)
+
+TAGGED_CACHE_TTL = 3600  # 1 hour; tags invalidate long before this
+
+# Each tag is a counter in Redis. An entry records the counters of its tags
+# when it was computed and is only served while they are unchanged, so
+# invalidating a tag is a single INCR however many entries carry it.
+TAG_KEY_PREFIX = "tag:"
+CACHE_KEY_PREFIX = "cache:"
+
+_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+# ----------------------------
+# Tags
+# ----------------------------
+def rack_tags(*rack_ids) -> List[str]:
+    return ["rack:*", *(f"rack:{rack_id}" for rack_id in rack_ids if rack_id)]
+
+
+def sku_tags(*sku_ids) -> List[str]:
+    return ["sku:*", *(f"sku:{sku_id}" for sku_id in sku_ids if sku_id)]
+
+
+def item_tags(*rfids) -> List[str]:
+    # Item entries also carry "item:*", bumped by set-based bulk writes
+    return [f"item:{rfid}" for rfid in rfids if rfid]
+
+
+# ----------------------------
+# Circuit breaker
+# ----------------------------
+# Tags that could not be bumped while Redis was down, replayed on recovery
+_pending_lock = threading.Lock()
+_pending_tags = set()
+
+
+@cache_breaker.on_close
+def _on_breaker_close():
+    _replay_invalidations()
+
+
+def _queue_invalidation(tags: Iterable[str]):
+    with _pending_lock:
+        for tag in tags:
+            if len(_pending_tags) >= settings.CACHE_PENDING_INVALIDATIONS_MAX:
+                # Dropped tags still expire through TAGGED_CACHE_TTL
+                logger.warning(f"Invalidation queue full, dropping cache tag {tag}")
+                return
+            _pending_tags.add(tag)
+
+
+def _replay_invalidations():
+    with _pending_lock:
+        tags = list(_pending_tags)
+        _pending_tags.clear()
+
+    if tags:
+        logger.info(f"Replaying {len(tags)} queued cache tag invalidations")
+        invalidate_tags(*tags)
+
+
+def invalidate_tags(*tags: str):
+    """Invalidate every cached entry carrying any of tags."""
+    if not tags:
+        return
+
+    pipe = redis_client.pipeline(transaction=False)
+    for tag in tags:
+        pipe.incr(TAG_KEY_PREFIX + tag)
+
+    try:
+        call_redis(pipe.execute)
+    except CacheUnavailable:
+        _queue_invalidation(tags)
+
+
+async def invalidate_tags_async(*tags: str):
+    """Async invalidate_tags, for writes made from async def routes."""
+    if not tags:
+        return
+
+    pipe = async_redis_client.pipeline(transaction=False)
+    for tag in tags:
+        pipe.incr(TAG_KEY_PREFIX + tag)
+
+    try:
+        await call_redis_async(pipe.execute)
+    except CacheUnavailable:
+        _queue_invalidation(tags)
+
+
+# ----------------------------
+# Entries
+# ----------------------------
+# An entry is one metadata line followed by the serialized response body:
+# {"versions": [...]}\n<body>
+def _cache_key(namespace: str, arguments: dict) -> str:
+    parts = [
+        f"{name}={value.value if isinstance(value, Enum) else value}"
+        for name, value in sorted(arguments.items())
+        if isinstance(value, (Enum, *_KEY_TYPES))
+    ]
+    return CACHE_KEY_PREFIX + ":".join([namespace, *parts])
+
+
+def _valid_body(data, versions: List[str]):
+    """The entry's body if its tag versions are still current, else None."""
+    if data:
+        meta, _, body = data.partition("\n")
+        if json.loads(meta)["versions"] == versions:
+            return body.encode()
+    return None
+
+
+def _payload(versions: List[str], body: bytes) -> str:
+    return json.dumps({"versions": versions}) + "\n" + body.decode()
+
+
+def _read_entry(namespace: str, key: str, tag_keys: List[str]):
+    """Return (body or None, current tag versions) in one round trip."""
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.get(key)
+    pipe.mget(tag_keys)
+    with cache_metrics.timed(namespace):
+        data, versions = call_redis(pipe.execute)
+    versions = [version or "0" for version in versions]
+
+    body = _valid_body(data, versions)
+    if body is not None:
+        cache_metrics.hit(namespace)
+    else:
+        cache_metrics.miss(namespace)
+    return body, versions
+
+
+def _write_entry(namespace: str, key: str, versions: List[str], body: bytes, ttl: int):
+    # Best effort: a failed write only costs a future miss
+    payload = _payload(versions, body)
+    try:
+        with cache_metrics.timed(namespace):
+            call_redis(redis_client.setex, key, ttl, payload)
+        cache_metrics.write(namespace, len(payload))
+    except CacheUnavailable:
+        pass
+
+
+def _register(namespace: str):
+    cache_metrics.register(
+        namespace,
+        [f"{CACHE_KEY_PREFIX}{namespace}", f"{CACHE_KEY_PREFIX}{namespace}:*"],
+    )
+
+
+def _to_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def cached(namespace: str, response_type, tags: List[str], ttl: int = TAGGED_CACHE_TTL):
+    """
+    Cache a route handler's response in Redis under tags.
+
+    The key is built from namespace and the handler's plain arguments
+    (path and query parameters; the DB session and other objects are
+    skipped). Tags are format strings over the same arguments, e.g.
+    "rack:{rack_id}"; invalidate_tags() on any of them drops the entry.
+    The result is serialized through response_type once and served as-is
+    on later hits. Exceptions such as a 404 HTTPException are not cached.
+
+    While Redis is unavailable the handler is called directly.
+    """
+
+    _register(namespace)
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+
+            key = _cache_key(namespace, arguments)
+            tag_keys = [TAG_KEY_PREFIX + tag.format(**arguments) for tag in tags]
+
+            try:
+                body, versions = _read_entry(namespace, key, tag_keys)
+            except CacheUnavailable:
+                return _to_response(
+                    serialize_response(func(*args, **kwargs), response_type)
+                )
+
+            if body is not None:
+                return _to_response(body)
+
+            # versions were read before loading, so an invalidation racing
+            # with this load leaves the stored entry already stale
+            body = serialize_response(func(*args, **kwargs), response_type)
+            _write_entry(namespace, key, versions, body, ttl)
+            return _to_response(body)
+
+        return wrapper
+
+    return decorator
+
+
+def get_or_load_many(
+    namespace: str,
+    response_type,
+    tags: List[str],
+    argument: str,
+    values: List[str],
+    loader: Callable,
+    ttl: int = TAGGED_CACHE_TTL,
+) -> Dict[str, bytes]:
+    """
+    Batch form of cached() for a handler whose only plain argument is
+    `argument`, sharing its entries. Returns {value: body} for every value
+    that exists: entries and tag versions are read in one round trip, only
+    the misses are passed to loader(missing_values), which returns
+    {value: result}, and those are written back in one pipeline.
+    """
+
+    def tag_keys_for(value):
+        return [TAG_KEY_PREFIX + tag.format(**{argument: value}) for tag in tags]
+
+    keys = [_cache_key(namespace, {argument: value}) for value in values]
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.mget(keys)
+        pipe.mget([tag_key for value in values for tag_key in tag_keys_for(value)])
+        with cache_metrics.timed(namespace):
+            entries, versions = call_redis(pipe.execute)
+    except CacheUnavailable:
+        return {
+            value: serialize_response(result, response_type)
+            for value, result in loader(values).items()
+        }
+
+    bodies = {}
+    entry_versions = {}
+    for index, (value, data) in enumerate(zip(values, entries)):
+        current = [
+            version or "0"
+            for version in versions[index * len(tags) : (index + 1) * len(tags)]
+        ]
+        body = _valid_body(data, current)
+        if body is not None:
+            bodies[value] = body
+        else:
+            entry_versions[value] = current
+
+    cache_metrics.hit(namespace, len(bodies))
+    cache_metrics.miss(namespace, len(entry_versions))
+    if not entry_versions:
+        return bodies
+
+    pipe = redis_client.pipeline(transaction=False)
+    for value, result in loader(list(entry_versions)).items():
+        body = serialize_response(result, response_type)
+        bodies[value] = body
+        payload = _payload(entry_versions[value], body)
+        pipe.setex(_cache_key(namespace, {argument: value}), ttl, payload)
+        cache_metrics.write(namespace, len(payload))
+
+    # Best effort, as in _write_entry
+    try:
+        if len(pipe):
+            with cache_metrics.timed(namespace):
+                call_redis(pipe.execute)
+    except CacheUnavailable:
+        pass
+    return bodies
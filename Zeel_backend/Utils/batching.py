@@ -0,0 +1,11 @@
+from typing import Iterator, Sequence, TypeVar
+
+from core.constants import MAX_BULK_RFIDS
+
+T = TypeVar("T")
+
+
+def chunked(values: Sequence[T], size: int = MAX_BULK_RFIDS) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most `size` elements."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
@@ -0,0 +1,16 @@
+from sqlalchemy.exc import IntegrityError
+
+UNIQUE_VIOLATION = "23505"  # SQLSTATE
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """Whether error is a unique constraint violation (not e.g. a foreign key)."""
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(
+        error.orig, "pgcode", None
+    )
+    if sqlstate:
+        return sqlstate == UNIQUE_VIOLATION
+
+    # SQLite: "UNIQUE constraint failed"; MySQL: "Duplicate entry"
+    message = str(error.orig).lower()
+    return "unique" in message or "duplicate" in message
@@ -0,0 +1,54 @@
+import csv
+import enum
+import io
+import json
+from datetime import datetime
+from typing import Iterable, Iterator, Mapping, Sequence
+
+from core.constants import EXPORT_BATCH_SIZE
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_ndjson(
+    rows: Iterable[Mapping], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[str]:
+    """Serialize rows to newline-delimited JSON, one chunk per batch."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({key: _plain(value) for key, value in row.items()}))
+        if len(lines) >= batch_size:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(
+    rows: Iterable[Mapping],
+    fieldnames: Sequence[str],
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
+    """Serialize rows to CSV with a header line, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fieldnames)
+
+    count = 0
+    for row in rows:
+        writer.writerow([_plain(row[name]) for name in fieldnames])
+        count += 1
+        if count >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+
+    yield buffer.getvalue()
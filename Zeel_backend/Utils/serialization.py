@@ -0,0 +1,52 @@
+import json
+from functools import lru_cache
+from typing import List
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def serialize_response(data, response_type) -> bytes:
+    """Validate ORM rows/dicts through a response model and dump JSON bytes."""
+    if isinstance(data, bytes):
+        return data  # already serialized, e.g. by serialize_rows
+    adapter = _adapter(response_type)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def response_columns(model, response_type) -> list:
+    """
+    The model's columns for response_type's fields, in field order, for a
+    select() whose rows serialize_rows can dump as that response.
+    Relationship fields are left out; callers add them.
+    """
+    columns = model.__table__.columns
+    return [
+        getattr(model, name) for name in response_type.model_fields if name in columns
+    ]
+
+
+def serialize_rows(rows) -> bytes:
+    """
+    Dump Core rows (or dicts) holding exactly a response model's fields as
+    a JSON array, without building or validating a model per row. Values
+    are encoded the way the model would dump them (ISO datetimes, enum
+    values).
+    """
+    return to_json([row if isinstance(row, dict) else row._asdict() for row in rows])
+
+
+def lookup_response_body(found: List[bytes], missing_rfids: List[str]) -> bytes:
+    """Join pre-serialized entries into {"found": [...], "missing_rfids": [...]}."""
+    return (
+        b'{"found":['
+        + b",".join(found)
+        + b'],"missing_rfids":'
+        + json.dumps(missing_rfids).encode()
+        + b"}"
+    )
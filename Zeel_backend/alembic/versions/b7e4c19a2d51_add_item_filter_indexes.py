@@ -0,0 +1,74 @@
+"""add_item_filter_indexes
+
+Revision ID: b7e4c19a2d51
+Revises: 673766d9caf3
+Create Date: 2026-10-18 10:12:41.218734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4c19a2d51"
+down_revision: Union[str, Sequence[str], None] = "673766d9caf3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INWARD_ONLY = sa.text("track = 'INWARD'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block on PostgreSQL
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_track_sku_id",
+            "items",
+            ["track", "sku_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_items_rack_id_track",
+            "items",
+            ["rack_id", "track"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_items_inward_sku_id",
+            "items",
+            ["sku_id"],
+            postgresql_where=INWARD_ONLY,
+            sqlite_where=INWARD_ONLY,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_items_status"),
+            "items",
+            ["status"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_items_storage_bin_rfid"),
+            "items",
+            ["storage_bin_rfid"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_requests_request_date"),
+            "requests",
+            ["request_date"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_requests_request_date"), table_name="requests")
+    op.drop_index(op.f("ix_items_storage_bin_rfid"), table_name="items")
+    op.drop_index(op.f("ix_items_status"), table_name="items")
+    op.drop_index("ix_items_inward_sku_id", table_name="items")
+    op.drop_index("ix_items_rack_id_track", table_name="items")
+    op.drop_index("ix_items_track_sku_id", table_name="items")
@@ -0,0 +1,97 @@
+"""add_archive_tables
+
+Revision ID: c3d8f5a61e07
+Revises: b7e4c19a2d51
+Create Date: 2026-10-18 16:40:12.504311
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d8f5a61e07"
+down_revision: Union[str, Sequence[str], None] = "b7e4c19a2d51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The hot tables' enum types, shared rather than created again
+ITEM_TRACK = postgresql.ENUM(
+    "INWARD", "OUTWARD", "RETURN", name="itemtrackstatus", create_type=False
+)
+TRANSACTION_TYPE = postgresql.ENUM(
+    "INWARD", "OUTWARD", "RETURN", name="transactiontype", create_type=False
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "items_archive",
+        sa.Column("archive_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("rfid", sa.String(length=100), nullable=True),
+        sa.Column("sku_id", sa.Integer(), nullable=False),
+        sa.Column("rack_id", sa.String(length=100), nullable=True),
+        sa.Column("storage_bin_rfid", sa.String(length=100), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=True),
+        sa.Column("track", ITEM_TRACK, nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("archive_id"),
+    )
+    op.create_index(op.f("ix_items_archive_id"), "items_archive", ["id"])
+    op.create_index(op.f("ix_items_archive_rfid"), "items_archive", ["rfid"])
+    op.create_index(op.f("ix_items_archive_sku_id"), "items_archive", ["sku_id"])
+    op.create_index(op.f("ix_items_archive_rack_id"), "items_archive", ["rack_id"])
+
+    op.create_table(
+        "transactions_archive",
+        sa.Column("archive_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("type", TRANSACTION_TYPE, nullable=False),
+        sa.Column("reason", sa.String(length=255), nullable=True),
+        sa.Column("storage_bin_rfid", sa.String(length=100), nullable=True),
+        sa.Column("transaction_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("archive_id"),
+    )
+    op.create_index(op.f("ix_transactions_archive_id"), "transactions_archive", ["id"])
+    op.create_index(
+        op.f("ix_transactions_archive_storage_bin_rfid"),
+        "transactions_archive",
+        ["storage_bin_rfid"],
+    )
+    op.create_index(
+        op.f("ix_transactions_archive_transaction_date"),
+        "transactions_archive",
+        ["transaction_date"],
+    )
+
+    # The archival job's age cutoff on the hot table
+    op.create_index(
+        op.f("ix_transactions_transaction_date"),
+        "transactions",
+        ["transaction_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_transactions_transaction_date"), table_name="transactions")
+    op.drop_table("transactions_archive")
+    op.drop_table("items_archive")
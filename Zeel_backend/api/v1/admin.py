@@ -1,10 +1,14 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from Database.database import get_db
 from Schemas.user import UserCreate, UserResponse
 from Crud import crud_user as user_crud
+from core.cache import CacheUnavailable
+from core.cache_metrics import cache_metrics
+from Services.cache_admin import flush_namespace, inspect_namespace
+from Utils.serialization import serialize_rows
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -22,7 +26,10 @@ def create_user_api(request: UserCreate, db: Session = Depends(get_db)):
 
 @router.get("/users", response_model=List[UserResponse])
 def get_all_users_api(db: Session = Depends(get_db)):
-    return user_crud.get_all_users(db)
+    return Response(
+        content=serialize_rows(user_crud.get_user_rows(db)),
+        media_type="application/json",
+    )
 
 
 @router.delete("/users/{username}")
@@ -33,3 +40,36 @@ def delete_user_api(username: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="User not found")
 
     return {"message": f"User '{username}' deleted successfully"}
+
+
+# ----------------------------
+# Cache
+# ----------------------------
+def _registered_namespace(namespace: str) -> str:
+    if cache_metrics.namespace(namespace) is None:
+        raise HTTPException(status_code=404, detail="Unknown cache namespace")
+    return namespace
+
+
+@router.get("/cache/metrics")
+def get_cache_metrics():
+    # Counters are per worker process
+    return {"namespaces": cache_metrics.snapshot()}
+
+
+@router.get("/cache/{namespace}")
+def inspect_cache_namespace(namespace: str = Depends(_registered_namespace)):
+    try:
+        return inspect_namespace(namespace)
+    except CacheUnavailable:
+        raise HTTPException(status_code=503, detail="Cache unavailable")
+
+
+@router.delete("/cache/{namespace}")
+def flush_cache_namespace(namespace: str = Depends(_registered_namespace)):
+    try:
+        deleted = flush_namespace(namespace)
+    except CacheUnavailable:
+        raise HTTPException(status_code=503, detail="Cache unavailable")
+
+    return {"message": f"Cache namespace '{namespace}' flushed", "deleted": deleted}
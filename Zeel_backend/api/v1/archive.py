@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from Database.replica import get_read_db
+from core.dependencies import get_after_id
+from core.pagination import next_cursor_headers
+from Schemas.archive import ArchivedItemResponse, ArchivedTransactionResponse
+from Crud import crud_archive as archive_crud
+from Utils.serialization import serialize_rows
+
+router = APIRouter(prefix="/archive", tags=["Archive"])
+
+
+def _rows_response(rows, limit: int) -> Response:
+    # Paged by archive_id: a source id may recur once reused and re-archived
+    return Response(
+        content=serialize_rows(rows),
+        media_type="application/json",
+        headers=next_cursor_headers(rows, limit, key="archive_id"),
+    )
+
+
+@router.get("/items", response_model=List[ArchivedItemResponse])
+def get_archived_items(
+    limit: int = 100,
+    rfid: Optional[str] = None,
+    sku_id: Optional[int] = None,
+    rack_id: Optional[str] = None,
+    after_id: Optional[int] = Depends(get_after_id),
+    db: Session = Depends(get_read_db),
+):
+    rows = archive_crud.get_archived_item_rows(
+        db, limit, rfid=rfid, sku_id=sku_id, rack_id=rack_id, after_id=after_id
+    )
+    return _rows_response(rows, limit)
+
+
+@router.get("/transactions", response_model=List[ArchivedTransactionResponse])
+def get_archived_transactions(
+    limit: int = 100,
+    storage_bin_rfid: Optional[str] = None,
+    after_id: Optional[int] = Depends(get_after_id),
+    db: Session = Depends(get_read_db),
+):
+    rows = archive_crud.get_archived_transaction_rows(
+        db, limit, storage_bin_rfid=storage_bin_rfid, after_id=after_id
+    )
+    return _rows_response(rows, limit)
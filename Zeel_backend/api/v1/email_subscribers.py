@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -6,6 +6,7 @@ from Database.database import get_db
 from Schemas.email_subscriber import EmailSubscriberCreate, EmailSubscriberResponse
 from Crud import crud_email_subsriber as subscriber_crud
 from Utils.email_service import send_email
+from Utils.serialization import serialize_rows
 
 router = APIRouter(prefix="/email-subscribers", tags=["Email Subscribers"])
 
@@ -22,7 +23,10 @@ def add_email_subscriber(request: EmailSubscriberCreate, db: Session = Depends(g
 
 @router.get("/all", response_model=List[EmailSubscriberResponse])
 def get_all_subscribers(db: Session = Depends(get_db)):
-    return subscriber_crud.get_all_subscribers(db)
+    return Response(
+        content=serialize_rows(subscriber_crud.get_subscriber_rows(db)),
+        media_type="application/json",
+    )
 
 
 @router.get("/active", response_model=List[EmailSubscriberResponse])
@@ -0,0 +1,94 @@
+import time
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+
+from Database.database import async_engine, engine
+from Database.pool import pool_status
+from Database.replica import replica_router
+from core.cache import async_redis_client, cache_breaker
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _ping_db() -> dict:
+    # Includes the pool checkout, so a saturated pool shows up here
+    started = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    return {"status": "ok", "latency_ms": _elapsed_ms(started)}
+
+
+async def _ping_async_db() -> dict:
+    started = time.perf_counter()
+    try:
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    return {"status": "ok", "latency_ms": _elapsed_ms(started)}
+
+
+async def _ping_redis() -> dict:
+    # Straight to Redis, bypassing the circuit breaker, to report its real state
+    started = time.perf_counter()
+    try:
+        await async_redis_client.ping()
+    except RedisError as e:
+        return {"status": "error", "error": str(e), "breaker": cache_breaker.state}
+    return {
+        "status": "ok",
+        "latency_ms": _elapsed_ms(started),
+        "breaker": cache_breaker.state,
+    }
+
+
+@router.get("/deep")
+async def deep_health():
+    """
+    Database and Redis round trips plus connection pool usage for this
+    worker. 503 if the database is unreachable; Redis is optional, so a
+    Redis failure only reports "degraded". A lagging or unreachable read
+    replica is reported but does not change the status: reads fall back
+    to the primary.
+    """
+    database = await run_in_threadpool(_ping_db)
+    async_database = await _ping_async_db()
+    redis_status = await _ping_redis()
+    replica = await run_in_threadpool(replica_router.status)
+
+    if database["status"] != "ok" or async_database["status"] != "ok":
+        status = "error"
+    elif redis_status["status"] != "ok":
+        status = "degraded"
+    else:
+        status = "ok"
+
+    return JSONResponse(
+        status_code=503 if status == "error" else 200,
+        content={
+            "status": status,
+            "database": database,
+            "async_database": async_database,
+            "redis": redis_status,
+            "replica": replica,
+            "pools": {
+                "database": pool_status(engine.pool),
+                "async_database": pool_status(async_engine.pool),
+                **(
+                    {"replica": pool_status(replica_router.engine.pool)}
+                    if replica_router.configured
+                    else {}
+                ),
+            },
+        },
+    )
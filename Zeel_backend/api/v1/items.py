@@ -1,33 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException
+from enum import Enum
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
 
 from Database.database import get_db
+from Database.replica import get_read_db
+from core.dependencies import get_after_id
+from core.pagination import next_cursor_headers
 from Schemas.items import (
     ItemCreate,
     ItemUpdate,
     ItemResponse,
     ItemBulkCreate,
+    ItemBulkCreateResponse,
+    ItemLookupRequest,
+    ItemLookupResponse,
     ItemTrackUpdate,
     ItemFilter,
 )
 from Models.items import ItemTrackStatus
 from Crud import crud_items as items_crud
+from Services.negative_cache import (
+    ITEM_NAMESPACE,
+    clear_missing,
+    is_known_missing,
+    mark_missing,
+)
+from Services.tagged_cache import cached, get_or_load_many
+from Utils.export import iter_csv, iter_ndjson
+from Utils.db_errors import is_unique_violation
+from Utils.serialization import lookup_response_body, serialize_rows
 
 router = APIRouter(prefix="/items", tags=["Items"])
 logger = logging.getLogger(__name__)
 
+# Shared by GET /rfid/{rfid} and POST /lookup, which reuse each other's entries
+ITEM_CACHE_TAGS = ["item:*", "item:{rfid}"]
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
 
 @router.post("/", response_model=ItemResponse)
 def create_item(item: ItemCreate, db: Session = Depends(get_db)):
-    if items_crud.get_item_by_rfid(db, item.rfid):
+    # The unique index on rfid rejects duplicates; no lookup beforehand
+    try:
+        new_item = items_crud.create_item(db, item.dict())
+    except IntegrityError as e:
+        db.rollback()
+        if not is_unique_violation(e):
+            raise
         raise HTTPException(status_code=400, detail="RFID already exists")
+    clear_missing(ITEM_NAMESPACE, [new_item.rfid])
 
-    return items_crud.create_item(db, item.dict())
+    return new_item
 
 
-@router.post("/bulk_upload", response_model=List[ItemResponse])
+@router.post("/bulk_upload", response_model=ItemBulkCreateResponse)
 def bulk_upload(items: ItemBulkCreate, db: Session = Depends(get_db)):
     items_data = [
         {
@@ -40,7 +74,12 @@ def bulk_upload(items: ItemBulkCreate, db: Session = Depends(get_db)):
         for rfid in items.rfids
     ]
 
-    return items_crud.bulk_create_items(db, items_data)
+    created_rfids, skipped_rfids = items_crud.bulk_create_items(db, items_data)
+    clear_missing(ITEM_NAMESPACE, created_rfids)
+
+    return ItemBulkCreateResponse(
+        created_rfids=created_rfids, skipped_rfids=skipped_rfids
+    )
 
 
 @router.get("/", response_model=List[ItemResponse])
@@ -51,9 +90,18 @@ def get_items(
     status: Optional[str] = None,
     sku_id: Optional[int] = None,
     rack_id: Optional[str] = None,
-    db: Session = Depends(get_db),
+    after_id: Optional[int] = Depends(get_after_id),
+    db: Session = Depends(get_read_db),
 ):
-    return items_crud.get_items(db, skip, limit, track, status, sku_id, rack_id)
+    # Core rows of the response columns, dumped without per-row validation
+    rows = items_crud.get_item_rows(
+        db, skip, limit, track, status, sku_id, rack_id, after_id=after_id
+    )
+    return Response(
+        content=serialize_rows(rows),
+        media_type="application/json",
+        headers=next_cursor_headers(rows, limit),
+    )
 
 
 @router.post("/filter", response_model=List[ItemResponse])
@@ -61,8 +109,27 @@ def filter_items(filters: ItemFilter, db: Session = Depends(get_db)):
     return items_crud.filter_items(db, filters)
 
 
+@router.post("/filter/export")
+def export_filtered_items(
+    filters: ItemFilter,
+    format: ExportFormat = ExportFormat.NDJSON,
+    db: Session = Depends(get_db),
+):
+    rows = items_crud.stream_filtered_items(db, filters)
+
+    if format == ExportFormat.CSV:
+        fieldnames = [column.key for column in items_crud.ITEM_EXPORT_COLUMNS]
+        return StreamingResponse(
+            iter_csv(rows, fieldnames),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="items.csv"'},
+        )
+
+    return StreamingResponse(iter_ndjson(rows), media_type="application/x-ndjson")
+
+
 @router.get("/{item_id}", response_model=ItemResponse)
-def get_item(item_id: int, db: Session = Depends(get_db)):
+def get_item(item_id: int, db: Session = Depends(get_read_db)):
     item = items_crud.get_item_by_id(db, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
@@ -70,13 +137,45 @@ def get_item(item_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/rfid/{rfid}", response_model=ItemResponse)
+@cached("item", ItemResponse, tags=ITEM_CACHE_TAGS)
 def get_item_by_rfid(rfid: str, db: Session = Depends(get_db)):
+    # Stray tags: skip the DB while a recent lookup said "not found"
+    if is_known_missing(ITEM_NAMESPACE, rfid):
+        raise HTTPException(status_code=404, detail="Item not found")
+
     item = items_crud.get_item_by_rfid(db, rfid)
     if not item:
+        mark_missing(ITEM_NAMESPACE, rfid)
         raise HTTPException(status_code=404, detail="Item not found")
     return item
 
 
+@router.post("/lookup", response_model=ItemLookupResponse)
+def lookup_items(payload: ItemLookupRequest, db: Session = Depends(get_db)):
+    if not payload.rfids:
+        raise HTTPException(status_code=400, detail="RFID list cannot be empty")
+
+    rfids = list(dict.fromkeys(payload.rfids))
+
+    def load_items(missing_rfids):
+        return {
+            item.rfid: item for item in items_crud.get_items_by_rfids(db, missing_rfids)
+        }
+
+    # One round trip for cached entries, one IN query for the rest
+    bodies = get_or_load_many(
+        "item", ItemResponse, ITEM_CACHE_TAGS, "rfid", rfids, load_items
+    )
+
+    return Response(
+        content=lookup_response_body(
+            [bodies[rfid] for rfid in rfids if rfid in bodies],
+            [rfid for rfid in rfids if rfid not in bodies],
+        ),
+        media_type="application/json",
+    )
+
+
 @router.put("/{item_id}", response_model=ItemResponse)
 def update_item(item_id: int, item_update: ItemUpdate, db: Session = Depends(get_db)):
     item = items_crud.get_item_by_id(db, item_id)
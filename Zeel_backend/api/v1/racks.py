@@ -1,25 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 
 from Database.database import get_db
 from Schemas.rack import RackCreate, RackUpdate, RackResponse
 from Crud import crud_rack as rack_crud
+from Services.tagged_cache import cached
+from Utils.db_errors import is_unique_violation
+from Utils.serialization import serialize_rows
 
 router = APIRouter(prefix="/racks", tags=["Racks"])
 
 
 @router.post("/add", response_model=RackResponse, status_code=status.HTTP_201_CREATED)
 def create_rack(rack: RackCreate, db: Session = Depends(get_db)):
-    return rack_crud.create_rack(db, rack_id=rack.rack_id, location=rack.location)
+    try:
+        return rack_crud.create_rack(db, rack_id=rack.rack_id, location=rack.location)
+    except IntegrityError as e:
+        db.rollback()
+        if not is_unique_violation(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Rack already exists"
+        )
 
 
 @router.get("/get_all", response_model=List[RackResponse])
+@cached("racks", List[RackResponse], tags=["rack:*"])
 def get_all_racks(db: Session = Depends(get_db)):
-    return rack_crud.get_all_racks(db)
+    return serialize_rows(rack_crud.get_rack_rows(db))
 
 
 @router.get("/{rack_id}", response_model=RackResponse)
+@cached("rack", RackResponse, tags=["rack:*", "rack:{rack_id}"])
 def get_rack_by_id(rack_id: str, db: Session = Depends(get_db)):
     rack = rack_crud.get_rack_by_id(db, rack_id)
     if not rack:
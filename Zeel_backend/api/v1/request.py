@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 
 from Database.database import get_db
+from Database.replica import get_read_db
 from Schemas.request import RequestCreate, RequestResponse
 from Crud import crud_request as request_crud
+from Utils.serialization import serialize_rows
 
 router = APIRouter(prefix="/requests", tags=["Requests"])
 
@@ -17,12 +19,15 @@ def create_request(request_data: RequestCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/get_all", response_model=List[RequestResponse])
-def get_all_requests(db: Session = Depends(get_db)):
-    return request_crud.get_all_requests(db)
+def get_all_requests(db: Session = Depends(get_read_db)):
+    return Response(
+        content=serialize_rows(request_crud.get_request_rows(db)),
+        media_type="application/json",
+    )
 
 
 @router.get("/get/{request_id}", response_model=RequestResponse)
-def get_request(request_id: int, db: Session = Depends(get_db)):
+def get_request(request_id: int, db: Session = Depends(get_read_db)):
     req = request_crud.get_request_by_id(db, request_id)
     if not req:
         raise HTTPException(
@@ -1,30 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 
 from Database.database import get_db
 from Schemas.sku import SKUCreate, SKUUpdate, SKUResponse
 from Crud import crud_sku as sku_crud
+from Services.tagged_cache import cached
+from Utils.db_errors import is_unique_violation
+from Utils.serialization import serialize_rows
 
 router = APIRouter(prefix="/skus", tags=["SKU"])
 
 
 @router.post("/add", response_model=SKUResponse, status_code=status.HTTP_201_CREATED)
 def create_sku(sku: SKUCreate, db: Session = Depends(get_db)):
-    if sku_crud.get_sku_by_code(db, sku.sku_code):
+    try:
+        return sku_crud.create_sku(db, sku.dict())
+    except IntegrityError as e:
+        db.rollback()
+        if not is_unique_violation(e):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="SKU already exists"
         )
 
-    return sku_crud.create_sku(db, sku.dict())
-
 
 @router.get("/get_all", response_model=List[SKUResponse])
+@cached("skus", List[SKUResponse], tags=["sku:*"])
 def get_all_skus(db: Session = Depends(get_db)):
-    return sku_crud.get_all_skus(db)
+    return serialize_rows(sku_crud.get_sku_rows(db))
 
 
 @router.get("/get/{sku_id}", response_model=SKUResponse)
+@cached("sku", SKUResponse, tags=["sku:{sku_id}"])
 def get_sku(sku_id: int, db: Session = Depends(get_db)):
     sku = sku_crud.get_sku_by_id(db, sku_id)
     if not sku:
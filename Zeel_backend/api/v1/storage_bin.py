@@ -1,42 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-
-from Database.database import get_db
-from Schemas.storage_bin import StorageBinCreate, StorageBinUpdate, StorageBinResponse
+from fastapi import APIRouter, Depends, HTTPException, Response
+from functools import partial
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from Database.database import get_async_db
+from core.dependencies import get_after_id
+from core.pagination import next_cursor_headers
+from Schemas.storage_bin import (
+    StorageBinCreate,
+    StorageBinUpdate,
+    StorageBinResponse,
+    StorageBinLookupRequest,
+    StorageBinLookupResponse,
+)
 from Crud import crud_storage_bin as crud_storage_bin
 
 from Services.storage_bin_cache import (
-    get_storage_bin_cache,
-    set_storage_bin_cache,
-    delete_storage_bin_cache,
-    delete_storage_bin_list_cache,
+    get_or_load_storage_bin_cache_async,
+    get_or_load_storage_bin_list_cache_async,
+    get_or_load_many_storage_bin_cache_async,
+    set_storage_bin_cache_async,
+    delete_storage_bin_cache_async,
+    delete_storage_bin_list_cache_async,
 )
+from Services.negative_cache import (
+    STORAGE_BIN_NAMESPACE,
+    clear_missing_async,
+    is_known_missing_async,
+    mark_missing_async,
+)
+from Utils.db_errors import is_unique_violation
+from Utils.serialization import lookup_response_body
 
 router = APIRouter(prefix="/storage_bins", tags=["StorageBins"])
 
+# Async routes on an AsyncSession: neither cache nor database I/O holds a
+# threadpool slot.
+
 
 # ----------------------------
 # CREATE StorageBin
 # ----------------------------
 @router.post("/add", response_model=StorageBinResponse)
-def create_storage_bin(storage_bin: StorageBinCreate, db: Session = Depends(get_db)):
-
-    if crud_storage_bin.get_storage_bin_by_rfid(db, storage_bin.rfid):
-        raise HTTPException(status_code=400, detail="RFID already exists")
-
+async def create_storage_bin(
+    storage_bin: StorageBinCreate, db: AsyncSession = Depends(get_async_db)
+):
     if storage_bin.capacity <= 0:
         raise HTTPException(status_code=400, detail="Capacity must be greater than 0")
 
-    new_bin = crud_storage_bin.create_storage_bin(
-        db=db,
-        rfid=storage_bin.rfid,
-        rack_id=storage_bin.rack_id,
-        capacity=storage_bin.capacity,
-    )
+    # The unique index on rfid rejects duplicates; no lookup beforehand
+    try:
+        new_bin = await crud_storage_bin.create_storage_bin_async(
+            db=db,
+            rfid=storage_bin.rfid,
+            rack_id=storage_bin.rack_id,
+            capacity=storage_bin.capacity,
+        )
+    except IntegrityError as e:
+        await db.rollback()
+        if not is_unique_violation(e):
+            raise
+        raise HTTPException(status_code=400, detail="RFID already exists")
 
-    # Invalidate list cache
-    delete_storage_bin_list_cache()
+    # Invalidate list cache and any "not found" tombstone
+    await delete_storage_bin_list_cache_async()
+    await clear_missing_async(STORAGE_BIN_NAMESPACE, [new_bin.rfid])
 
     return new_bin
 
@@ -45,67 +74,118 @@ def create_storage_bin(storage_bin: StorageBinCreate, db: Session = Depends(get_
 # READ all StorageBins
 # ----------------------------
 @router.get("/get_all", response_model=List[StorageBinResponse])
-def get_all_storage_bins(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+async def get_all_storage_bins(
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = Depends(get_after_id),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    cache_key = f"storage_bins:{skip}:{limit}"
-
-    cached_bins = get_storage_bin_cache(cache_key)
-    if cached_bins:
-        return cached_bins
-
-    bins = crud_storage_bin.get_all_storage_bins(db, skip, limit)
-
-    #  Cache serialized data
-    set_storage_bin_cache(cache_key, bins)
-
-    return bins
+    if after_id is None:
+        cache_parts = (skip, limit)
+    else:
+        cache_parts = ("after", after_id, limit)
+
+    # Cached as the final response body (with its X-Next-Cursor header)
+    return await get_or_load_storage_bin_list_cache_async(
+        cache_parts,
+        partial(crud_storage_bin.get_all_storage_bins_async, db, skip, limit, after_id),
+        List[StorageBinResponse],
+        headers_for=lambda bins: next_cursor_headers(bins, limit),
+    )
 
 
 # ----------------------------
 # READ StorageBin by RFID
 # ----------------------------
 @router.get("/{rfid}", response_model=StorageBinResponse)
-def get_storage_bin(rfid: str, db: Session = Depends(get_db)):
+async def get_storage_bin(rfid: str, db: AsyncSession = Depends(get_async_db)):
+    async def load_storage_bin():
+        # Stray tags: skip the DB while a recent lookup said "not found"
+        if await is_known_missing_async(STORAGE_BIN_NAMESPACE, rfid):
+            return None
+
+        storage_bin = await crud_storage_bin.get_storage_bin_by_rfid_async(db, rfid)
+        if storage_bin is None:
+            await mark_missing_async(STORAGE_BIN_NAMESPACE, rfid)
+        return storage_bin
+
+    cached_response = await get_or_load_storage_bin_cache_async(
+        rfid, load_storage_bin, StorageBinResponse
+    )
+    if cached_response is None:
+        raise HTTPException(status_code=404, detail="StorageBin not found")
 
-    cached_bin = get_storage_bin_cache(rfid)
-    if cached_bin:
-        return cached_bin
+    return cached_response
 
-    storage_bin = crud_storage_bin.get_storage_bin_by_rfid(db, rfid)
-    if not storage_bin:
-        raise HTTPException(status_code=404, detail="StorageBin not found")
 
-    set_storage_bin_cache(rfid, storage_bin)
+# ----------------------------
+# LOOKUP StorageBins by RFID list
+# ----------------------------
+@router.post("/lookup", response_model=StorageBinLookupResponse)
+async def lookup_storage_bins(
+    payload: StorageBinLookupRequest, db: AsyncSession = Depends(get_async_db)
+):
+    if not payload.rfids:
+        raise HTTPException(status_code=400, detail="RFID list cannot be empty")
+
+    rfids = list(dict.fromkeys(payload.rfids))
+
+    async def load_storage_bins(missing_rfids):
+        return {
+            storage_bin.rfid: storage_bin
+            for storage_bin in await crud_storage_bin.get_storage_bins_by_rfids_async(
+                db, missing_rfids
+            )
+        }
+
+    # One MGET for cached bins, one IN query for the rest
+    bodies = await get_or_load_many_storage_bin_cache_async(
+        rfids, load_storage_bins, StorageBinResponse
+    )
 
-    return storage_bin
+    return Response(
+        content=lookup_response_body(
+            [bodies[rfid] for rfid in rfids if rfid in bodies],
+            [rfid for rfid in rfids if rfid not in bodies],
+        ),
+        media_type="application/json",
+    )
 
 
 # ----------------------------
 # UPDATE StorageBin
 # ----------------------------
 @router.put("/update/{rfid}", response_model=StorageBinResponse)
-def update_storage_bin(
-    rfid: str, storage_bin_update: StorageBinUpdate, db: Session = Depends(get_db)
+async def update_storage_bin(
+    rfid: str,
+    storage_bin_update: StorageBinUpdate,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    storage_bin = crud_storage_bin.get_storage_bin_by_rfid(db, rfid)
+    storage_bin = await crud_storage_bin.get_storage_bin_by_rfid_async(db, rfid)
     if not storage_bin:
         raise HTTPException(status_code=404, detail="StorageBin not found")
 
     update_data = storage_bin_update.dict(exclude_unset=True)
 
-    if "rfid" in update_data and update_data["rfid"] != rfid:
-        if crud_storage_bin.get_storage_bin_by_rfid(db, update_data["rfid"]):
-            raise HTTPException(status_code=400, detail="RFID already exists")
-        delete_storage_bin_cache(rfid)
-
     if "capacity" in update_data and update_data["capacity"] <= 0:
         raise HTTPException(status_code=400, detail="Capacity must be greater than 0")
 
-    updated_bin = crud_storage_bin.update_storage_bin(db, storage_bin, update_data)
+    try:
+        updated_bin = await crud_storage_bin.update_storage_bin_async(
+            db, storage_bin, update_data
+        )
+    except IntegrityError as e:
+        await db.rollback()
+        if not is_unique_violation(e):
+            raise
+        raise HTTPException(status_code=400, detail="RFID already exists")
+
+    if updated_bin.rfid != rfid:
+        await delete_storage_bin_cache_async(rfid)
 
-    set_storage_bin_cache(updated_bin.rfid, updated_bin)
-    delete_storage_bin_list_cache()
+    await set_storage_bin_cache_async(updated_bin.rfid, updated_bin, StorageBinResponse)
+    await clear_missing_async(STORAGE_BIN_NAMESPACE, [updated_bin.rfid])
+    await delete_storage_bin_list_cache_async()
 
     return updated_bin
 
@@ -114,15 +194,15 @@ def update_storage_bin(
 # DELETE StorageBin
 # ----------------------------
 @router.delete("/remove/{rfid}")
-def delete_storage_bin(rfid: str, db: Session = Depends(get_db)):
-    storage_bin = crud_storage_bin.get_storage_bin_by_rfid(db, rfid)
+async def delete_storage_bin(rfid: str, db: AsyncSession = Depends(get_async_db)):
+    storage_bin = await crud_storage_bin.get_storage_bin_by_rfid_async(db, rfid)
     if not storage_bin:
         raise HTTPException(status_code=404, detail="StorageBin not found")
 
-    crud_storage_bin.delete_storage_bin(db, storage_bin)
+    await crud_storage_bin.delete_storage_bin_async(db, storage_bin)
 
     # Remove cache
-    delete_storage_bin_cache(rfid)
-    delete_storage_bin_list_cache()
+    await delete_storage_bin_cache_async(rfid)
+    await delete_storage_bin_list_cache_async()
 
     return {"message": "Storage bin deleted successfully"}
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from Database.database import get_db
+from Database.replica import get_read_db
+from core.dependencies import get_after_id
+from core.pagination import next_cursor_headers
 from Schemas.transaction import (
     TransactionCreate,
     TransactionResponse,
@@ -10,6 +14,7 @@ from Schemas.transaction import (
     BulkRFIDVerifyResponse,
 )
 from Crud import crud_transaction as crud_transaction
+from Utils.serialization import serialize_rows
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
@@ -40,34 +45,42 @@ def create_transaction(
 # -------------------------------
 @router.get("/get_all", response_model=list[TransactionResponse])
 def get_all_transactions(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = Depends(get_after_id),
+    db: Session = Depends(get_read_db),
 ):
-    transactions = crud_transaction.get_all_transactions(db, skip, limit)
-    response = []
-
-    for tx in transactions:
-        items = crud_transaction.get_items_by_storage_bin(db, tx.storage_bin_rfid)
-        item_rfids = [item.rfid for item in items]
-
-        response.append(
-            TransactionResponse(
-                id=tx.id,
-                type=tx.type,
-                storage_bin_rfid=tx.storage_bin_rfid,
-                reason=tx.reason,
-                transaction_date=tx.transaction_date,
-                item_rfids=item_rfids,
-            )
-        )
+    transactions = crud_transaction.get_all_transactions(db, skip, limit, after_id)
+
+    item_rfids = crud_transaction.get_item_rfids_by_storage_bins(
+        db, [tx.storage_bin_rfid for tx in transactions]
+    )
 
-    return response
+    # Dicts holding exactly TransactionResponse's fields, dumped without
+    # building a model per row
+    rows = [
+        {
+            "id": tx.id,
+            "type": tx.type,
+            "storage_bin_rfid": tx.storage_bin_rfid,
+            "reason": tx.reason,
+            "transaction_date": tx.transaction_date,
+            "item_rfids": item_rfids[tx.storage_bin_rfid],
+        }
+        for tx in transactions
+    ]
+    return Response(
+        content=serialize_rows(rows),
+        media_type="application/json",
+        headers=next_cursor_headers(transactions, limit),
+    )
 
 
 # -------------------------------
 # GET TRANSACTION BY RFID
 # -------------------------------
 @router.get("/get/{rfid}", response_model=list[TransactionResponse])
-def get_transaction_by_rfid(rfid: str, db: Session = Depends(get_db)):
+def get_transaction_by_rfid(rfid: str, db: Session = Depends(get_read_db)):
     transactions = crud_transaction.get_transactions_by_rfid(db, rfid)
 
     if not transactions:
@@ -128,11 +141,13 @@ def bulk_update_transaction(
     if not payload.rfids:
         raise HTTPException(status_code=400, detail="RFID list cannot be empty")
 
-    transactions, items = crud_transaction.bulk_update_transactions_and_items(
-        db=db, rfids=payload.rfids, tx_type=payload.type, reason=payload.reason
+    transactions_updated, items_updated = (
+        crud_transaction.bulk_update_transactions_and_items(
+            db=db, rfids=payload.rfids, tx_type=payload.type, reason=payload.reason
+        )
     )
 
-    if not transactions:
+    if not transactions_updated:
         raise HTTPException(
             status_code=404, detail="No transactions found for provided RFIDs"
         )
@@ -141,8 +156,8 @@ def bulk_update_transaction(
         "message": "Bulk RFID update completed successfully",
         "transaction_type": payload.type,
         "rfids_received": len(payload.rfids),
-        "transactions_updated": len(transactions),
-        "items_updated": len(items),
+        "transactions_updated": transactions_updated,
+        "items_updated": items_updated,
     }
 
 
@@ -0,0 +1,222 @@
+"""
+Seed a large inventory and compare query plans / latency for the item,
+transaction-lookup and request filter shapes before and after the
+indexes added in alembic revision b7e4c19a2d51.
+
+Run from Zeel_backend/ (so .env and the models import):
+
+    python benchmarks/bench_item_filters.py --rows 2000000
+    python benchmarks/bench_item_filters.py --url sqlite:///./bench.db --rows 200000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+load_dotenv()
+
+from sqlalchemy import create_engine, func, insert, select, text  # noqa: E402
+
+from Database.database import Base  # noqa: E402
+from Models.items import Item, ItemTrackStatus  # noqa: E402
+from Models.rack import Rack  # noqa: E402
+from Models.request import Request  # noqa: E402
+from Models.sku import SKU  # noqa: E402
+from Models.storage_bin import StorageBin  # noqa: E402
+from Models.transaction import Transaction  # noqa: E402, F401
+
+BENCH_INDEXES = {
+    "ix_items_track_sku_id",
+    "ix_items_rack_id_track",
+    "ix_items_inward_sku_id",
+    "ix_items_status",
+    "ix_items_storage_bin_rfid",
+    "ix_requests_request_date",
+}
+
+SKU_COUNT = 500
+RACK_COUNT = 200
+BIN_COUNT = 20000
+BATCH_SIZE = 10000
+
+TRACK_WEIGHTS = [
+    (ItemTrackStatus.INWARD, 0.2),
+    (ItemTrackStatus.OUTWARD, 0.75),
+    (ItemTrackStatus.RETURN, 0.05),
+]
+STATUSES = ["IN_STOCK", "SOLD", "DAMAGED"]
+
+
+def bench_indexes():
+    tables = (Item.__table__, Request.__table__)
+    return [
+        idx for table in tables for idx in table.indexes if idx.name in BENCH_INDEXES
+    ]
+
+
+def seed(engine, rows: int):
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        existing = conn.scalar(select(func.count()).select_from(Item))
+        if existing >= rows:
+            print(f"items already seeded ({existing} rows)")
+            return
+
+        if not conn.scalar(select(func.count()).select_from(SKU)):
+            conn.execute(
+                insert(SKU),
+                [
+                    {
+                        "sku_code": f"BENCH-SKU-{n}",
+                        "product_name": f"Product {n}",
+                        "mrp": 100.0,
+                        "sale_price": 90.0,
+                        "gst_percent": 18.0,
+                    }
+                    for n in range(1, SKU_COUNT + 1)
+                ],
+            )
+            conn.execute(
+                insert(Rack),
+                [
+                    {"rack_id": f"RACK-{n}", "location": "Bench"}
+                    for n in range(RACK_COUNT)
+                ],
+            )
+            conn.execute(
+                insert(StorageBin),
+                [
+                    {"rfid": f"BIN-{n}", "rack_id": f"RACK-{n % RACK_COUNT}"}
+                    for n in range(BIN_COUNT)
+                ],
+            )
+            now = datetime.now(timezone.utc)
+            conn.execute(
+                insert(Request),
+                [
+                    {
+                        "req_from": "bench",
+                        "req_to": "bench",
+                        "request_date": now - timedelta(minutes=n),
+                    }
+                    for n in range(rows // 10)
+                ],
+            )
+
+        sku_ids = list(conn.scalars(select(SKU.id)))
+
+    tracks, weights = zip(*TRACK_WEIGHTS)
+    started = time.perf_counter()
+
+    for start in range(existing, rows, BATCH_SIZE):
+        batch = []
+        for n in range(start, min(start + BATCH_SIZE, rows)):
+            bin_no = rng.randrange(BIN_COUNT)
+            batch.append(
+                {
+                    "rfid": f"BENCH-{n:09d}",
+                    "sku_id": rng.choice(sku_ids),
+                    "rack_id": f"RACK-{bin_no % RACK_COUNT}",
+                    "storage_bin_rfid": f"BIN-{bin_no}",
+                    "status": rng.choice(STATUSES),
+                    "track": rng.choices(tracks, weights)[0],
+                }
+            )
+        with engine.begin() as conn:
+            conn.execute(insert(Item), batch)
+
+    print(f"seeded {rows - existing} items in {time.perf_counter() - started:.1f}s")
+
+
+def query_shapes():
+    day = datetime.now(timezone.utc) - timedelta(days=1)
+    return {
+        "items track+sku_id": select(Item)
+        .where(Item.track == ItemTrackStatus.INWARD, Item.sku_id == 7)
+        .limit(100),
+        "items rack_id+track": select(Item)
+        .where(Item.rack_id == "RACK-7", Item.track == ItemTrackStatus.OUTWARD)
+        .limit(100),
+        "items status": select(Item).where(Item.status == "DAMAGED").limit(100),
+        "items by storage_bin_rfid": select(Item.rfid).where(
+            Item.storage_bin_rfid == "BIN-7"
+        ),
+        "inward verify (sku_id)": select(func.count())
+        .select_from(Item)
+        .where(Item.track == ItemTrackStatus.INWARD, Item.sku_id == 7),
+        "requests by request_date": select(Request).where(
+            Request.request_date.between(day, day + timedelta(hours=1))
+        ),
+    }
+
+
+def explain(conn, stmt) -> str:
+    sql = str(stmt.compile(conn, compile_kwargs={"literal_binds": True}))
+
+    if conn.dialect.name == "postgresql":
+        rows = conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+        return "\n".join(row[0] for row in rows)
+
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def run_phase(engine, label: str, repeat: int):
+    print(f"\n===== {label} =====")
+    results = {}
+
+    with engine.connect() as conn:
+        conn.execute(text("ANALYZE"))
+        for name, stmt in query_shapes().items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                conn.execute(stmt).fetchall()
+                timings.append((time.perf_counter() - started) * 1000)
+
+            timings.sort()
+            median = statistics.median(timings)
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            results[name] = median
+
+            print(f"\n-- {name}: median {median:.2f} ms, p95 {p95:.2f} ms")
+            print(explain(conn, stmt))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    Base.metadata.create_all(bind=engine)
+    seed(engine, args.rows)
+
+    for idx in bench_indexes():
+        idx.drop(bind=engine, checkfirst=True)
+    before = run_phase(engine, "before (no filter indexes)", args.repeat)
+
+    for idx in bench_indexes():
+        idx.create(bind=engine, checkfirst=True)
+    after = run_phase(engine, "after (filter indexes)", args.repeat)
+
+    print("\n===== summary (median ms) =====")
+    for name in before:
+        speedup = before[name] / after[name] if after[name] else float("inf")
+        print(f"{name:30} {before[name]:10.2f} {after[name]:10.2f} {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Compare the per-call cost of the hot single-row lookups built as
+db.query(...).filter(...).first() on every call with the prebuilt
+statements in Crud/statements.py.
+
+Against SQLite the database work is tiny, so the difference is mostly
+Python-side query construction. Run from Zeel_backend/:
+
+    python benchmarks/bench_lookups.py
+    python benchmarks/bench_lookups.py --url postgresql://... --calls 5000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+load_dotenv()
+
+from sqlalchemy import create_engine, func, insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from Database.database import Base  # noqa: E402
+from Models.items import Item  # noqa: E402
+from Models.rack import Rack  # noqa: E402
+from Models.sku import SKU  # noqa: E402
+from Models.storage_bin import StorageBin  # noqa: E402
+from Models.transaction import Transaction  # noqa: E402, F401
+from Crud import (  # noqa: E402
+    crud_items,
+    crud_rack,
+    crud_sku,
+    crud_storage_bin,
+    crud_transaction,
+)
+
+ROWS = 10000
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        if conn.scalar(select(func.count()).select_from(Item)) >= ROWS:
+            return
+        conn.execute(
+            insert(SKU),
+            [{"sku_code": f"LOOKUP-SKU-{n}"} for n in range(1, ROWS + 1)],
+        )
+        conn.execute(insert(Rack), [{"rack_id": f"RACK-{n}"} for n in range(ROWS)])
+        conn.execute(
+            insert(StorageBin),
+            [{"rfid": f"BIN-{n}", "rack_id": f"RACK-{n}"} for n in range(ROWS)],
+        )
+        conn.execute(
+            insert(Item),
+            [
+                {"rfid": f"ITEM-{n}", "sku_id": n + 1, "storage_bin_rfid": f"BIN-{n}"}
+                for n in range(ROWS)
+            ],
+        )
+
+
+# (name, per-call query object as before, current Crud function)
+LOOKUPS = [
+    (
+        "get_item_by_rfid",
+        lambda db, n: db.query(Item).filter(Item.rfid == f"ITEM-{n}").first(),
+        lambda db, n: crud_items.get_item_by_rfid(db, f"ITEM-{n}"),
+    ),
+    (
+        "get_storage_bin_by_rfid",
+        lambda db, n: db.query(StorageBin)
+        .filter(StorageBin.rfid == f"BIN-{n}")
+        .first(),
+        lambda db, n: crud_storage_bin.get_storage_bin_by_rfid(db, f"BIN-{n}"),
+    ),
+    (
+        "get_sku_by_id",
+        lambda db, n: db.query(SKU).filter(SKU.id == n + 1).first(),
+        lambda db, n: crud_sku.get_sku_by_id(db, n + 1),
+    ),
+    (
+        "get_rack_by_id",
+        lambda db, n: db.query(Rack).filter(Rack.rack_id == f"RACK-{n}").first(),
+        lambda db, n: crud_rack.get_rack_by_id(db, f"RACK-{n}"),
+    ),
+    (
+        "storage_bin_exists",
+        lambda db, n: db.query(StorageBin)
+        .filter(StorageBin.rfid == f"BIN-{n}")
+        .first(),
+        lambda db, n: crud_transaction.storage_bin_exists(db, f"BIN-{n}"),
+    ),
+]
+
+
+def time_calls(engine, lookup, keys, rounds: int) -> float:
+    """Median microseconds per call over rounds, each on a fresh Session."""
+    per_call = []
+    for _ in range(rounds):
+        with Session(engine) as db:
+            started = time.perf_counter()
+            for n in keys:
+                lookup(db, n)
+            per_call.append((time.perf_counter() - started) / len(keys) * 1e6)
+    return statistics.median(per_call)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="sqlite:///./bench_lookups.db")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    Base.metadata.create_all(bind=engine)
+    seed(engine)
+
+    rng = random.Random(42)
+    keys = [rng.randrange(ROWS) for _ in range(args.calls)]
+
+    print(f"{'lookup':26} {'query()':>10} {'prebuilt':>10} {'saved':>8}  (us/call)")
+    for name, before, after in LOOKUPS:
+        # Warm the compiled cache for both shapes first
+        time_calls(engine, before, keys[:100], 1)
+        time_calls(engine, after, keys[:100], 1)
+
+        before_us = time_calls(engine, before, keys, args.rounds)
+        after_us = time_calls(engine, after, keys, args.rounds)
+        saved = (before_us - after_us) / before_us * 100
+        print(f"{name:26} {before_us:10.1f} {after_us:10.1f} {saved:7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
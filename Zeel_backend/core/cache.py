@@ -1,3 +1,85 @@
+import logging
 import redis
+import redis.asyncio
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+from core.circuit_breaker import CircuitBreaker
+from core.settings import settings
 
-redis_client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
+logger = logging.getLogger(__name__)
+
+_pool_options = dict(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    password=settings.REDIS_PASSWORD,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT,  # wait for a free pooled connection
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+    health_check_interval=30,
+    decode_responses=True,
+)
+
+redis_pool = redis.BlockingConnectionPool(**_pool_options)
+
+# One immediate retry covers a stale pooled connection; anything longer
+# would stall requests that can be served from the database instead.
+redis_client = redis.Redis(connection_pool=redis_pool, retry=Retry(NoBackoff(), 1))
+
+# For async def routes: Redis I/O awaits on the event loop instead of
+# holding a threadpool slot. Same server, settings and circuit breaker.
+async_redis_pool = redis.asyncio.BlockingConnectionPool(**_pool_options)
+async_redis_client = redis.asyncio.Redis(
+    connection_pool=async_redis_pool, retry=AsyncRetry(NoBackoff(), 1)
+)
+
+
+class CacheUnavailable(Exception):
+    """Redis is down, slow, or the circuit breaker is open."""
+
+
+class CircuitOpen(CacheUnavailable):
+    """Rejected by the open circuit breaker; Redis was not called."""
+
+
+# Shared by every cache built on redis_client: after
+# CACHE_BREAKER_FAILURE_THRESHOLD consecutive errors, Redis is bypassed
+# for CACHE_BREAKER_RESET_TIMEOUT seconds and callers use the database.
+cache_breaker = CircuitBreaker(
+    failure_threshold=settings.CACHE_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.CACHE_BREAKER_RESET_TIMEOUT,
+)
+
+
+def call_redis(command, *args, **kwargs):
+    """Run a Redis command through the breaker; raise CacheUnavailable on error."""
+    if not cache_breaker.allow_request():
+        raise CircuitOpen()
+
+    try:
+        result = command(*args, **kwargs)
+    except redis.RedisError as e:
+        logger.warning(f"Redis error: {e}")
+        cache_breaker.record_failure()
+        raise CacheUnavailable() from e
+
+    cache_breaker.record_success()
+    return result
+
+
+async def call_redis_async(command, *args, **kwargs):
+    """Await an async Redis command through the breaker, like call_redis."""
+    if not cache_breaker.allow_request():
+        raise CircuitOpen()
+
+    try:
+        result = await command(*args, **kwargs)
+    except redis.RedisError as e:
+        logger.warning(f"Redis error: {e}")
+        cache_breaker.record_failure()
+        raise CacheUnavailable() from e
+
+    cache_breaker.record_success()
+    return result
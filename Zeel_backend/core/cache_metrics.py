@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from core.cache import CircuitOpen
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the Redis latency histogram buckets; the last is open
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+class _NamespaceStats:
+    def __init__(self):
+        self.hits = 0
+        self.local_hits = 0  # subset of hits served by the per-worker LRU
+        self.misses = 0
+        self.errors = 0
+        self.rejected = 0  # calls skipped by the open circuit, not errors
+        self.writes = 0
+        self.bytes_written = 0
+        self.max_payload = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_count = 0
+        self.latency_total_ms = 0.0
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        buckets = {
+            f"le_{bound}ms": n
+            for bound, n in zip(LATENCY_BUCKETS_MS, self.latency_buckets)
+        }
+        buckets["inf"] = self.latency_buckets[-1]
+        return {
+            "hits": self.hits,
+            "local_hits": self.local_hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "writes": self.writes,
+            "avg_payload_bytes": (
+                self.bytes_written // self.writes if self.writes else None
+            ),
+            "max_payload_bytes": self.max_payload,
+            "redis_calls": self.latency_count,
+            "avg_latency_ms": (
+                round(self.latency_total_ms / self.latency_count, 3)
+                if self.latency_count
+                else None
+            ),
+            "latency_histogram": buckets,
+        }
+
+
+class CacheMetrics:
+    """
+    In-process counters per cache namespace: hits, misses, Redis errors,
+    calls rejected by the open circuit breaker, payload sizes and a Redis
+    latency histogram. Per worker; counters reset on restart.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _NamespaceStats] = defaultdict(_NamespaceStats)
+        self._namespaces: Dict[str, dict] = {}
+
+    # ---------- Namespaces ----------
+
+    def register(
+        self,
+        namespace: str,
+        key_patterns: List[str],
+        on_flush: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Declare the Redis key patterns of a namespace, for inspect/flush.
+        on_flush runs after its keys are deleted (e.g. to drop local copies).
+        """
+        self._namespaces[namespace] = {
+            "key_patterns": key_patterns,
+            "on_flush": on_flush,
+        }
+
+    def namespace(self, namespace: str) -> Optional[dict]:
+        return self._namespaces.get(namespace)
+
+    # ---------- Recording ----------
+
+    def hit(self, namespace: str, count: int = 1, local: bool = False):
+        with self._lock:
+            stats = self._stats[namespace]
+            stats.hits += count
+            if local:
+                stats.local_hits += count
+
+    def miss(self, namespace: str, count: int = 1):
+        with self._lock:
+            self._stats[namespace].misses += count
+
+    def write(self, namespace: str, payload_bytes: int):
+        with self._lock:
+            stats = self._stats[namespace]
+            stats.writes += 1
+            stats.bytes_written += payload_bytes
+            stats.max_payload = max(stats.max_payload, payload_bytes)
+
+    @contextmanager
+    def timed(self, namespace: str):
+        """
+        Time a Redis call; count it as an error instead if it raises, or as
+        rejected if the open circuit breaker skipped it.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except CircuitOpen:
+            with self._lock:
+                self._stats[namespace].rejected += 1
+            raise
+        except Exception:
+            with self._lock:
+                self._stats[namespace].errors += 1
+            raise
+        else:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                stats = self._stats[namespace]
+                bucket = len(LATENCY_BUCKETS_MS)
+                for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                    if elapsed_ms <= bound:
+                        bucket = index
+                        break
+                stats.latency_buckets[bucket] += 1
+                stats.latency_count += 1
+                stats.latency_total_ms += elapsed_ms
+
+    # ---------- Reading ----------
+
+    def snapshot(self, namespace: Optional[str] = None) -> dict:
+        with self._lock:
+            if namespace is not None:
+                return self._stats[namespace].snapshot()
+            return {name: stats.snapshot() for name, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+cache_metrics = CacheMetrics()
+
+
+def log_cache_metrics():
+    """Log one summary line per namespace (scheduled job)."""
+    for namespace, stats in sorted(cache_metrics.snapshot().items()):
+        logger.info(
+            f"Cache {namespace}: hits={stats['hits']} "
+            f"(local={stats['local_hits']}) misses={stats['misses']} "
+            f"hit_ratio={stats['hit_ratio']} errors={stats['errors']} "
+            f"rejected={stats['rejected']} "
+            f"avg_payload={stats['avg_payload_bytes']}B "
+            f"avg_latency={stats['avg_latency_ms']}ms"
+        )
@@ -0,0 +1,82 @@
+import logging
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Trip after `failure_threshold` consecutive failures, reject calls for
+    `reset_timeout` seconds, then let trial calls through (half-open): the
+    first success closes the circuit, the first failure re-opens it.
+    Callbacks registered with on_open / on_close run on each transition;
+    on_close callbacks run on a background thread, since they may do
+    blocking I/O and the success that closes the circuit may come from a
+    request on the event loop.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._open_callbacks = []
+        self._close_callbacks = []
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def on_open(self, callback: Callable[[], None]):
+        self._open_callbacks.append(callback)
+        return callback
+
+    def on_close(self, callback: Callable[[], None]):
+        self._close_callbacks.append(callback)
+        return callback
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+            return True
+
+    def record_success(self):
+        with self._lock:
+            recovered = self.state != CLOSED
+            self.state = CLOSED
+            self._failures = 0
+
+        if recovered:
+            threading.Thread(
+                target=self._run_close_callbacks,
+                name="circuit-breaker-close",
+                daemon=True,
+            ).start()
+
+    def _run_close_callbacks(self):
+        for callback in self._close_callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception(f"Circuit breaker on_close callback {callback} failed")
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            tripped = self.state != OPEN and (
+                self.state == HALF_OPEN or self._failures >= self.failure_threshold
+            )
+            if tripped:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+        if tripped:
+            for callback in self._open_callbacks:
+                callback()
@@ -2,3 +2,4 @@ IST_TIMEZONE = "Asia/Kolkata"
 
 TRANSACTION_LIMIT = 100
 MAX_BULK_RFIDS = 500
+EXPORT_BATCH_SIZE = 1000
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from fastapi import HTTPException
+
+from core.pagination import decode_cursor
+
+
+def get_after_id(cursor: Optional[str] = None) -> Optional[int]:
+    """Resolve the opaque ?cursor= query param into the last seen row id."""
+    if cursor is None:
+        return None
+
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -1,7 +1,15 @@
 import logging
+from core.settings import settings
 
 
 def setup_logging():
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s"
     )
+
+    if settings.SLOW_QUERY_LOG_FILE:
+        handler = logging.FileHandler(settings.SLOW_QUERY_LOG_FILE)
+        handler.setFormatter(logging.Formatter("%(asctime)s | %(message)s"))
+        slow_query_logger = logging.getLogger("slow_query")
+        slow_query_logger.addHandler(handler)
+        slow_query_logger.propagate = False
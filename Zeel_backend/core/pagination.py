@@ -0,0 +1,35 @@
+import base64
+import json
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    raw = json.dumps({"id": last_id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        last_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    # bool is an int subclass; {"id": true} is not a row id
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+    return last_id
+
+
+def next_cursor_headers(rows: list, limit: int, key: str = "id") -> dict:
+    """
+    Headers exposing the cursor for the next page, if this page was full.
+    key names the column the rows are ordered and paged by.
+    """
+    if not rows or len(rows) < limit:
+        return {}
+
+    last = rows[-1]
+    last_id = last[key] if isinstance(last, dict) else getattr(last, key)
+    return {NEXT_CURSOR_HEADER: encode_cursor(last_id)}
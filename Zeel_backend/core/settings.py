@@ -1,9 +1,50 @@
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    # Async driver URL; derived from DATABASE_URL (asyncpg / aiosqlite) if unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Connection pool, per engine and per worker: size it so that
+    # workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays under max_connections
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 never recycles
+    # Ping on every checkout. Can be turned off when DB_POOL_RECYCLE is
+    # below the server/proxy idle timeout, saving one round trip per request.
+    DB_POOL_PRE_PING: bool = True
+
+    # Read replica for GET routes; reads use the primary if unset
+    DATABASE_REPLICA_URL: Optional[str] = None
+    REPLICA_MAX_LAG: float = 5  # seconds behind before reads fall back
+    REPLICA_CHECK_INTERVAL: float = 5  # seconds between lag checks
+    # A client reads from the primary for this long after one of its writes
+    READ_YOUR_WRITES_WINDOW: int = 10  # seconds
+
+    # Flag a request that runs the same statement shape this many times
+    N_PLUS_ONE_THRESHOLD: int = 10
+    # Raise instead of logging a warning (for tests)
+    N_PLUS_ONE_STRICT: bool = False
+
+    # Slow-query log (logger "slow_query"); 0 disables it
+    SLOW_QUERY_THRESHOLD_MS: float = 500
+    SLOW_QUERY_LOG_FILE: Optional[str] = None  # else logged with the rest
+    SLOW_QUERY_EXPLAIN: bool = True  # attach the plan of slow SELECTs
+    # Fraction of explained queries run with EXPLAIN ANALYZE, which executes
+    # the query a second time
+    SLOW_QUERY_ANALYZE_SAMPLE_RATE: float = 0.0
+    SLOW_QUERY_EXPLAIN_QUEUE: int = 100  # pending EXPLAINs before skipping
+
+    # Daily job moving history into the *_archive tables; 0 days disables
+    # a table's archival
+    ARCHIVE_ITEMS_AFTER_DAYS: int = 90  # OUTWARD items, since last update
+    ARCHIVE_TRANSACTIONS_AFTER_DAYS: int = 180
+    ARCHIVE_BATCH_SIZE: int = 1000  # rows moved per transaction
+    ARCHIVE_HOUR: int = 2  # IST
 
     # Security
     JWT_SECRET: str
@@ -15,6 +56,28 @@ class Settings(BaseSettings):
     MAIL_PORT: int
     MAIL_SERVER: str
 
+    # Redis
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 0.5  # seconds
+    REDIS_SOCKET_TIMEOUT: float = 0.25  # seconds
+    REDIS_CONNECT_TIMEOUT: float = 0.25  # seconds
+
+    # Bypass Redis after this many consecutive errors, retry after the timeout
+    CACHE_BREAKER_FAILURE_THRESHOLD: int = 5
+    CACHE_BREAKER_RESET_TIMEOUT: int = 30  # seconds
+    CACHE_PENDING_INVALIDATIONS_MAX: int = 10000
+
+    # In-process cache in front of Redis (per worker)
+    LOCAL_CACHE_MAX_SIZE: int = 10000
+    LOCAL_CACHE_TTL: int = 30  # seconds
+
+    # Cache hit/miss/latency summary in the logs; 0 disables it
+    CACHE_METRICS_LOG_INTERVAL: int = 300  # seconds
+
     model_config = SettingsConfigDict(
         env_file=".env",
         extra="ignore",  # ignore any future unused env vars safely
@@ -9,12 +9,25 @@ from Database.database import Base, engine, SessionLocal
 from Utils.hashing import hash_password
 from scheduler import start_scheduler
 from Middleware.api_monitor import api_monitor
+from Middleware.read_your_writes import read_your_writes
 from core.logging import setup_logging
 from dotenv import load_dotenv
-from core.cache import redis_client
+from redis.exceptions import RedisError
+from core.cache import async_redis_client, redis_client
+from Services.storage_bin_cache import (
+    start_storage_bin_cache_listener,
+    stop_storage_bin_cache_listener,
+)
+from core.pagination import NEXT_CURSOR_HEADER
+from Database.instrumentation import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    REPEATED_QUERIES_HEADER,
+)
 
 # Import routers
 from api.v1 import (
+    archive,
     email_subscribers,
     items,
     racks,
@@ -23,6 +36,7 @@ from api.v1 import (
     admin,
     transaction,
     storage_bin,
+    health,
 )
 from Models.user import User
 
@@ -51,6 +65,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        NEXT_CURSOR_HEADER,
+        QUERY_COUNT_HEADER,
+        QUERY_TIME_HEADER,
+        REPEATED_QUERIES_HEADER,
+    ],
 )
 
 # ---------------------------
@@ -58,6 +78,11 @@ app.add_middleware(
 # ---------------------------
 app.middleware("http")(api_monitor)
 
+# ---------------------------
+# Read-your-writes (replica routing)
+# ---------------------------
+app.middleware("http")(read_your_writes)
+
 # ---------------------------
 # Start Scheduler
 # ---------------------------
@@ -75,6 +100,8 @@ app.include_router(request_router.router, prefix=api_prefix)
 app.include_router(email_subscribers.router, prefix=api_prefix)
 app.include_router(sku.router, prefix=api_prefix)
 app.include_router(admin.router, prefix=api_prefix)
+app.include_router(health.router, prefix=api_prefix)
+app.include_router(archive.router, prefix=api_prefix)
 
 
 # ---------------------------
@@ -85,8 +112,13 @@ async def startup():
     try:
         logger.info("Starting up application...")
 
-        redis_client.ping()
-        print("Redis connected")
+        # Redis is optional: the storage bin cache falls back to the DB
+        try:
+            redis_client.ping()
+            print("Redis connected")
+            start_storage_bin_cache_listener()
+        except RedisError as e:
+            logger.warning(f"Redis unavailable, starting without cache: {e}")
 
         # Create database tables
         logger.info("Creating database tables...")
@@ -115,6 +147,12 @@ async def startup():
         logger.error(f"Startup failed: {e}", exc_info=True)
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    stop_storage_bin_cache_listener()
+    await async_redis_client.aclose()
+
+
 # ---------------------------
 # Run server (for direct execution)
 # ---------------------------
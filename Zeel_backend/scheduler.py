@@ -4,10 +4,14 @@ from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from Crud.crud_archive import archive_outward_items, archive_transactions
 from Database.database import SessionLocal
 from Models.email_subscriber import EmailSubscriber
 from Models.request import Request
 from Utils.email_service import send_email
+from core.cache_metrics import log_cache_metrics
+from core.settings import settings
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -220,6 +224,29 @@ def run_evening_broadcast():
         logger.error(f"Error in evening broadcast job: {str(e)}")
 
 
+def run_archival():
+    """Move old OUTWARD items and transactions into the archive tables"""
+    db = SessionLocal()
+    try:
+        if settings.ARCHIVE_ITEMS_AFTER_DAYS > 0:
+            moved = archive_outward_items(
+                db, settings.ARCHIVE_ITEMS_AFTER_DAYS, settings.ARCHIVE_BATCH_SIZE
+            )
+            logger.info(f"Archived {moved} outward items")
+        if settings.ARCHIVE_TRANSACTIONS_AFTER_DAYS > 0:
+            moved = archive_transactions(
+                db,
+                settings.ARCHIVE_TRANSACTIONS_AFTER_DAYS,
+                settings.ARCHIVE_BATCH_SIZE,
+            )
+            logger.info(f"Archived {moved} transactions")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in archival job: {str(e)}")
+    finally:
+        db.close()
+
+
 def start_scheduler():
     """Start the background scheduler with daily broadcast jobs"""
     scheduler = BackgroundScheduler(timezone=ZoneInfo("Asia/Kolkata"))
@@ -244,6 +271,26 @@ def start_scheduler():
         misfire_grace_time=300,  # 5 minutes grace period
     )
 
+    # Cache hit ratios and Redis latency, for TTL tuning
+    if settings.CACHE_METRICS_LOG_INTERVAL > 0:
+        scheduler.add_job(
+            log_cache_metrics,
+            IntervalTrigger(seconds=settings.CACHE_METRICS_LOG_INTERVAL),
+            id="cache_metrics_job",
+            name="Log cache metrics",
+            replace_existing=True,
+        )
+
+    # Keep the hot tables sized to live inventory; off-peak, 2 AM IST by default
+    scheduler.add_job(
+        run_archival,
+        CronTrigger(hour=settings.ARCHIVE_HOUR, timezone=ZoneInfo("Asia/Kolkata")),
+        id="archival_job",
+        name="Archive old outward items and transactions",
+        replace_existing=True,
+        misfire_grace_time=3600,
+    )
+
     scheduler.start()
     logger.info("Daily broadcast scheduler started successfully")
     logger.info("Morning broadcast: 9:00 AM IST daily")
@@ -1,8 +1,12 @@
+import asyncio
 import os
+import fakeredis
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 # --------------------------------------------------
 # 1. SET TEST ENV VARIABLES (BEFORE APP IMPORT)
@@ -14,12 +18,15 @@ os.environ["MAIL_PASSWORD"] = "test123"
 os.environ["MAIL_FROM"] = "test@example.com"
 os.environ["MAIL_PORT"] = "587"
 os.environ["MAIL_SERVER"] = "smtp.test.com"
+# Fail a test whose request repeats one statement shape (likely N+1)
+os.environ["N_PLUS_ONE_STRICT"] = "true"
 
 # --------------------------------------------------
 # 2. IMPORT APP + DB AFTER ENV SET
 # --------------------------------------------------
 from main import app
-from Database.database import Base, get_db
+from Database.database import Base, get_async_db, get_db
+from Database.replica import get_read_db
 
 # --------------------------------------------------
 # 3. CREATE TEST DATABASE ENGINE
@@ -32,6 +39,17 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
+)
+
+# Async routes (get_async_db) commit to the same file. No pooling: the
+# TestClient may run each request on a fresh event loop.
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
 
@@ -57,7 +75,9 @@ def db():
     yield session
 
     session.close()
-    transaction.rollback()
+    # A route's own rollback (e.g. on IntegrityError) has already ended it
+    if transaction.is_active:
+        transaction.rollback()
     connection.close()
 
 
@@ -72,6 +92,67 @@ def client(db):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     yield TestClient(app)
     app.dependency_overrides.clear()
+
+
+# --------------------------------------------------
+# 6b. ASYNC SESSIONS FOR *_async CRUD
+# --------------------------------------------------
+@pytest.fixture
+def async_session():
+    """
+    AsyncSession factory on the test database, for calling *_async CRUD
+    under asyncio.run. Like the async routes it commits for real: use
+    unique RFIDs and delete what the test created.
+    """
+    return AsyncTestingSessionLocal
+
+
+# --------------------------------------------------
+# 7. REDIS UP: IN-MEMORY FAKE SERVER
+# --------------------------------------------------
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """
+    Point every cache layer at one fakeredis server (sync and async
+    clients) with the circuit closed and empty local caches and metrics.
+    Yields the sync client, for inspecting keys.
+    """
+    from core import cache
+    from core.cache_metrics import cache_metrics
+    from Services import cache_admin, negative_cache, storage_bin_cache, tagged_cache
+
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+    for module in (cache, cache_admin, negative_cache, storage_bin_cache, tagged_cache):
+        if hasattr(module, "redis_client"):
+            monkeypatch.setattr(module, "redis_client", client)
+        if hasattr(module, "async_redis_client"):
+            monkeypatch.setattr(module, "async_redis_client", async_client)
+    monkeypatch.setattr(
+        storage_bin_cache,
+        "_release_lock_script",
+        async_client.register_script(storage_bin_cache.RELEASE_LOCK_SCRIPT),
+    )
+    # An asyncio.Lock binds to the first loop that waits on it; each
+    # asyncio.run (and TestClient request) may use a new loop
+    monkeypatch.setattr(
+        storage_bin_cache, "_key_locks", [asyncio.Lock() for _ in range(64)]
+    )
+
+    cache.cache_breaker.record_success()
+    storage_bin_cache.local_cache.clear()
+    cache_metrics.reset()
+    yield client
+    storage_bin_cache.stop_storage_bin_cache_listener()
+    storage_bin_cache.local_cache.clear()
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+
+from core.pagination import NEXT_CURSOR_HEADER
+from Crud.crud_archive import archive_outward_items, archive_transactions
+from Models.archive import ItemArchive
+from Models.items import Item, ItemTrackStatus
+from Models.transaction import Transaction, TransactionType
+
+
+def _days_ago(days: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def test_archive_moves_old_outward_items_in_batches(client, db):
+    db.add_all(
+        [
+            Item(
+                rfid=f"OLD-{i}",
+                sku_id=1,
+                track=ItemTrackStatus.OUTWARD,
+                updated_at=_days_ago(120),
+            )
+            for i in range(3)
+        ]
+        + [
+            Item(rfid="RECENT", sku_id=1, track=ItemTrackStatus.OUTWARD),
+            Item(rfid="OLD-INWARD", sku_id=1, updated_at=_days_ago(120)),
+        ]
+    )
+    db.flush()
+
+    assert archive_outward_items(db, older_than_days=90, batch_size=2) == 3
+
+    remaining = {rfid for (rfid,) in db.query(Item.rfid)}
+    assert {"RECENT", "OLD-INWARD"} <= remaining
+    assert not remaining & {"OLD-0", "OLD-1", "OLD-2"}
+    assert db.query(ItemArchive).count() == 3
+
+    response = client.get("/api/v1/archive/items", params={"limit": 2})
+    assert response.status_code == 200
+    assert [item["rfid"] for item in response.json()] == ["OLD-0", "OLD-1"]
+    assert response.json()[0]["track"] == "OUTWARD"
+
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+    response = client.get("/api/v1/archive/items", params={"cursor": cursor})
+    assert [item["rfid"] for item in response.json()] == ["OLD-2"]
+
+
+def test_archive_moves_old_transactions(client, db):
+    db.add_all(
+        [
+            Transaction(
+                type=TransactionType.OUTWARD,
+                storage_bin_rfid="BIN-ARCHIVE",
+                transaction_date=_days_ago(365),
+            ),
+            Transaction(type=TransactionType.INWARD, storage_bin_rfid="BIN-ARCHIVE"),
+        ]
+    )
+    db.flush()
+
+    assert archive_transactions(db, older_than_days=180, batch_size=100) == 1
+
+    response = client.get(
+        "/api/v1/archive/transactions", params={"storage_bin_rfid": "BIN-ARCHIVE"}
+    )
+    assert response.status_code == 200
+    assert [t["type"] for t in response.json()] == ["outward"]
+    assert db.query(Transaction).filter_by(storage_bin_rfid="BIN-ARCHIVE").count() == 1
+
+
+def test_archived_items_leave_the_cached_rack(client, db, fake_redis):
+    client.post("/api/v1/racks/add/", json={"rack_id": "RACK-ARC", "location": "W-9"})
+    db.add_all(
+        [
+            Item(
+                rfid="ARC-OLD",
+                sku_id=1,
+                rack_id="RACK-ARC",
+                track=ItemTrackStatus.OUTWARD,
+                updated_at=_days_ago(120),
+            ),
+            Item(rfid="ARC-KEEP", sku_id=1, rack_id="RACK-ARC"),
+        ]
+    )
+    db.flush()
+    response = client.get("/api/v1/racks/RACK-ARC")
+    assert {i["rfid"] for i in response.json()["items"]} == {"ARC-OLD", "ARC-KEEP"}
+
+    assert archive_outward_items(db, older_than_days=90, batch_size=100) == 1
+
+    response = client.get("/api/v1/racks/RACK-ARC")
+    assert [i["rfid"] for i in response.json()["items"]] == ["ARC-KEEP"]
@@ -0,0 +1,71 @@
+import pytest
+
+from core.cache import CacheUnavailable, CircuitOpen
+from core.cache_metrics import CacheMetrics, cache_metrics
+
+
+def test_cache_metrics_counts_hits_misses_and_latency():
+    metrics = CacheMetrics()
+
+    metrics.hit("bins", local=True)
+    metrics.hit("bins")
+    metrics.miss("bins", count=2)
+    metrics.write("bins", 100)
+    metrics.write("bins", 300)
+    with metrics.timed("bins"):
+        pass
+    with pytest.raises(CacheUnavailable):
+        with metrics.timed("bins"):
+            raise CacheUnavailable()
+    with pytest.raises(CircuitOpen):
+        with metrics.timed("bins"):
+            raise CircuitOpen()
+
+    stats = metrics.snapshot("bins")
+    assert stats["hits"] == 2
+    assert stats["local_hits"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["avg_payload_bytes"] == 200
+    assert stats["max_payload_bytes"] == 300
+    assert stats["errors"] == 1
+    assert stats["rejected"] == 1  # the breaker skipped Redis: not an error
+    assert stats["redis_calls"] == 1
+    assert sum(stats["latency_histogram"].values()) == 1
+
+
+def test_cache_admin_endpoints(client):
+    response = client.get("/api/v1/admin/cache/metrics")
+    assert response.status_code == 200
+    assert "namespaces" in response.json()
+
+    assert client.get("/api/v1/admin/cache/no-such-cache").status_code == 404
+    assert client.delete("/api/v1/admin/cache/no-such-cache").status_code == 404
+
+
+def test_cache_metrics_with_redis_up(client, fake_redis):
+    response = client.post(
+        "/api/v1/skus/add",
+        json={
+            "sku_code": "SKU-METRICS-1",
+            "product_name": "Shirt",
+            "mrp": 999,
+            "sale_price": 799,
+            "gst_percent": 5,
+        },
+    )
+    sku_id = response.json()["id"]
+    client.get(f"/api/v1/skus/get/{sku_id}")
+    client.get(f"/api/v1/skus/get/{sku_id}")
+
+    stats = cache_metrics.snapshot("sku")
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+    assert stats["errors"] == stats["rejected"] == 0
+
+    response = client.get("/api/v1/admin/cache/sku")
+    assert response.status_code == 200
+    assert response.json()["keys"] == 1
+    assert response.json()["sample"][0]["key"] == f"cache:sku:sku_id={sku_id}"
+
+    response = client.delete("/api/v1/admin/cache/sku")
+    assert response.status_code == 200
+    assert fake_redis.keys("cache:sku:*") == []
@@ -0,0 +1,27 @@
+import threading
+
+from core.circuit_breaker import CLOSED, CircuitBreaker
+
+
+def test_close_callbacks_do_not_block_the_closing_call():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    release = threading.Event()
+    ran_on = []
+
+    @breaker.on_close
+    def slow_replay():
+        ran_on.append(threading.current_thread())
+        release.wait(timeout=5)
+
+    breaker.record_failure()
+    assert breaker.allow_request()  # half-open after reset_timeout
+
+    # Returns while the callback is still blocked
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "circuit-breaker-close":
+            thread.join(timeout=5)
+    assert ran_on and ran_on[0] is not threading.current_thread()
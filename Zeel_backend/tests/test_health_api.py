@@ -0,0 +1,12 @@
+def test_deep_health_reports_database_and_pools(client):
+    response = client.get("/api/v1/health/deep")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] in ("ok", "degraded")
+    assert body["database"]["status"] == "ok"
+    assert body["async_database"]["status"] == "ok"
+    assert "breaker" in body["redis"]
+
+    pool = body["pools"]["database"]
+    assert {"size", "checked_out", "overflow", "checkouts", "max_wait_ms"} <= set(pool)
@@ -0,0 +1,233 @@
+import asyncio
+import base64
+import json
+
+from sqlalchemy import delete, event
+
+from Crud import crud_items
+from Database.instrumentation import QUERY_COUNT_HEADER
+from Models.items import Item, ItemTrackStatus
+
+
+def test_bulk_upload_reports_created_and_skipped(client, db):
+    payload = {
+        "rfids": ["ITEM-1", "ITEM-2"],
+        "sku_id": 1,
+        "rack_id": "RACK-A1",
+        "storage_bin_rfid": "BIN-1",
+    }
+    response = client.post("/api/v1/items/bulk_upload", json=payload)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "created_rfids": ["ITEM-1", "ITEM-2"],
+        "skipped_rfids": [],
+    }
+
+    payload["rfids"] = ["ITEM-2", "ITEM-3", "ITEM-3"]
+    response = client.post("/api/v1/items/bulk_upload", json=payload)
+
+    assert response.json() == {
+        "created_rfids": ["ITEM-3"],
+        "skipped_rfids": ["ITEM-2", "ITEM-3"],
+    }
+    assert db.query(Item).count() == 3
+
+
+def test_get_items_cursor_pagination(client):
+    client.post(
+        "/api/v1/items/bulk_upload",
+        json={
+            "rfids": [f"PAGE-{i}" for i in range(5)],
+            "sku_id": 1,
+            "rack_id": "RACK-A1",
+            "storage_bin_rfid": "BIN-1",
+        },
+    )
+
+    response = client.get("/api/v1/items/", params={"limit": 2})
+    seen = [item["rfid"] for item in response.json()]
+
+    while "X-Next-Cursor" in response.headers:
+        response = client.get(
+            "/api/v1/items/",
+            params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+        )
+        seen += [item["rfid"] for item in response.json()]
+
+    assert seen == [f"PAGE-{i}" for i in range(5)]
+
+    response = client.get("/api/v1/items/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    # A forged {"id": true} is not read as id 1
+    forged = base64.urlsafe_b64encode(b'{"id": true}').decode()
+    response = client.get("/api/v1/items/", params={"cursor": forged})
+    assert response.status_code == 400
+
+
+def test_export_filtered_items_streams_ndjson_and_csv(client):
+    client.post(
+        "/api/v1/items/bulk_upload",
+        json={
+            "rfids": ["EXP-1", "EXP-2"],
+            "sku_id": 7,
+            "rack_id": "RACK-A1",
+            "storage_bin_rfid": "BIN-1",
+        },
+    )
+
+    response = client.post("/api/v1/items/filter/export", json={"sku_id": 7})
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [row["rfid"] for row in rows] == ["EXP-1", "EXP-2"]
+    assert rows[0]["track"] == "INWARD"
+
+    response = client.post(
+        "/api/v1/items/filter/export", params={"format": "csv"}, json={"sku_id": 7}
+    )
+    lines = response.text.splitlines()
+
+    assert lines[0].startswith("id,rfid,sku_id")
+    assert len(lines) == 3
+
+
+def test_lookup_items_returns_found_in_request_order(client):
+    client.post(
+        "/api/v1/items/bulk_upload",
+        json={
+            "rfids": ["LOOKUP-1", "LOOKUP-2"],
+            "sku_id": 1,
+            "rack_id": "RACK-A1",
+            "storage_bin_rfid": "BIN-1",
+        },
+    )
+
+    response = client.post(
+        "/api/v1/items/lookup",
+        json={"rfids": ["LOOKUP-2", "STRAY", "LOOKUP-1", "LOOKUP-2"]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["rfid"] for item in body["found"]] == ["LOOKUP-2", "LOOKUP-1"]
+    assert body["missing_rfids"] == ["STRAY"]
+
+    response = client.post("/api/v1/items/lookup", json={"rfids": []})
+    assert response.status_code == 400
+
+
+def test_create_item_is_one_insert_and_rejects_duplicates(client, db):
+    payload = {
+        "rfid": "ONE-TRIP",
+        "sku_id": 1,
+        "rack_id": "RACK-A1",
+        "storage_bin_rfid": "BIN-1",
+    }
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.post("/api/v1/items/", json=payload)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.json()["created_at"] is not None
+    # No existence check before, no refresh after: one INSERT ... RETURNING
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO items")
+    assert "RETURNING" in statements[0]
+
+    response = client.post("/api/v1/items/", json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "RFID already exists"
+
+
+def test_unknown_rfid_is_tombstoned_until_created(client, fake_redis):
+    response = client.get("/api/v1/items/rfid/GHOST-1")
+    assert response.status_code == 404
+    assert fake_redis.exists("missing:item:GHOST-1")
+
+    response = client.get("/api/v1/items/rfid/GHOST-1")
+    assert response.status_code == 404
+    assert response.headers[QUERY_COUNT_HEADER] == "0"
+
+    client.post(
+        "/api/v1/items/",
+        json={
+            "rfid": "GHOST-1",
+            "sku_id": 1,
+            "rack_id": "RACK-A1",
+            "storage_bin_rfid": "BIN-1",
+        },
+    )
+    assert not fake_redis.exists("missing:item:GHOST-1")
+
+    response = client.get("/api/v1/items/rfid/GHOST-1")
+    assert response.status_code == 200
+    assert response.json()["rfid"] == "GHOST-1"
+
+
+def test_lookup_items_back_fills_the_cache(client, fake_redis):
+    client.post(
+        "/api/v1/items/bulk_upload",
+        json={
+            "rfids": ["MGET-1", "MGET-2"],
+            "sku_id": 1,
+            "rack_id": "RACK-A1",
+            "storage_bin_rfid": "BIN-1",
+        },
+    )
+    client.get("/api/v1/items/rfid/MGET-1")
+    assert not fake_redis.exists("cache:item:rfid=MGET-2")
+
+    # MGET-1 comes from Redis; only MGET-2 is queried, then written back
+    response = client.post("/api/v1/items/lookup", json={"rfids": ["MGET-1", "MGET-2"]})
+    assert [item["rfid"] for item in response.json()["found"]] == ["MGET-1", "MGET-2"]
+    assert fake_redis.exists("cache:item:rfid=MGET-2")
+
+    response = client.post("/api/v1/items/lookup", json={"rfids": ["MGET-1", "MGET-2"]})
+    assert response.headers[QUERY_COUNT_HEADER] == "0"
+    assert len(response.json()["found"]) == 2
+
+
+def test_async_item_crud(async_session, fake_redis):
+    row = {"sku_id": 1, "rack_id": "RACK-A1", "storage_bin_rfid": "BIN-1"}
+
+    async def scenario():
+        async with async_session() as db:
+            item = await crud_items.create_item_async(db, {"rfid": "ASYNC-1", **row})
+            created, skipped = await crud_items.bulk_create_items_async(
+                db, [{"rfid": rfid, **row} for rfid in ("ASYNC-1", "ASYNC-2")]
+            )
+            assert (created, skipped) == (["ASYNC-2"], ["ASYNC-1"])
+
+            await crud_items.update_item_track_async(
+                db, item, ItemTrackStatus.OUTWARD, rack_id="RACK-B1"
+            )
+            outward = await crud_items.get_items_async(
+                db, track=ItemTrackStatus.OUTWARD, rack_id="RACK-B1"
+            )
+            assert [i.rfid for i in outward] == ["ASYNC-1"]
+
+            await crud_items.delete_item_async(db, item)
+            assert await crud_items.get_item_by_rfid_async(db, "ASYNC-1") is None
+            found = await crud_items.get_items_by_rfids_async(
+                db, ["ASYNC-1", "ASYNC-2"]
+            )
+            assert [i.rfid for i in found] == ["ASYNC-2"]
+
+            await db.execute(delete(Item).where(Item.rfid == "ASYNC-2"))
+            await db.commit()
+
+    asyncio.run(scenario())
+
+    # Writes bump the same tags as the sync CRUD
+    assert int(fake_redis.get("tag:item:ASYNC-1")) == 3
+    assert fake_redis.get("tag:rack:RACK-B1") is not None
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import select
+
+from Database.instrumentation import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    NPlusOneError,
+    statement_shape,
+    track_queries,
+)
+from Models.items import Item
+
+
+def test_responses_report_query_count_and_db_time(client):
+    response = client.get("/api/v1/transactions/get_all")
+
+    assert response.status_code == 200
+    assert int(response.headers[QUERY_COUNT_HEADER]) >= 1
+    assert float(response.headers[QUERY_TIME_HEADER]) >= 0
+
+
+def test_statement_shape_ignores_batch_size():
+    assert statement_shape("SELECT * FROM items\n WHERE rfid IN (?, ?, ?)") == (
+        statement_shape("SELECT * FROM items WHERE rfid IN (?)")
+    )
+    assert statement_shape("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == (
+        statement_shape("INSERT INTO t (a, b) VALUES (?, ?)")
+    )
+
+
+def test_repeated_statements_are_flagged(db):
+    with track_queries(threshold=3, strict=False) as queries:
+        for rfid in ("A", "B", "C"):
+            db.scalars(select(Item).where(Item.rfid == rfid)).first()
+
+    assert queries.count == 3
+    assert list(queries.repeated().values()) == [3]
+
+
+def test_strict_mode_raises_on_repeated_statements(db):
+    with pytest.raises(NPlusOneError):
+        with track_queries(threshold=3, strict=True):
+            for rfid in ("A", "B", "C"):
+                db.scalars(select(Item).where(Item.rfid == rfid)).first()
@@ -1,4 +1,11 @@
+import json
+from typing import List
+
 from Models.rack import Rack
+from Models.storage_bin import StorageBin
+from Models.transaction import Transaction, TransactionType
+from Schemas.rack import RackResponse
+from Utils.serialization import serialize_response
 
 
 def test_create_rack(client, db):
@@ -13,3 +20,57 @@ def test_create_rack(client, db):
     assert rack is not None
     assert rack.location == "Warehouse-1"
     print(response.json())
+
+
+def test_get_all_racks_matches_validated_response(client, db):
+    client.post("/api/v1/racks/add/", json={"rack_id": "RACK-B1", "location": "W-2"})
+    client.post("/api/v1/racks/add/", json={"location": "W-3"})
+    # Storage bin routes use the async engine; add the bin on the test session
+    db.add(StorageBin(rfid="BIN-B1", rack_id="RACK-B1", capacity=2))
+    db.flush()
+    client.post(
+        "/api/v1/items/bulk_upload",
+        json={
+            "rfids": ["RACK-ITEM-1", "RACK-ITEM-2"],
+            "sku_id": 1,
+            "rack_id": "RACK-B1",
+            "storage_bin_rfid": "BIN-B1",
+        },
+    )
+
+    response = client.get("/api/v1/racks/get_all")
+
+    assert response.status_code == 200
+    # Core rows serialize exactly as the ORM racks validated through the model
+    expected = serialize_response(db.query(Rack).all(), List[RackResponse])
+    assert response.json() == json.loads(expected)
+    rack = next(rack for rack in response.json() if rack["rack_id"] == "RACK-B1")
+    assert [b["rfid"] for b in rack["storage_bins"]] == ["BIN-B1"]
+    assert [i["rfid"] for i in rack["items"]] == ["RACK-ITEM-1", "RACK-ITEM-2"]
+
+
+def test_bulk_transaction_update_refreshes_cached_rack(client, db, fake_redis):
+    client.post("/api/v1/racks/add/", json={"rack_id": "RACK-C1", "location": "W-4"})
+    db.add(StorageBin(rfid="BIN-C1", rack_id="RACK-C1", capacity=2))
+    db.add(Transaction(type=TransactionType.INWARD, storage_bin_rfid="BIN-C1"))
+    db.flush()
+    client.post(
+        "/api/v1/items/bulk_upload",
+        json={
+            "rfids": ["RACK-FLIP-1"],
+            "sku_id": 1,
+            "rack_id": "RACK-C1",
+            "storage_bin_rfid": "BIN-C1",
+        },
+    )
+    response = client.get("/api/v1/racks/RACK-C1")
+    assert response.json()["items"][0]["track"] == "INWARD"
+
+    client.put(
+        "/api/v1/transactions/update-by-rfid-bulk",
+        json={"rfids": ["BIN-C1"], "type": "outward"},
+    )
+
+    # The set-based flip bumps "rack:*", which every rack entry carries
+    response = client.get("/api/v1/racks/RACK-C1")
+    assert response.json()["items"][0]["track"] == "OUTWARD"
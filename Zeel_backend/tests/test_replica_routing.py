@@ -0,0 +1,122 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from Database import replica
+from Database.database import Base, get_db
+from Database.replica import LAST_WRITE_COOKIE, READ_PRIMARY_HEADER, ReplicaRouter
+from Models.request import Request
+from main import app
+
+
+# Primary and replica are two SQLite files holding different rows, so each
+# response shows which database served it.
+@pytest.fixture
+def databases(tmp_path):
+    urls = {
+        name: f"sqlite:///{tmp_path / f'{name}.db'}" for name in ("primary", "replica")
+    }
+    for name, url in urls.items():
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as session:
+            session.add(
+                Request(req_from=name, req_to="dock", request_date=datetime(2024, 1, 1))
+            )
+            session.commit()
+        engine.dispose()
+    return urls
+
+
+@pytest.fixture
+def routed_client(databases, monkeypatch):
+    primary = sessionmaker(bind=create_engine(databases["primary"]))
+    router = ReplicaRouter(
+        databases["replica"], max_lag=5, check_interval=0, primary=primary
+    )
+    monkeypatch.setattr(replica, "replica_router", router)
+
+    def override_get_db():
+        with primary() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app), router
+    app.dependency_overrides.clear()
+    router.engine.dispose()
+
+
+def _read_from(client, headers=None) -> list:
+    response = client.get("/api/v1/requests/get_all", headers=headers)
+    assert response.status_code == 200
+    return [request["req_from"] for request in response.json()]
+
+
+def test_get_routes_read_from_replica(routed_client):
+    client, _ = routed_client
+
+    assert _read_from(client) == ["replica"]
+
+
+def test_lagging_replica_falls_back_to_primary(routed_client, monkeypatch):
+    client, router = routed_client
+    monkeypatch.setattr(router, "_measure_lag", lambda: 30.0)
+
+    assert _read_from(client) == ["primary"]
+    assert router.status()["status"] == "fallback"
+
+
+def test_unreachable_replica_falls_back_to_primary(routed_client, tmp_path):
+    client, router = routed_client
+    router.engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+
+    assert _read_from(client) == ["primary"]
+
+
+def test_replica_failing_between_lag_checks_falls_back(
+    routed_client, tmp_path, monkeypatch
+):
+    client, router = routed_client
+    monkeypatch.setattr(router, "check_interval", 60)
+    # The lag check passes, but sessions cannot connect
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    monkeypatch.setattr(router, "SessionLocal", sessionmaker(bind=broken))
+
+    assert _read_from(client) == ["primary"]
+    # Marked unhealthy until the next lag check
+    assert router.status()["status"] == "fallback"
+
+
+def test_read_primary_header_skips_the_replica(routed_client):
+    client, _ = routed_client
+
+    assert _read_from(client, headers={READ_PRIMARY_HEADER: "1"}) == ["primary"]
+    assert _read_from(client, headers={READ_PRIMARY_HEADER: "0"}) == ["replica"]
+
+
+def test_client_reads_its_own_writes_from_primary(routed_client):
+    client, _ = routed_client
+
+    response = client.post(
+        "/api/v1/requests/add",
+        json={"req_from": "writer", "req_to": "dock", "request_date": "2024-01-02"},
+    )
+    assert response.status_code == 201
+    assert LAST_WRITE_COOKIE in response.cookies
+
+    assert _read_from(client) == ["primary", "writer"]
+    # Other clients keep reading from the replica
+    assert _read_from(TestClient(app)) == ["replica"]
+
+
+def test_read_only_post_does_not_pin_the_client(routed_client):
+    client, _ = routed_client
+
+    response = client.post("/api/v1/items/lookup", json={"rfids": ["SCANNED-1"]})
+    assert response.status_code == 200
+    assert LAST_WRITE_COOKIE not in response.cookies
+
+    assert _read_from(client) == ["replica"]
@@ -0,0 +1,83 @@
+import pytest
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from Database.instrumentation import QUERY_COUNT_HEADER
+from Services import tagged_cache
+
+
+@pytest.fixture
+def redis_down(monkeypatch):
+    # Nothing listens on port 1: every Redis call fails immediately
+    unreachable = redis.Redis(port=1, retry=Retry(NoBackoff(), 0))
+    monkeypatch.setattr(tagged_cache, "redis_client", unreachable)
+    tagged_cache.cache_breaker.record_success()
+    yield
+    # Nothing left to replay once the circuit closes
+    tagged_cache._pending_tags.clear()
+    tagged_cache.cache_breaker.record_success()
+
+
+def test_skus_served_from_db_when_redis_is_down(client, redis_down):
+    response = client.post(
+        "/api/v1/skus/add",
+        json={
+            "sku_code": "SKU-DOWN-1",
+            "product_name": "Shirt",
+            "mrp": 999,
+            "sale_price": 799,
+            "gst_percent": 5,
+        },
+    )
+    assert response.status_code == 201
+    sku_id = response.json()["id"]
+
+    response = client.get(f"/api/v1/skus/get/{sku_id}")
+    assert response.status_code == 200
+    assert response.json()["product_name"] == "Shirt"
+
+    response = client.get("/api/v1/skus/get_all")
+    assert response.status_code == 200
+    assert "SKU-DOWN-1" in [sku["sku_code"] for sku in response.json()]
+
+    assert client.get("/api/v1/skus/get/999999").status_code == 404
+
+    # The write could not bump its tags, so they wait for Redis to recover
+    assert {"sku:*", f"sku:{sku_id}"} <= tagged_cache._pending_tags
+
+
+def test_sku_update_invalidates_cached_reads(client, fake_redis):
+    response = client.post(
+        "/api/v1/skus/add",
+        json={
+            "sku_code": "SKU-UP-1",
+            "product_name": "Shirt",
+            "mrp": 999,
+            "sale_price": 799,
+            "gst_percent": 5,
+        },
+    )
+    sku_id = response.json()["id"]
+
+    client.get(f"/api/v1/skus/get/{sku_id}")
+    response = client.get(f"/api/v1/skus/get/{sku_id}")
+    assert response.headers[QUERY_COUNT_HEADER] == "0"
+
+    client.put(
+        f"/api/v1/skus/update/{sku_id}",
+        json={
+            "product_name": "Kurta",
+            "category": None,
+            "mrp": 999,
+            "sale_price": 699,
+            "gst_percent": 5,
+            "is_active": True,
+        },
+    )
+    # The bumped tag version orphans the cached entry
+    assert fake_redis.get(f"tag:sku:{sku_id}") is not None
+
+    response = client.get(f"/api/v1/skus/get/{sku_id}")
+    assert int(response.headers[QUERY_COUNT_HEADER]) >= 1
+    assert response.json()["product_name"] == "Kurta"
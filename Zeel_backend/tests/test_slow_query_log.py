@@ -0,0 +1,38 @@
+import json
+import logging
+
+from core.settings import settings
+from Crud import crud_items
+from Database import slow_query
+
+
+def _slow_query_entries(caplog) -> list:
+    # Entries with a plan are logged from the EXPLAIN thread
+    slow_query._executor.submit(lambda: None).result()
+    return [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "slow_query"
+    ]
+
+
+def test_slow_queries_are_logged_with_caller_and_plan(db, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 1e-6)
+    caplog.set_level(logging.WARNING, logger="slow_query")
+
+    crud_items.get_items_by_rfids(db, ["SECRET-RFID"])
+
+    entries = _slow_query_entries(caplog)
+    entry = next(e for e in entries if e["caller"])
+    assert entry["caller"].startswith("crud_items.get_items_by_rfids:")
+    assert entry["parameters"] == ["str"]
+    assert "SECRET-RFID" not in json.dumps(entry)
+    assert entry["plan"]
+
+
+def test_fast_queries_are_not_logged(db, caplog):
+    caplog.set_level(logging.WARNING, logger="slow_query")
+
+    crud_items.get_items_by_rfids(db, ["RFID-1"])
+
+    assert _slow_query_entries(caplog) == []
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+import redis
+import redis.asyncio
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from Database.instrumentation import QUERY_COUNT_HEADER
+from Services import storage_bin_cache
+
+
+@pytest.fixture
+def redis_down(monkeypatch):
+    # Nothing listens on port 1: every Redis call fails immediately
+    unreachable = redis.Redis(port=1, retry=Retry(NoBackoff(), 0))
+    unreachable_async = redis.asyncio.Redis(port=1, retry=AsyncRetry(NoBackoff(), 0))
+    monkeypatch.setattr(storage_bin_cache, "redis_client", unreachable)
+    monkeypatch.setattr(storage_bin_cache, "async_redis_client", unreachable_async)
+    storage_bin_cache.cache_breaker.record_success()
+    yield
+    # Nothing left to replay once the circuit closes
+    storage_bin_cache._pending_keys.clear()
+    monkeypatch.setattr(storage_bin_cache, "_pending_generation_bump", False)
+    storage_bin_cache.cache_breaker.record_success()
+
+
+def test_storage_bins_served_from_db_when_redis_is_down(client, redis_down):
+    response = client.post(
+        "/api/v1/storage_bins/add",
+        json={"rfid": "BIN-DOWN-1", "rack_id": "RACK-A1", "capacity": 4},
+    )
+    assert response.status_code == 200
+
+    for _ in range(storage_bin_cache.settings.CACHE_BREAKER_FAILURE_THRESHOLD + 1):
+        response = client.get("/api/v1/storage_bins/BIN-DOWN-1")
+        assert response.status_code == 200
+        assert response.json()["capacity"] == 4
+
+    assert storage_bin_cache.cache_breaker.state == "open"
+
+    response = client.delete("/api/v1/storage_bins/remove/BIN-DOWN-1")
+    assert response.status_code == 200
+    assert "storage_bin:BIN-DOWN-1" in storage_bin_cache._pending_keys
+
+
+def test_lookup_storage_bins_when_redis_is_down(client, redis_down):
+    for rfid in ("BIN-LOOKUP-1", "BIN-LOOKUP-2"):
+        client.post(
+            "/api/v1/storage_bins/add",
+            json={"rfid": rfid, "rack_id": "RACK-A1", "capacity": 2},
+        )
+
+    response = client.post(
+        "/api/v1/storage_bins/lookup",
+        json={"rfids": ["BIN-LOOKUP-2", "BIN-STRAY", "BIN-LOOKUP-1"]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [b["rfid"] for b in body["found"]] == ["BIN-LOOKUP-2", "BIN-LOOKUP-1"]
+    assert body["missing_rfids"] == ["BIN-STRAY"]
+
+
+def test_storage_bin_served_from_redis_after_first_read(client, fake_redis):
+    client.post(
+        "/api/v1/storage_bins/add",
+        json={"rfid": "BIN-UP-1", "rack_id": "RACK-A1", "capacity": 3},
+    )
+
+    first = client.get("/api/v1/storage_bins/BIN-UP-1")
+    storage_bin_cache.local_cache.clear()
+    second = client.get("/api/v1/storage_bins/BIN-UP-1")
+
+    assert first.headers[QUERY_COUNT_HEADER] == "1"
+    assert second.headers[QUERY_COUNT_HEADER] == "0"
+    assert second.content == first.content
+
+    # Stored as a JSON meta line over the response body, sent as is
+    meta, body = fake_redis.get("storage_bin:BIN-UP-1").split("\n", 1)
+    assert set(json.loads(meta)) == {"expires_at", "delta", "headers"}
+    assert body.encode() == first.content
+
+    client.delete("/api/v1/storage_bins/remove/BIN-UP-1")
+    assert fake_redis.get("storage_bin:BIN-UP-1") is None
+
+
+def test_lookup_storage_bins_back_fills_the_cache(client, fake_redis):
+    for rfid in ("BIN-MGET-1", "BIN-MGET-2"):
+        client.post(
+            "/api/v1/storage_bins/add",
+            json={"rfid": rfid, "rack_id": "RACK-A1", "capacity": 2},
+        )
+    payload = {"rfids": ["BIN-MGET-1", "BIN-MGET-2"]}
+
+    first = client.post(
+        "/api/v1/storage_bins/lookup", json={"rfids": ["BIN-MGET-1", "BIN-STRAY"]}
+    )
+    assert first.json()["missing_rfids"] == ["BIN-STRAY"]
+    assert fake_redis.exists("storage_bin:BIN-MGET-1")
+    assert not fake_redis.exists("storage_bin:BIN-MGET-2")
+
+    # BIN-MGET-1 comes from Redis; only BIN-MGET-2 is queried, then written back
+    storage_bin_cache.local_cache.clear()
+    second = client.post("/api/v1/storage_bins/lookup", json=payload)
+    assert [b["rfid"] for b in second.json()["found"]] == ["BIN-MGET-1", "BIN-MGET-2"]
+    assert fake_redis.exists("storage_bin:BIN-MGET-2")
+
+    storage_bin_cache.local_cache.clear()
+    third = client.post("/api/v1/storage_bins/lookup", json=payload)
+    assert third.headers[QUERY_COUNT_HEADER] == "0"
+    assert third.content == second.content
+
+    for rfid in ("BIN-MGET-1", "BIN-MGET-2"):
+        client.delete(f"/api/v1/storage_bins/remove/{rfid}")
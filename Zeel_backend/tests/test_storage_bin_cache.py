@@ -0,0 +1,147 @@
+import asyncio
+import json
+import time
+
+from Schemas.storage_bin import StorageBinResponse
+from Services import storage_bin_cache
+from Services.storage_bin_cache import (
+    INVALIDATION_CHANNEL,
+    WORKER_ID,
+    get_or_load_storage_bin_cache_async,
+    local_cache,
+)
+
+
+def _bin(rfid: str, capacity: int = 1) -> dict:
+    return {
+        "rfid": rfid,
+        "rack_id": "RACK-A1",
+        "capacity": capacity,
+        "id": 1,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": None,
+    }
+
+
+def _load(rfid: str, capacity: int = 1, delay: float = 0.0):
+    calls = []
+
+    async def loader():
+        calls.append(rfid)
+        await asyncio.sleep(delay)
+        return _bin(rfid, capacity)
+
+    return loader, calls
+
+
+def _get(rfid: str, loader):
+    return asyncio.run(
+        get_or_load_storage_bin_cache_async(rfid, loader, StorageBinResponse)
+    )
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_local_cache_serves_repeat_reads(fake_redis):
+    loader, calls = _load("BIN-LOCAL")
+    _get("BIN-LOCAL", loader)
+
+    # Gone from Redis, still in this worker's LRU
+    fake_redis.delete("storage_bin:BIN-LOCAL")
+    response = _get("BIN-LOCAL", loader)
+
+    assert calls == ["BIN-LOCAL"]
+    assert b'"rfid":"BIN-LOCAL"' in response.body
+
+
+def test_peer_invalidation_drops_local_copy(fake_redis):
+    storage_bin_cache.start_storage_bin_cache_listener()
+    assert _wait_for(lambda: fake_redis.pubsub_numsub(INVALIDATION_CHANNEL)[0][1])
+
+    for rfid in ("BIN-PEER", "BIN-OWN"):
+        _get(rfid, _load(rfid)[0])
+
+    # This worker's own messages are ignored; a peer's drop the local copy
+    fake_redis.publish(INVALIDATION_CHANNEL, f"{WORKER_ID}:storage_bin:BIN-OWN")
+    fake_redis.publish(INVALIDATION_CHANNEL, "peer-worker:storage_bin:BIN-PEER")
+
+    assert _wait_for(lambda: local_cache.get("storage_bin:BIN-PEER") is None)
+    assert local_cache.get("storage_bin:BIN-OWN") is not None
+
+
+def test_concurrent_misses_load_once(fake_redis):
+    loader, calls = _load("BIN-FLIGHT", delay=0.2)
+
+    async def burst():
+        return await asyncio.gather(
+            *(
+                get_or_load_storage_bin_cache_async(
+                    "BIN-FLIGHT", loader, StorageBinResponse
+                )
+                for _ in range(8)
+            )
+        )
+
+    responses = asyncio.run(burst())
+
+    assert calls == ["BIN-FLIGHT"]
+    assert len({response.body for response in responses}) == 1
+
+
+def test_waiting_for_a_recompute_does_not_block_its_stripe(fake_redis):
+    stripes = len(storage_bin_cache._key_locks)
+    stripe = hash("storage_bin:BIN-SLOW") % stripes
+    neighbour = next(
+        f"BIN-N{i}"
+        for i in range(10000)
+        if hash(f"storage_bin:BIN-N{i}") % stripes == stripe
+    )
+    # Another worker is recomputing BIN-SLOW
+    fake_redis.set("lock:storage_bin:BIN-SLOW", "other-worker")
+
+    async def scenario():
+        waiting = asyncio.create_task(
+            get_or_load_storage_bin_cache_async(
+                "BIN-SLOW", _load("BIN-SLOW")[0], StorageBinResponse
+            )
+        )
+        await asyncio.sleep(0.1)
+
+        started = time.monotonic()
+        loader, calls = _load(neighbour)
+        await get_or_load_storage_bin_cache_async(neighbour, loader, StorageBinResponse)
+        assert time.monotonic() - started < 1
+        assert calls == [neighbour]
+
+        assert not waiting.done()
+        fake_redis.delete("lock:storage_bin:BIN-SLOW")
+        response = await asyncio.wait_for(waiting, timeout=5)
+        assert b'"rfid":"BIN-SLOW"' in response.body
+
+    asyncio.run(scenario())
+
+
+def test_entry_near_expiry_is_refreshed_early(fake_redis):
+    loader, calls = _load("BIN-EARLY", capacity=1)
+    _get("BIN-EARLY", loader)
+
+    # A fresh entry is served as is
+    _get("BIN-EARLY", loader)
+    assert len(calls) == 1
+
+    # Past its refresh point: recomputed before it expires from Redis
+    local_cache.clear()
+    meta, _, body = fake_redis.get("storage_bin:BIN-EARLY").partition("\n")
+    meta = {**json.loads(meta), "expires_at": time.time()}
+    fake_redis.set("storage_bin:BIN-EARLY", json.dumps(meta) + "\n" + body)
+
+    response = _get("BIN-EARLY", _load("BIN-EARLY", capacity=5)[0])
+    assert b'"capacity":5' in response.body
+    assert fake_redis.get("lock:storage_bin:BIN-EARLY") is None
@@ -0,0 +1,112 @@
+import asyncio
+
+from sqlalchemy import delete, event
+
+from core.pagination import NEXT_CURSOR_HEADER
+from Crud import crud_transaction
+from Models.items import Item, ItemTrackStatus
+from Models.transaction import Transaction, TransactionType
+from Schemas.transaction import TransactionCreate
+
+
+def test_get_all_transactions_batches_item_lookup(client, db):
+    for n in range(3):
+        db.add(Transaction(type=TransactionType.INWARD, storage_bin_rfid=f"BIN-{n}"))
+        db.add(Item(rfid=f"TX-ITEM-{n}", sku_id=1, storage_bin_rfid=f"BIN-{n}"))
+    db.add(Item(rfid="TX-ITEM-extra", sku_id=1, storage_bin_rfid="BIN-0"))
+    db.commit()
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.get("/api/v1/transactions/get_all")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    item_rfids = {tx["storage_bin_rfid"]: tx["item_rfids"] for tx in response.json()}
+    assert item_rfids == {
+        "BIN-0": ["TX-ITEM-0", "TX-ITEM-extra"],
+        "BIN-1": ["TX-ITEM-1"],
+        "BIN-2": ["TX-ITEM-2"],
+    }
+    assert len(statements) == 2
+
+
+def test_get_all_transactions_cursor_pagination(client, db):
+    for n in range(3):
+        db.add(Transaction(type=TransactionType.INWARD, storage_bin_rfid=f"PAGE-{n}"))
+    db.flush()
+
+    response = client.get("/api/v1/transactions/get_all", params={"limit": 2})
+    seen = [tx["storage_bin_rfid"] for tx in response.json()]
+    assert response.json()[0]["type"] == "inward"
+
+    response = client.get(
+        "/api/v1/transactions/get_all",
+        params={"limit": 2, "cursor": response.headers[NEXT_CURSOR_HEADER]},
+    )
+    seen += [tx["storage_bin_rfid"] for tx in response.json()]
+
+    assert seen == ["PAGE-0", "PAGE-1", "PAGE-2"]
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_bulk_update_by_rfid_moves_transactions_and_items(client, db):
+    for n in range(2):
+        db.add(Transaction(type=TransactionType.INWARD, storage_bin_rfid=f"BULK-{n}"))
+        db.add(Item(rfid=f"BULK-ITEM-{n}", sku_id=1, storage_bin_rfid=f"BULK-{n}"))
+    db.add(Item(rfid="BULK-ITEM-loose", sku_id=1, storage_bin_rfid="BULK-loose"))
+    db.commit()
+
+    response = client.put(
+        "/api/v1/transactions/update-by-rfid-bulk",
+        json={"rfids": ["BULK-0", "BULK-1", "BULK-loose"], "type": "outward"},
+    )
+
+    body = response.json()
+    assert body["transactions_updated"] == 2
+    assert body["items_updated"] == 2
+
+    db.expire_all()
+    tracks = {item.rfid: item.track for item in db.query(Item)}
+    assert tracks["BULK-ITEM-0"] == ItemTrackStatus.OUTWARD
+    assert tracks["BULK-ITEM-loose"] == ItemTrackStatus.INWARD
+
+
+def test_async_transaction_crud(async_session, fake_redis):
+    async def scenario():
+        async with async_session() as db:
+            db.add(Item(rfid="ATX-ITEM", sku_id=1, storage_bin_rfid="ATX-BIN"))
+            tx = await crud_transaction.create_transaction_async(
+                db, TransactionCreate(type="inward", storage_bin_rfid="ATX-BIN")
+            )
+            page = await crud_transaction.get_all_transactions_async(
+                db, after_id=tx.id - 1
+            )
+            assert [t.id for t in page] == [tx.id]
+            assert await crud_transaction.get_item_rfids_by_storage_bins_async(
+                db, ["ATX-BIN"]
+            ) == {"ATX-BIN": ["ATX-ITEM"]}
+
+            updated = await crud_transaction.bulk_update_transactions_and_items_async(
+                db, ["ATX-BIN"], TransactionType.OUTWARD, "sold"
+            )
+            assert updated == (1, 1)
+            db.expire_all()  # set-based UPDATE: loaded objects are stale
+            [moved] = await crud_transaction.get_transactions_by_rfid_async(
+                db, "ATX-BIN"
+            )
+            assert (moved.type, moved.reason) == (TransactionType.OUTWARD, "sold")
+
+            await db.execute(delete(Item).where(Item.rfid == "ATX-ITEM"))
+            await db.execute(delete(Transaction).where(Transaction.id == tx.id))
+            await db.commit()
+
+    asyncio.run(scenario())
+    assert fake_redis.get("tag:item:*") is not None